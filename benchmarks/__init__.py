@@ -0,0 +1,6 @@
+"""Micro-benchmarks for the public conversion functions.
+
+Run with ``python -m benchmarks`` from the repository root; see
+``python -m benchmarks --help`` for options. ``python -m benchmarks.startup``
+times the package import and a one-value CLI run in fresh processes.
+"""
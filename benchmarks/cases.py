@@ -0,0 +1,104 @@
+"""Benchmark cases: public functions paired with realistic input distributions."""
+
+import unicodedata
+from random import Random
+from typing import Any, Callable, List, NamedTuple
+
+from vn_numberwords import (
+    currency_words_to_number,
+    format_number_with_dots,
+    number_to_currency,
+    number_to_words,
+    parse_vietnamese_number,
+    words_to_number,
+)
+
+
+class Case(NamedTuple):
+    """A function to benchmark and the inputs it is called with, one at a time."""
+
+    name: str
+    function: Callable[[Any], Any]
+    inputs: List[Any]
+
+
+def small_ints(rng: Random, size: int) -> List[int]:
+    """Integers below 1000, as in quantities and counters."""
+    return [rng.randrange(1000) for _ in range(size)]
+
+
+def invoice_amounts(rng: Random, size: int) -> List[int]:
+    """VND amounts: mostly round prices in thousands, skewed towards a few."""
+    prices = [rng.randrange(1, 2000) * 1000 for _ in range(50)]
+    amounts = []
+    for _ in range(size):
+        if rng.random() < 0.8:
+            amounts.append(rng.choice(prices))
+        else:
+            amounts.append(rng.randrange(1, 100) * rng.randrange(500, 10000000, 500))
+    return amounts
+
+
+def huge_ints(rng: Random, size: int) -> List[int]:
+    """Integers with 20 to 60 digits, needing stacked magnitudes."""
+    return [rng.randrange(10**19, 10**60) for _ in range(size)]
+
+
+def decimals(rng: Random, size: int) -> List[float]:
+    """Floats with up to two decimal places, as in USD prices and rates."""
+    return [round(rng.uniform(0, 1000000), rng.randrange(1, 3)) for _ in range(size)]
+
+
+def strip_accents(text: str) -> str:
+    """Return ``text`` without Vietnamese diacritics, as typed on some keyboards."""
+    text = text.replace("đ", "d").replace("Đ", "D")
+    decomposed = unicodedata.normalize("NFD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def build_cases(size: int = 1000, seed: int = 0) -> List[Case]:
+    """Build every benchmark case with ``size`` deterministic inputs each.
+
+    Args:
+        size: Number of inputs per case.
+        seed: Seed of the input generator, so runs are comparable.
+
+    Returns:
+        List of cases, named ``"<function>/<distribution>"``.
+    """
+    rng = Random(seed)
+    small = small_ints(rng, size)
+    invoices = invoice_amounts(rng, size)
+    huge = huge_ints(rng, size)
+    fractions = decimals(rng, size)
+
+    accented = [number_to_words(amount) for amount in invoices]
+    non_accented = [strip_accents(words) for words in accented]
+    currency_words = [number_to_currency(amount, "đồng") for amount in invoices]
+    formatted = [format_number_with_dots(amount) for amount in invoices]
+
+    def to_currency(amount: Any) -> str:
+        return number_to_currency(amount, "đồng")
+
+    def from_currency(text: str) -> Any:
+        return currency_words_to_number(text, "đồng")
+
+    return [
+        Case("number_to_words/small_ints", number_to_words, small),
+        Case("number_to_words/invoice_amounts", number_to_words, invoices),
+        Case("number_to_words/huge_ints", number_to_words, huge),
+        Case("number_to_words/decimals", number_to_words, fractions),
+        Case("number_to_currency/invoice_amounts", to_currency, invoices),
+        Case("words_to_number/accented", words_to_number, accented),
+        Case("words_to_number/non_accented", words_to_number, non_accented),
+        Case("currency_words_to_number/accented", from_currency, currency_words),
+        Case(
+            "parse_vietnamese_number/invoice_amounts",
+            parse_vietnamese_number,
+            formatted,
+        ),
+        Case(
+            "format_number_with_dots/invoice_amounts", format_number_with_dots, invoices
+        ),
+        Case("format_number_with_dots/decimals", format_number_with_dots, fractions),
+    ]
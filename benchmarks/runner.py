@@ -0,0 +1,146 @@
+"""Benchmark runner reporting throughput and per-call latency percentiles."""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from .cases import Case, build_cases
+
+PERCENTILES = (50, 90, 99)
+
+
+class Result(NamedTuple):
+    """Measurements of one benchmark case; latencies are in microseconds."""
+
+    name: str
+    calls: int
+    ops_per_sec: float
+    p50: float
+    p90: float
+    p99: float
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Return the nearest-rank ``q``-th percentile of an ascending sequence."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * q / 100))
+    return sorted_values[index]
+
+
+def measure(
+    function: Callable[[Any], Any], inputs: Sequence[Any], min_time: float = 0.2
+) -> Dict[str, Any]:
+    """Benchmark ``function`` over ``inputs``.
+
+    Throughput comes from untimed passes over the inputs, so it excludes the
+    timer overhead; latency percentiles come from timing every call of
+    separate passes. Each phase runs at least one pass and repeats until
+    ``min_time`` seconds have elapsed.
+
+    Args:
+        function: Callable taking one input.
+        inputs: Inputs, called in order.
+        min_time: Minimum wall time in seconds spent in each phase.
+
+    Returns:
+        Dict with ``calls``, ``ops_per_sec`` and the latency percentiles
+        ``p50``, ``p90`` and ``p99`` in microseconds.
+    """
+    perf_counter = time.perf_counter
+    perf_counter_ns = time.perf_counter_ns
+
+    for value in inputs:  # warm up caches and lazily built tables
+        function(value)
+
+    calls = 0
+    elapsed = 0.0
+    while not calls or elapsed < min_time:
+        start = perf_counter()
+        for value in inputs:
+            function(value)
+        elapsed += perf_counter() - start
+        calls += len(inputs)
+
+    latencies: List[int] = []
+    deadline = perf_counter() + min_time
+    while not latencies or perf_counter() < deadline:
+        for value in inputs:
+            start_ns = perf_counter_ns()
+            function(value)
+            latencies.append(perf_counter_ns() - start_ns)
+    latencies.sort()
+
+    stats: Dict[str, Any] = {
+        "calls": calls,
+        "ops_per_sec": calls / elapsed if elapsed else 0.0,
+    }
+    for q in PERCENTILES:
+        stats[f"p{q}"] = percentile(latencies, q) / 1000
+    return stats
+
+
+def run(cases: Sequence[Case], min_time: float = 0.2) -> List[Result]:
+    """Run every case and return its results in order."""
+    return [
+        Result(case.name, **measure(case.function, case.inputs, min_time))
+        for case in cases
+    ]
+
+
+def format_results(results: Sequence[Result]) -> str:
+    """Render results as an aligned text table."""
+    width = max([len("case")] + [len(result.name) for result in results])
+    header = f"{'case':<{width}}  {'ops/sec':>12}  " + "  ".join(
+        f"{f'p{q} (us)':>9}" for q in PERCENTILES
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.name:<{width}}  {result.ops_per_sec:>12,.0f}  "
+            + "  ".join(f"{getattr(result, f'p{q}'):>9.2f}" for q in PERCENTILES)
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point of ``python -m benchmarks``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the vn_numberwords conversion functions",
+    )
+    parser.add_argument(
+        "--filter", "-k", default="", help="Only run cases whose name contains TEXT"
+    )
+    parser.add_argument(
+        "--size", type=int, default=1000, help="Number of inputs per case"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum seconds spent measuring throughput and latency per case",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Input generator seed")
+    parser.add_argument(
+        "--json", metavar="FILE", help="Also write the results to FILE as JSON"
+    )
+    args = parser.parse_args(argv)
+
+    cases = [
+        case for case in build_cases(args.size, args.seed) if args.filter in case.name
+    ]
+    if not cases:
+        print(f"no benchmark matches {args.filter!r}", file=sys.stderr)
+        return 1
+
+    results = run(cases, args.min_time)
+    print(format_results(results))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([result._asdict() for result in results], f, indent=2)
+
+    return 0
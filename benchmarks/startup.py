@@ -0,0 +1,70 @@
+"""Start-up timings: package import and a one-value CLI run in fresh processes.
+
+Run with ``python -m benchmarks.startup`` from the repository root. Timings
+depend on the machine and on whether bytecode is cached, so they are
+reported rather than checked against a budget.
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence
+
+from .runner import percentile
+
+SCRIPTS = {
+    "import vn_numberwords": (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import vn_numberwords\n"
+        "print(time.perf_counter() - start)"
+    ),
+    "vn-numberwords 21": (
+        "import io, runpy, sys, time\n"
+        "sys.argv = ['vn-numberwords', '21']\n"
+        "sys.stdout = io.StringIO()\n"
+        "start = time.perf_counter()\n"
+        "runpy.run_module('vn_numberwords.cli', run_name='__main__')\n"
+        "sys.__stdout__.write(str(time.perf_counter() - start))"
+    ),
+}
+
+
+def time_script(code: str) -> float:
+    """Run ``code`` in a fresh interpreter and return the seconds it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout)
+
+
+def measure_startup(runs: int) -> Dict[str, List[float]]:
+    """Time every script ``runs`` times, interleaved, in milliseconds."""
+    timings: Dict[str, List[float]] = {name: [] for name in SCRIPTS}
+    for _ in range(runs):
+        for name, code in SCRIPTS.items():
+            timings[name].append(time_script(code) * 1000)
+    return timings
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point of ``python -m benchmarks.startup``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Time the vn_numberwords import and CLI in fresh processes",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=20, help="Fresh processes per measurement"
+    )
+    args = parser.parse_args(argv)
+
+    width = max(len(name) for name in SCRIPTS)
+    print(f"{'script':<{width}}  {'min (ms)':>9}  {'p50 (ms)':>9}")
+    for name, values in measure_startup(args.runs).items():
+        values.sort()
+        print(f"{name:<{width}}  {values[0]:>9.2f}  {percentile(values, 50):>9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
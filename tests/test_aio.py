@@ -0,0 +1,77 @@
+"""Tests for the asyncio API."""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from vn_numberwords import SouthDictionary, number_to_words
+from vn_numberwords.aio import (
+    iter_number_to_words,
+    number_to_words_many,
+    words_to_number_many,
+)
+
+
+async def agen(items):
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+def test_plain_and_async_iterables():
+    """Test plain and async iterables convert in order"""
+    numbers = list(range(50))
+    expected = [number_to_words(n) for n in numbers]
+
+    assert asyncio.run(number_to_words_many(numbers, chunk_size=7)) == expected
+    assert asyncio.run(number_to_words_many(agen(numbers), chunk_size=7)) == expected
+    assert asyncio.run(words_to_number_many(agen(expected), chunk_size=7)) == numbers
+
+
+def test_dictionary_is_used():
+    """Test the dictionary is passed to the conversions"""
+    result = asyncio.run(number_to_words_many([1000], SouthDictionary()))
+    assert result == ["một ngàn"]
+
+
+def test_yields_between_chunks():
+    """Test the event loop runs other tasks between chunks"""
+    ticks = []
+
+    async def ticker():
+        for _ in range(100):
+            ticks.append(len(converted))
+            await asyncio.sleep(0)
+
+    converted = []
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        async for words in iter_number_to_words(range(100), chunk_size=10):
+            converted.append(words)
+        await task
+
+    asyncio.run(main())
+    assert len(converted) == 100
+    # The ticker ran while the batch was only partially converted.
+    assert any(0 < tick < 100 for tick in ticks)
+
+
+@pytest.mark.parametrize("pool", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_executors(pool):
+    """Test chunks offloaded to thread and process pools"""
+    numbers = [21, 1.5, "1000", 21]
+    with pool(max_workers=2) as executor:
+        result = asyncio.run(
+            number_to_words_many(numbers, chunk_size=2, executor=executor)
+        )
+    assert result == [number_to_words(n) for n in numbers]
+
+
+def test_errors_propagate():
+    """Test invalid arguments and inputs raise"""
+    with pytest.raises(ValueError):
+        asyncio.run(number_to_words_many([1], chunk_size=0))
+    with pytest.raises(Exception, match="must be numeric"):
+        asyncio.run(number_to_words_many(["abc"]))
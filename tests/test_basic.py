@@ -1,5 +1,12 @@
+import pytest
+
 from vn_numberwords import (
+    InvalidNumberError,
+    iter_number_to_words,
+    iter_words_to_number,
     number_to_words,
+    number_to_words_many,
+    words_to_number_many,
     number_to_currency,
     vietnamese_string_to_words,
     words_to_number,
@@ -42,3 +49,27 @@ def test_words_to_number_basic():
     assert words_to_number("hai mươi mốt") == 21
     assert words_to_number("một trăm hai mươi ba") == 123
     assert currency_words_to_number("một nghìn đồng") == 1000
+
+
+def test_batch_conversion():
+    """Test batch entry points keep order and handle repetition"""
+    assert number_to_words_many([21, 1.5, 21, "-5"]) == [
+        "hai mươi mốt",
+        "một phẩy năm",
+        "hai mươi mốt",
+        "âm năm",
+    ]
+    assert number_to_words_many(range(3)) == ["không", "một", "hai"]
+    assert list(iter_number_to_words(iter([1000, 1000]))) == ["một nghìn"] * 2
+    assert words_to_number_many(["mười một", ["hai", "mươi", "mốt"], "mười một"]) == [
+        11,
+        21,
+        11,
+    ]
+    assert list(iter_words_to_number(["một trăm"])) == [100]
+
+
+def test_batch_conversion_keeps_types_apart():
+    """Test 1 and True are not deduplicated together"""
+    with pytest.raises(InvalidNumberError):
+        number_to_words_many([1, True])
@@ -0,0 +1,59 @@
+"""Smoke tests for the benchmark suite."""
+
+import json
+
+from benchmarks.cases import build_cases
+from benchmarks.runner import main, percentile
+from benchmarks.startup import measure_startup
+
+
+def test_cases_cover_public_functions():
+    """Test every public conversion function has benchmark cases"""
+    names = {case.name.split("/")[0] for case in build_cases(size=5)}
+    assert names == {
+        "number_to_words",
+        "number_to_currency",
+        "words_to_number",
+        "currency_words_to_number",
+        "parse_vietnamese_number",
+        "format_number_with_dots",
+    }
+
+
+def test_percentile():
+    """Test nearest-rank percentiles"""
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 51
+    assert percentile(values, 99) == 100
+    assert percentile([], 50) == 0.0
+
+
+def test_runner_writes_json(tmp_path, capsys):
+    """Test the runner prints a table and writes JSON results"""
+    output = tmp_path / "results.json"
+    assert (
+        main(
+            [
+                "-k",
+                "small_ints",
+                "--size",
+                "5",
+                "--min-time",
+                "0",
+                "--json",
+                str(output),
+            ]
+        )
+        == 0
+    )
+    assert "number_to_words/small_ints" in capsys.readouterr().out
+    (result,) = json.loads(output.read_text())
+    assert result["calls"] > 0
+    assert result["p50"] <= result["p99"]
+
+
+def test_startup_reports_every_script():
+    """Test that the start-up benchmark times the import and the CLI"""
+    timings = measure_startup(runs=1)
+    assert set(timings) == {"import vn_numberwords", "vn-numberwords 21"}
+    assert all(len(values) == 1 and values[0] > 0 for values in timings.values())
@@ -0,0 +1,54 @@
+"""Test the vn-numberwords command line interface."""
+
+import subprocess
+import sys
+
+
+def run_cli(*args: str, stdin: str = "") -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "vn_numberwords.cli", *args],
+        input=stdin.encode("utf-8"),
+        capture_output=True,
+        check=False,
+    )
+
+
+def test_single_value():
+    """Test converting one positional value"""
+    result = run_cli("21")
+    assert result.stdout.decode("utf-8").strip() == "hai mươi mốt"
+
+
+def test_stream_stdin():
+    """Test streaming numbers from stdin with a currency unit"""
+    result = run_cli("--south", "-c", "đồng", stdin="24\n\n1000\n")
+    assert result.returncode == 0
+    assert result.stdout.decode("utf-8").splitlines() == [
+        "hai mươi tư đồng",
+        "",
+        "một ngàn đồng",
+    ]
+
+
+def test_stream_reverse_from_file(tmp_path):
+    """Test streaming words back to numbers from a file"""
+    source = tmp_path / "words.txt"
+    source.write_text("mười một\nmột nghìn đồng\n", encoding="utf-8")
+    result = run_cli("--reverse", "-c", "đồng", "--input", str(source))
+    assert result.stdout.decode("utf-8").splitlines() == ["11", "1000"]
+
+
+def test_stream_reports_invalid_line():
+    """Test invalid input stops with the offending line number"""
+    result = run_cli(stdin="1\nabc\n2\n")
+    assert result.returncode == 1
+    assert result.stdout.decode("utf-8").splitlines() == ["một"]
+    assert "line 2" in result.stderr.decode("utf-8")
+
+
+def test_parallel_workers(tmp_path):
+    """Test --workers converts a file in order"""
+    source = tmp_path / "numbers.txt"
+    source.write_text("1\n2\n3\n", encoding="utf-8")
+    result = run_cli("--workers", "2", "--input", str(source))
+    assert result.stdout.decode("utf-8").splitlines() == ["một", "hai", "ba"]
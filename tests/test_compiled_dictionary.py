@@ -0,0 +1,67 @@
+"""Tests for compiled dictionary snapshots."""
+
+import pytest
+
+from vn_numberwords import (
+    CompiledDictionary,
+    Dictionary,
+    DictionaryError,
+    NumberTransformer,
+    SouthDictionary,
+    compile_dictionary,
+    number_to_words,
+)
+
+
+class ShoutingDictionary(Dictionary):
+    def get_triplet_unit(self, unit: int) -> str:
+        return super().get_triplet_unit(unit).upper()
+
+    def separator(self) -> str:
+        return "-"
+
+
+@pytest.mark.parametrize("dictionary", [Dictionary(), SouthDictionary()])
+def test_snapshot_matches_source(dictionary):
+    """Test a compiled dictionary returns the words of its source"""
+    compiled = compile_dictionary(dictionary)
+    assert compiled.source is dictionary
+    assert compile_dictionary(compiled) is compiled
+    for digit in range(10):
+        assert compiled.get_triplet_unit(digit) == dictionary.get_triplet_unit(digit)
+        assert compiled.get_triplet_ten(digit) == dictionary.get_triplet_ten(digit)
+        assert compiled.get_triplet_hundred(digit) == dictionary.get_triplet_hundred(
+            digit
+        )
+    for power in range(40):
+        assert compiled.get_exponent(power) == dictionary.get_exponent(power)
+    assert compiled.triplet_ten_separator() == dictionary.triplet_ten_separator()
+    assert (
+        compiled.special_triplet_unit_four() == dictionary.special_triplet_unit_four()
+    )
+
+
+def test_snapshot_is_immutable():
+    """Test compiled dictionaries cannot be modified"""
+    compiled = compile_dictionary(Dictionary())
+    with pytest.raises(AttributeError):
+        compiled.separator_word = "-"
+    with pytest.raises(AttributeError):
+        compiled.extra = 1
+    with pytest.raises(DictionaryError):
+        compiled.get_triplet_unit(10)
+
+
+def test_custom_subclass_overrides_are_compiled():
+    """Test overridden methods of a subclass are compiled"""
+    transformer = NumberTransformer(ShoutingDictionary())
+    assert isinstance(transformer.compiled, CompiledDictionary)
+    assert transformer.to_words(1002) == "MỘT-nghìn-không-trăm-linh-HAI"
+
+
+def test_compiled_dictionaries_do_not_share_transformers():
+    """Test compiled North and South dictionaries keep their own words"""
+    north = compile_dictionary(Dictionary())
+    south = compile_dictionary(SouthDictionary())
+    assert number_to_words(1000, north) == "một nghìn"
+    assert number_to_words(1000, south) == "một ngàn"
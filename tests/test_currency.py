@@ -0,0 +1,124 @@
+"""Test the currency registry, unit matching and currency conversions."""
+
+from decimal import Decimal
+
+import pytest
+
+from vn_numberwords import (
+    Currency,
+    InvalidWordsError,
+    WordToNumberParser,
+    currency_words_to_amount,
+    currency_words_to_number,
+    get_currency,
+    number_to_currency,
+    register_currency,
+)
+from vn_numberwords.core import currency as currency_module
+
+
+def test_registry_lookup():
+    """Test currencies are looked up by code"""
+    assert len(currency_module.CURRENCIES) >= 20
+    assert get_currency("jpy").decimals == 0
+    with pytest.raises(KeyError):
+        get_currency("XXX")
+
+
+def test_to_currency_minor_units():
+    """Test amounts are spelled with minor units"""
+    usd = get_currency("USD")
+    assert number_to_currency(1.50, ["đô la", "xu"]) == "một đô la năm mươi xu"
+    assert number_to_currency("1.05", usd) == "một đô la năm xu"
+    assert number_to_currency(2.999, usd) == "ba đô la"
+    assert number_to_currency(-3, usd) == "âm ba đô la"
+    assert number_to_currency(1000, get_currency("VND")) == "một nghìn đồng"
+    # Without a minor unit the fraction is read as before.
+    assert number_to_currency(1.5, get_currency("JPY")) == "một phẩy năm yên"
+
+
+def test_amount_round_trip():
+    """Test spelled amounts parse back to the same value and currency"""
+    for code in ("USD", "EUR", "GBP", "THB", "TWD", "AUD"):
+        currency = get_currency(code)
+        words = number_to_currency("1234.56", currency)
+        amount = currency_words_to_amount(words)
+        assert amount.currency == currency
+        assert amount.value == Decimal("1234.56")
+
+
+def test_amount_longest_unit_and_aliases():
+    """Test the longest unit name and aliases are recognized"""
+    assert currency_words_to_amount("ba đô la úc").currency.code == "AUD"
+    assert currency_words_to_amount("ba đô la").currency.code == "USD"
+    assert currency_words_to_amount("Hai trăm nghìn VNĐ") == (
+        200000,
+        get_currency("VND"),
+    )
+    assert currency_words_to_amount("năm mươi xu").value == Decimal("0.50")
+    assert currency_words_to_amount("bảy mươi") == (70, None)
+
+
+def test_amount_minor_units_are_exact():
+    """Test minor units give exact Decimal values"""
+    amount = currency_words_to_amount(
+        "chín triệu tỷ chín trăm chín mươi chín đô la chín mươi chín xu"
+    )
+    assert amount.value == Decimal("9000000000000999.99")
+    assert currency_words_to_amount("hai bạt năm xa tăng").value == Decimal("2.05")
+
+
+def test_amount_rejects_minor_unit_of_another_currency():
+    """Test a minor unit of another currency is rejected"""
+    with pytest.raises(InvalidWordsError, match="VND"):
+        currency_words_to_amount("hai đồng năm xu")
+    with pytest.raises(InvalidWordsError, match="THB"):
+        currency_words_to_amount("hai bạt năm xu")
+
+
+def test_currency_words_unit_matching():
+    """Test trailing units are removed before parsing"""
+    parser = WordToNumberParser()
+    assert parser.parse_currency_words("một nghìn dong") == 1000
+    assert parser.parse_currency_words("năm đô la", "đô la") == 5
+    assert parser.parse_currency_words(["hai", "nghìn", "Đồng"]) == 2000
+    # A unit that is also a number word is only removed at the end.
+    assert parser.parse_currency_words("ba trăm củ", "củ") == 300
+    assert currency_words_to_number("mười euro", get_currency("EUR")) == 10
+    # Units are compared as written, or folded in unaccented text.
+    assert parser.parse_currency_words("hai mươi", "mười") == 20
+    assert parser.parse_currency_words("hai muoi", "mười") == 2
+
+
+def test_amount_units_match_as_written():
+    """Test that folded unit names only match text without diacritics"""
+    vnd = get_currency("VND")
+    usd = get_currency("USD")
+    assert currency_words_to_amount("giá do tăng hai trăm nghìn đồng") == (200000, vnd)
+    assert currency_words_to_amount("hai nghìn đông") == (2000, None)
+    assert currency_words_to_amount("hai tram nghin do la") == (200000, usd)
+    assert currency_words_to_amount("Hai nghìn ĐÔ-LA").currency == usd
+
+
+def test_currency_words_reject_other_currencies():
+    """Test that a given currency only accepts its own unit names"""
+    vnd = get_currency("VND")
+    assert currency_words_to_number("hai nghìn việt nam đồng", vnd) == 2000
+    assert currency_words_to_number("năm mươi xu", get_currency("EUR")) == Decimal(
+        "0.50"
+    )
+    with pytest.raises(InvalidWordsError, match="VND"):
+        currency_words_to_number("hai đô la", vnd)
+    with pytest.raises(InvalidWordsError, match="SGD"):
+        currency_words_to_number("hai đô la", get_currency("SGD"))
+
+
+def test_register_currency(monkeypatch):
+    """Test registered currencies are recognized"""
+    monkeypatch.setattr(currency_module, "CURRENCIES", dict(currency_module.CURRENCIES))
+    monkeypatch.setattr(currency_module, "_matcher", None)
+    register_currency(Currency("XAU", "lượng vàng", None, ("cây vàng",), 0))
+
+    amount = currency_words_to_amount("hai cây vàng")
+    assert amount.value == 2
+    assert amount.currency.code == "XAU"
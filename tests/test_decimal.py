@@ -1,6 +1,8 @@
 """Test decimal numbers, negative numbers, and edge cases."""
 
-from vn_numberwords import number_to_words, InvalidNumberError
+from decimal import Decimal
+
+from vn_numberwords import number_to_words, InvalidNumberError, NumberTransformer
 import pytest
 
 
@@ -47,7 +49,8 @@ def test_large_numbers():
     assert number_to_words(1000000000000) == "một nghìn tỷ"
     assert (
         number_to_words(1234567890)
-        == "một tỷ hai trăm ba mươi bốn triệu năm trăm sáu mươi bảy nghìn tám trăm chín mươi"
+        == "một tỷ hai trăm ba mươi bốn triệu năm trăm sáu mươi bảy nghìn "
+        "tám trăm chín mươi"
     )
 
 
@@ -133,3 +136,40 @@ def test_consecutive_numbers():
     assert number_to_words(7) == "bảy"
     assert number_to_words(8) == "tám"
     assert number_to_words(9) == "chín"
+
+
+def test_exact_resolution():
+    """Test exact conversion without float round-trips"""
+    assert number_to_words(2**53 + 1) == number_to_words(str(2**53 + 1))
+    assert number_to_words(2**53 + 1).endswith("chín mươi ba")
+    assert number_to_words(1e16) == "mười triệu tỷ"
+    assert number_to_words("1000000000000000.5") == "một triệu tỷ phẩy năm"
+    assert (
+        number_to_words(Decimal("1234.50")) == "một nghìn hai trăm ba mươi bốn phẩy năm"
+    )
+    assert number_to_words(Decimal("-1E+3")) == "âm một nghìn"
+
+    with pytest.raises(InvalidNumberError):
+        number_to_words(Decimal("NaN"))
+    with pytest.raises(InvalidNumberError):
+        number_to_words("1-2")
+
+
+def test_fraction_leading_zeros():
+    """Test leading zeros in the fraction are read"""
+    assert number_to_words(1.05) == "một phẩy không năm"
+    assert number_to_words("0.005") == "không phẩy không không năm"
+    assert number_to_words(Decimal("2.0")) == "hai"
+
+
+def test_decimal_part_rounding():
+    """Test fixed decimal places for every input type"""
+    transformer = NumberTransformer(decimal_part=2)
+    assert transformer.resolve_number(1.5) == (False, 1, 50)
+    assert transformer.to_words(Decimal("1.005")) == "một"
+    assert transformer.to_words("1.015") == "một phẩy không hai"
+    assert transformer.to_words("12345678901234567.899") == (
+        "mười hai triệu tỷ ba trăm bốn mươi lăm nghìn tỷ sáu trăm bảy mươi tám tỷ "
+        "chín trăm linh một triệu hai trăm ba mươi bốn nghìn năm trăm sáu mươi bảy "
+        "phẩy chín mươi"
+    )
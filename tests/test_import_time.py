@@ -0,0 +1,78 @@
+"""Import-time regression checks; each check runs in a fresh interpreter.
+
+Only which modules get loaded is checked here; start-up timings are
+reported by ``python -m benchmarks.startup``.
+"""
+
+import subprocess
+import sys
+
+import vn_numberwords
+import vn_numberwords.core
+
+HEAVY_MODULES = (
+    "typing",
+    "decimal",
+    "concurrent.futures",
+    "vn_numberwords.core.transformer",
+    "vn_numberwords.core.word_parser",
+)
+
+
+def run_python(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def loaded_after(code, modules):
+    return run_python(
+        f"import sys\n{code}\nprint(sorted(m for m in {modules!r} if m in sys.modules))"
+    )
+
+
+def test_package_import_is_lazy():
+    """Test importing the package loads none of the heavy modules"""
+    assert loaded_after("import vn_numberwords", HEAVY_MODULES) == "[]"
+
+
+def test_number_to_words_does_not_load_parser():
+    """Test converting a number does not load the parser"""
+    code = "import vn_numberwords\nvn_numberwords.number_to_words(5)"
+    assert (
+        loaded_after(
+            code, ("decimal", "concurrent.futures", "vn_numberwords.core.word_parser")
+        )
+        == "[]"
+    )
+
+
+def test_cli_does_not_load_multiprocessing():
+    """Test the one-value CLI path only loads what it needs"""
+    code = (
+        "sys.argv = ['vn-numberwords', '21']\n"
+        "from vn_numberwords.cli import main\n"
+        "main()"
+    )
+    modules = (
+        "concurrent.futures",
+        "multiprocessing",
+        "threading",
+        "vn_numberwords.stream",
+        "vn_numberwords.core.cache",
+        "vn_numberwords.core.columnar",
+        "vn_numberwords.core.currency",
+        "vn_numberwords.core.registry",
+        "vn_numberwords.core.streaming",
+        "vn_numberwords.core.word_parser",
+    )
+    assert loaded_after(code, modules) == "hai mươi mốt\n[]"
+
+
+def test_lazy_attributes_resolve():
+    """Test every lazy package attribute resolves"""
+    for package in (vn_numberwords, vn_numberwords.core):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
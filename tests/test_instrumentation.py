@@ -0,0 +1,59 @@
+"""Tests for stage-level instrumentation."""
+
+from vn_numberwords import (
+    NumberTransformer,
+    Recorder,
+    WordToNumberParser,
+    instrument,
+)
+from vn_numberwords.core import instrumentation
+
+
+def test_disabled_by_default():
+    """Test no recorder is installed by default"""
+    assert instrumentation.recorder is None
+    NumberTransformer().to_words(5)
+
+
+def test_transformer_stages():
+    """Test the transformer stages are counted"""
+    transformer = NumberTransformer()
+    with instrument() as stats:
+        transformer.to_words(21)
+        transformer.to_words("1.5")
+        transformer.to_currency(1.5, ["đô la", "xu"])
+    stages = stats.as_dict()
+    assert instrumentation.recorder is None
+
+    assert stages["transformer.resolve_number"]["calls"] == 2
+    assert stages["transformer.render_triplets"]["calls"] == 4
+    assert stages["transformer.collapse_words"]["calls"] == 4
+    assert all(stage["seconds"] >= 0 for stage in stages.values())
+
+
+def test_parser_stages():
+    """Test the parser stages are counted"""
+    parser = WordToNumberParser()
+    with instrument() as stats:
+        assert parser.parse_words("Hai mươi mốt") == 21
+        assert parser.parse_currency_words("năm nghìn đồng") == 5000
+    assert {stage: values["calls"] for stage, values in stats.as_dict().items()} == {
+        "parser.normalize_text": 2,
+        "parser.split_words": 2,
+        "parser.parse_segments": 2,
+    }
+
+
+def test_nested_recorders_restore_previous():
+    """Test nested recorders restore the outer one on exit"""
+    outer = Recorder()
+    with instrument(outer):
+        with instrument() as inner:
+            NumberTransformer().to_words(1)
+        assert instrumentation.recorder is outer
+        NumberTransformer().to_words(2)
+    assert inner.as_dict()["transformer.render_triplets"]["calls"] == 1
+    assert outer.as_dict()["transformer.render_triplets"]["calls"] == 1
+
+    outer.reset()
+    assert outer.as_dict() == {}
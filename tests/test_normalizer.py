@@ -0,0 +1,83 @@
+"""Tests for spelling out numbers in running text."""
+
+from decimal import Decimal
+from random import Random
+
+import pytest
+
+from vn_numberwords import SouthDictionary, parse_vietnamese_number
+from vn_numberwords.normalizer import iter_spell_out_numbers, spell_out_numbers
+
+BOOK = (
+    "Chương 3. Năm 2024, giá vàng tăng 1.234.567 đồng/lượng, tức 12,5%.\n"
+    "Anh ấy nợ -50.000đ và trả 1.000 VND, rồi 2.500₫ nữa. Mã v2, bản 3.14.15, "
+    "số 1.2345 giữ nguyên. Tổng 1.234,56 VNĐ! Hết 7"
+)
+
+
+@pytest.mark.parametrize(
+    "text, number",
+    [
+        ("1.234,56", Decimal("1234.56")),
+        ("12,5", Decimal("12.5")),
+        ("-1.234,5", Decimal("-1234.5")),
+        ("0,05", Decimal("0.05")),
+        ("12.345.678.901.234.567,89", Decimal("12345678901234567.89")),
+    ],
+)
+def test_parse_vietnamese_number_comma_decimal(text, number):
+    """Test a decimal comma parses to an exact Decimal"""
+    assert parse_vietnamese_number(text) == number
+
+
+def test_spell_out_numbers_keeps_every_digit_of_long_amounts():
+    """Test amounts too long for a float keep every digit"""
+    # 12345678901234567 is above 2**53, where a float would drop digits.
+    assert spell_out_numbers("12.345.678.901.234.567,89 đ") == (
+        "mười hai triệu tỷ ba trăm bốn mươi lăm nghìn tỷ sáu trăm bảy mươi tám tỷ "
+        "chín trăm linh một triệu hai trăm ba mươi bốn nghìn năm trăm sáu mươi bảy "
+        "phẩy tám mươi chín đồng"
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["1,2,3", "1,", "abc,5", "1.2,5", "12.34,5", "1234.567,8", ",5", ".,5", "-,5"],
+)
+def test_parse_vietnamese_number_rejects_bad_comma(text):
+    """Test malformed numbers with a decimal comma are rejected"""
+    with pytest.raises(ValueError):
+        parse_vietnamese_number(text)
+
+
+def test_spell_out_numbers():
+    """Test numbers, signs and currency symbols in text are spelled out"""
+    assert spell_out_numbers(BOOK) == (
+        "Chương ba. Năm hai nghìn không trăm hai mươi bốn, giá vàng tăng "
+        "một triệu hai trăm ba mươi bốn nghìn năm trăm sáu mươi bảy đồng/lượng, "
+        "tức mười hai phẩy năm%.\n"
+        "Anh ấy nợ âm năm mươi nghìn đồng và trả một nghìn đồng, rồi hai nghìn "
+        "năm trăm đồng nữa. Mã v2, bản 3.14.15, số 1.2345 giữ nguyên. "
+        "Tổng một nghìn hai trăm ba mươi bốn phẩy năm mươi sáu đồng! Hết bảy"
+    )
+
+
+def test_dictionary():
+    """Test South dictionary words are used"""
+    assert spell_out_numbers("1.004", SouthDictionary()) == "một ngàn không trăm lẻ bốn"
+
+
+def test_random_chunk_boundaries():
+    """Test the output does not depend on where the text is chunked"""
+    expected = spell_out_numbers(BOOK)
+    rng = Random(0)
+    for _ in range(300):
+        cuts = sorted(rng.sample(range(1, len(BOOK)), rng.randrange(1, 30)))
+        chunks = [BOOK[a:b] for a, b in zip([0] + cuts, cuts + [None])]
+        assert "".join(iter_spell_out_numbers(chunks)) == expected
+
+
+def test_one_character_chunks():
+    """Test one-character chunks give the same output"""
+    assert "".join(iter_spell_out_numbers(iter(BOOK))) == spell_out_numbers(BOOK)
+    assert list(iter_spell_out_numbers([])) == []
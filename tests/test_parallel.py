@@ -0,0 +1,47 @@
+"""Test multi-process file conversion."""
+
+import io
+
+from vn_numberwords import SouthDictionary, number_to_words
+from vn_numberwords.parallel import convert_file, split_file
+
+
+def test_split_file_on_line_boundaries(tmp_path):
+    """Test byte ranges cover the file and end on newlines"""
+    source = tmp_path / "numbers.txt"
+    data = "".join(f"{n}\n" for n in range(200)).encode("utf-8")
+    source.write_bytes(data)
+
+    ranges = split_file(source, chunk_size=64)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[end - 1 : end] == b"\n"
+
+
+def test_convert_file_preserves_order(tmp_path):
+    """Test parallel conversion matches sequential output"""
+    source = tmp_path / "numbers.txt"
+    target = tmp_path / "words.txt"
+    numbers = list(range(0, 5000, 7))
+    source.write_text("\n".join(map(str, numbers)), encoding="utf-8")
+
+    convert_file(
+        source, target, workers=2, dictionary=SouthDictionary(), chunk_size=256
+    )
+
+    assert target.read_text(encoding="utf-8").splitlines() == [
+        number_to_words(n, SouthDictionary()) for n in numbers
+    ]
+
+
+def test_convert_file_reverse_to_stream(tmp_path):
+    """Test in-process reverse conversion into a binary stream"""
+    source = tmp_path / "words.txt"
+    source.write_text("mười một\nmột trăm\n", encoding="utf-8")
+    output = io.BytesIO()
+
+    convert_file(source, output, workers=1, reverse=True)
+
+    assert output.getvalue() == b"11\n100\n"
@@ -0,0 +1,94 @@
+"""Test the shared transformer/parser registry."""
+
+import gc
+import threading
+
+from vn_numberwords import Dictionary, SouthDictionary, number_to_words
+from vn_numberwords.core import clear_registry, get_parser, get_transformer
+
+
+class PrefixedDictionary(Dictionary):
+    def __init__(self, zero_word: str):
+        self.zero_word = zero_word
+
+    def zero(self) -> str:
+        return self.zero_word
+
+
+def test_instances_are_shared_per_dictionary_type():
+    """Test stateless dictionaries share one instance per type"""
+    assert get_transformer() is get_transformer()
+    assert get_transformer(SouthDictionary()) is get_transformer(SouthDictionary())
+    assert get_transformer(SouthDictionary()) is not get_transformer()
+    assert get_parser(SouthDictionary()) is get_parser(SouthDictionary())
+    assert get_transformer(SouthDictionary()).dictionary.triplet_ten_separator() == "lẻ"
+
+
+def test_stateful_dictionaries_get_fresh_instances():
+    """Test dictionaries with instance state never share instances"""
+    first = PrefixedDictionary("zero")
+    second = PrefixedDictionary("nil")
+
+    assert get_transformer(first) is not get_transformer(first)
+    assert get_parser(first) is not get_parser(first)
+    assert number_to_words(0, first) == "zero"
+    assert number_to_words(0, second) == "nil"
+
+
+def test_registry_is_thread_safe():
+    """Test concurrent first use builds a single instance"""
+    clear_registry()
+    seen = []
+
+    def worker():
+        seen.append(get_transformer())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(transformer is seen[0] for transformer in seen)
+
+
+def test_result_cache_applies_to_shared_transformers():
+    """Test the shared result cache size applies to registry transformers"""
+    from vn_numberwords import (
+        clear_result_cache,
+        result_cache_info,
+        set_result_cache_size,
+    )
+
+    clear_registry()
+    set_result_cache_size(64)
+    try:
+        assert number_to_words(1000) == "một nghìn"
+        assert number_to_words(1000) == "một nghìn"
+        assert number_to_words(1000, SouthDictionary()) == "một ngàn"
+        info = result_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+        clear_result_cache()
+        assert result_cache_info().currsize == 0
+    finally:
+        set_result_cache_size(None)
+    assert get_transformer().cache_info().maxsize == 0
+
+
+def test_transformer_outlives_its_dictionary():
+    """Test a kept transformer still works after the dictionary is dropped"""
+    transformer = get_transformer(PrefixedDictionary("zero"))
+    gc.collect()
+
+    assert transformer.dictionary.zero() == "zero"
+    assert transformer.to_words(0) == "zero"
+
+
+def test_changed_dictionary_is_not_stale():
+    """Test a dictionary changed after first use gives updated results"""
+    dictionary = PrefixedDictionary("zero")
+    assert number_to_words(0, dictionary) == "zero"
+
+    dictionary.zero_word = "nil"
+    assert number_to_words(0, dictionary) == "nil"
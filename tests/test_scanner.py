@@ -0,0 +1,86 @@
+"""Tests for finding spelled-out numbers in free text."""
+
+import unicodedata
+from random import Random
+
+from vn_numberwords import SouthDictionary, find_numbers, iter_number_spans
+
+TRANSCRIPT = (
+    "Xin chào, tôi muốn chuyển hai trăm nghìn đồng. Mã đơn là một hai ba, "
+    "không phải ba hai một! Nhiệt độ âm năm độ, còn lại Mười Lăm triệu "
+    "bốn trăm linh năm nghìn. Trăm người, nghìn ý."
+)
+
+
+def values(spans):
+    return [(span.text, span.value) for span in spans]
+
+
+def test_find_numbers():
+    """Test spelled-out numbers are found in a transcript"""
+    assert values(find_numbers(TRANSCRIPT)) == [
+        ("hai trăm nghìn", 200000),
+        ("một hai ba", 123),
+        ("không", 0),
+        ("ba hai một", 321),
+        ("âm năm", -5),
+        ("Mười Lăm triệu bốn trăm linh năm nghìn", 15405000),
+    ]
+
+
+def test_offsets_point_into_text():
+    """Test span offsets slice the text of each span"""
+    for span in find_numbers(TRANSCRIPT):
+        assert TRANSCRIPT[span.start : span.end] == span.text
+
+
+def test_no_numbers():
+    """Test text without numbers gives no spans"""
+    assert find_numbers("") == []
+    assert find_numbers("tôi có con mèo") == []
+    assert find_numbers("trăm năm trong cõi") == [(5, 8, "năm", 5)]
+
+
+def test_random_chunk_boundaries():
+    """Test spans do not depend on where the text is chunked"""
+    expected = find_numbers(TRANSCRIPT)
+    rng = Random(0)
+    for _ in range(200):
+        cuts = sorted(rng.sample(range(1, len(TRANSCRIPT)), rng.randrange(1, 20)))
+        chunks = [TRANSCRIPT[a:b] for a, b in zip([0] + cuts, cuts + [None])]
+        assert list(iter_number_spans(chunks)) == expected
+
+
+def test_one_character_chunks():
+    """Test one-character chunks give the same spans"""
+    assert list(iter_number_spans(iter(TRANSCRIPT))) == find_numbers(TRANSCRIPT)
+
+
+def test_dictionary():
+    """Test South dictionary words are recognized"""
+    assert values(find_numbers("một ngàn tư", SouthDictionary())) == [
+        ("một ngàn tư", 1004)
+    ]
+
+
+def test_unaccented_words_in_accented_prose():
+    """Test words without diacritics do not match folded number words"""
+    assert find_numbers("Việt Nam") == []
+    assert values(find_numbers("Tôi về sau ba ngày")) == [("ba", 3)]
+    assert values(find_numbers("toi co hai tram nghin", unaccented=True)) == [
+        ("hai tram nghin", 200000)
+    ]
+    # Accented words are matched exactly even in unaccented mode.
+    assert find_numbers("từ Việt Nam", unaccented=True) == [(8, 11, "Nam", 5)]
+
+
+def test_decomposed_text():
+    """Test NFD text gives the same values and offsets into it"""
+    text = unicodedata.normalize("NFD", TRANSCRIPT)
+    spans = find_numbers(text)
+    assert [span.value for span in spans] == [
+        span.value for span in find_numbers(TRANSCRIPT)
+    ]
+    for span in spans:
+        assert text[span.start : span.end] == span.text
+    assert list(iter_number_spans(iter(text))) == spans
@@ -0,0 +1,70 @@
+"""Test memory-mapped conversion of number files."""
+
+import io
+
+import pytest
+
+from vn_numberwords import SouthDictionary
+from vn_numberwords.exceptions import InvalidNumberError
+from vn_numberwords.stream import convert_mapped_file
+
+
+def test_convert_mapped_file_lines(tmp_path):
+    """Test memory-mapped conversion of one Vietnamese number per line"""
+    source = tmp_path / "amounts.txt"
+    target = tmp_path / "words.txt"
+    source.write_bytes(b"1.000\r\n\n21\n1.234,5\n21")
+
+    assert convert_mapped_file(source, target, currency="đồng") == 5
+    assert target.read_text(encoding="utf-8").splitlines() == [
+        "một nghìn đồng",
+        "",
+        "hai mươi mốt đồng",
+        "một nghìn hai trăm ba mươi bốn phẩy năm đồng",
+        "hai mươi mốt đồng",
+    ]
+
+
+def test_convert_mapped_file_column(tmp_path):
+    """Test converting one column of a delimited file into a stream"""
+    source = tmp_path / "ledger.csv"
+    source.write_text("a;24;x\nb;1.000.000;y\n", encoding="utf-8")
+    output = io.BytesIO()
+
+    convert_mapped_file(
+        source, output, column=1, delimiter=";", dictionary=SouthDictionary()
+    )
+
+    assert output.getvalue().decode("utf-8").splitlines() == [
+        "hai mươi tư",
+        "một triệu",
+    ]
+
+
+def test_convert_mapped_file_errors(tmp_path):
+    """Test empty inputs and invalid fields with their line numbers"""
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert convert_mapped_file(empty, io.BytesIO()) == 0
+
+    source = tmp_path / "bad.txt"
+    source.write_text("1\n2\nabc\n", encoding="utf-8")
+    with pytest.raises(InvalidNumberError, match="line 3"):
+        convert_mapped_file(source, io.BytesIO())
+    with pytest.raises(InvalidNumberError, match="line 1"):
+        convert_mapped_file(source, io.BytesIO(), column=2)
+
+
+def test_convert_mapped_file_keeps_every_digit(tmp_path):
+    """Test amounts too long for a float are rendered digit for digit"""
+    source = tmp_path / "amounts.txt"
+    source.write_text("999.999.999.999.999,99\n", encoding="utf-8")
+    output = io.BytesIO()
+
+    convert_mapped_file(source, output, currency="đồng")
+
+    assert output.getvalue().decode("utf-8") == (
+        "chín trăm chín mươi chín nghìn tỷ chín trăm chín mươi chín tỷ "
+        "chín trăm chín mươi chín triệu chín trăm chín mươi chín nghìn "
+        "chín trăm chín mươi chín phẩy chín mươi chín đồng\n"
+    )
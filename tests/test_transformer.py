@@ -0,0 +1,165 @@
+"""Test NumberTransformer internals."""
+
+import io
+from decimal import Decimal
+from random import Random
+
+import pytest
+
+from vn_numberwords import NumberTransformer, SouthDictionary
+from vn_numberwords.exceptions import InvalidNumberError
+
+
+def test_triplet_table_matches_rendering():
+    """Test the compiled triplet table against direct rendering"""
+    for dictionary in (None, SouthDictionary()):
+        transformer = NumberTransformer(dictionary)
+        table = transformer.triplet_table()
+        for triplet in range(1000):
+            assert table[True][triplet] == transformer.render_triplet(triplet, True)
+            assert table[False][triplet] == transformer.render_triplet(triplet, False)
+
+
+def test_triplet_table_separators():
+    """Test leading and non-leading triplets with linh/lẻ"""
+    north = NumberTransformer().triplet_table()
+    south = NumberTransformer(SouthDictionary()).triplet_table()
+
+    assert north[True][5] == "năm"
+    assert north[False][5] == "không trăm linh năm"
+    assert south[True][104] == "một trăm lẻ bốn"
+    assert south[False][24] == "không trăm hai mươi tư"
+
+
+def test_to_words_uses_table():
+    """Test multi-triplet numbers rendered from the table"""
+    transformer = NumberTransformer()
+    assert transformer.to_words(1005) == "một nghìn không trăm linh năm"
+    assert transformer.to_words(2000001) == "hai triệu không trăm linh một"
+    assert transformer.triplet_to_words(5, False, 1) == "không trăm linh năm nghìn"
+
+
+def test_stacked_magnitudes():
+    """Test magnitudes beyond triệu tỷ stack tỷ"""
+    transformer = NumberTransformer()
+    assert transformer.to_words(10**18) == "một tỷ tỷ"
+    assert (
+        transformer.to_words(10**21 + 5 * 10**18)
+        == "một nghìn không trăm linh năm tỷ tỷ"
+    )
+    # Groups of 18 digits are each followed by a single "tỷ tỷ".
+    assert (
+        transformer.to_words(2 * 10**36 + 3 * 10**27 + 4)
+        == "hai tỷ tỷ không trăm linh ba tỷ tỷ tỷ không trăm linh bốn"
+    )
+    assert NumberTransformer(SouthDictionary()).to_words(10**21) == "một ngàn tỷ tỷ"
+
+
+def test_huge_numbers():
+    """Test numbers with thousands of digits, as int and as string"""
+    transformer = NumberTransformer()
+    expected = "một triệu " + " ".join(["tỷ"] * 666)
+    assert transformer.to_words(10**6000) == expected
+    assert transformer.to_words("1" + "0" * 6000) == expected
+
+    # The output grows linearly: at most four words per digit.
+    digits = "987654321" * 2000
+    assert len(transformer.to_words(digits).split()) < 4 * len(digits)
+
+
+def test_number_to_triplets_divide_and_conquer():
+    """Test large splits against the plain triplet loop"""
+    transformer = NumberTransformer()
+    random = Random(0)
+
+    for digits in (1, 17, 48, 49, 200, 1000, 3001):
+        number = random.randrange(10 ** (digits - 1), 10**digits) * 1000**5
+        expected = []
+        rest = number
+        while rest:
+            rest, triplet = divmod(rest, 1000)
+            expected.insert(0, triplet)
+        assert transformer.number_to_triplets(number) == expected
+
+
+def test_result_cache_hits_and_eviction():
+    """Test the result cache counts hits and evicts the least recent entry"""
+    transformer = NumberTransformer(cache_size=2)
+    assert transformer.to_words(5) == "năm"
+    assert transformer.to_words(5) == "năm"
+    assert transformer.to_words("1.5") == transformer.to_words(1.5)
+    assert transformer.to_currency(5, "đồng") == "năm đồng"
+    info = transformer.cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 3, 2, 2)
+
+    # 5 was evicted as least recently used.
+    transformer.to_words(5)
+    assert transformer.cache_info().misses == 4
+
+    transformer.cache_clear()
+    assert transformer.cache_info() == (0, 0, 2, 0)
+
+
+def test_result_cache_disabled_by_default():
+    """Test transformers do not cache results unless asked to"""
+    transformer = NumberTransformer()
+    transformer.to_words(5)
+    assert transformer.cache_info() == (0, 0, 0, 0)
+
+
+def test_result_cache_keys_include_unit_and_dictionary():
+    """Test cached results are kept apart per unit and dictionary"""
+    north = NumberTransformer(cache_size=16)
+    south = NumberTransformer(SouthDictionary(), cache_size=16)
+    assert north.to_currency(1000, "đồng") == "một nghìn đồng"
+    assert north.to_currency(1000, "đô la") == "một nghìn đô la"
+    assert north.to_words(1000) == "một nghìn"
+    assert south.to_words(1000) == "một ngàn"
+
+
+def test_to_words_column_matches_to_words():
+    """Test columnar output matches to_words row by row"""
+    rng = Random(3)
+    numbers = [0, -1, 10**30, -(10**18) - 5, 1.5, "12.05"]
+    numbers += [rng.randrange(-(10**24), 10**24) for _ in range(500)]
+    for dictionary in (None, SouthDictionary()):
+        transformer = NumberTransformer(dictionary)
+        column = transformer.to_words_column(numbers)
+        expected = [transformer.to_words(number) for number in numbers]
+        assert column.tolist() == expected
+        assert len(column) == len(numbers)
+        assert column[-1] == expected[-1]
+        assert column.offsets[-1] == len(column.data)
+        assert bytes(column.data_view()) == "".join(expected).encode("utf-8")
+
+
+def test_to_words_column_empty():
+    """Test an empty batch gives an empty column"""
+    column = NumberTransformer().to_words_column([])
+    assert len(column) == 0
+    assert column.offsets.tolist() == [0]
+
+
+def test_streamed_words_match_to_words():
+    """Test iter_words and to_words_into match to_words"""
+    rng = Random(5)
+    numbers = [0, -7, 10**100 + 1, 0.05, "-0012.0300", Decimal("1e-7"), 1000]
+    numbers += [rng.randrange(-(10**30), 10**30) for _ in range(200)]
+    for dictionary in (None, SouthDictionary()):
+        transformer = NumberTransformer(dictionary, decimal_part=None)
+        for number in numbers:
+            expected = transformer.to_words(number)
+            assert " ".join(transformer.iter_words(number)) == expected
+            text, binary = io.StringIO(), io.BytesIO()
+            transformer.to_words_into(number, text)
+            transformer.to_words_into(number, binary)
+            assert text.getvalue() == expected
+            assert binary.getvalue() == expected.encode("utf-8")
+
+
+def test_to_words_into_rejects_before_writing():
+    """Test invalid input raises before anything is written"""
+    out = io.StringIO()
+    with pytest.raises(InvalidNumberError):
+        NumberTransformer().to_words_into("1.2.3", out)
+    assert out.getvalue() == ""
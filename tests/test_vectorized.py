@@ -0,0 +1,43 @@
+"""Test NumPy vectorized conversion."""
+
+import pytest
+
+from vn_numberwords import NumberTransformer, SouthDictionary
+
+np = pytest.importorskip("numpy")
+
+from vn_numberwords.vectorized import to_words_array  # noqa: E402
+
+
+def test_to_words_array_matches_scalar():
+    """Test vectorized output against to_words"""
+    transformer = NumberTransformer()
+    values = np.array(
+        [0, 1, -5, 21, 101, 1001, 1010, 1234567890, -(10**15), 999_999_999_999],
+        dtype=np.int64,
+    )
+    assert to_words_array(values).tolist() == [
+        transformer.to_words(int(value)) for value in values
+    ]
+
+
+def test_to_words_array_random_and_south():
+    """Test random int64 values with the Southern dictionary"""
+    rng = np.random.default_rng(0)
+    values = rng.integers(-(10**17), 10**17, size=500, dtype=np.int64)
+    transformer = NumberTransformer(SouthDictionary())
+    assert to_words_array(values, SouthDictionary()).tolist() == [
+        transformer.to_words(int(value)) for value in values
+    ]
+
+
+def test_to_words_array_shapes_and_dtypes():
+    """Test shape preservation and non-integer fallback"""
+    result = to_words_array(np.array([[1, 2], [3, 4]], dtype=np.uint16))
+    assert result.shape == (2, 2)
+    assert result[1, 0] == "ba"
+    assert to_words_array(np.array([1.5, 21], dtype=object)).tolist() == [
+        "một phẩy năm",
+        "hai mươi mốt",
+    ]
+    assert to_words_array(np.array([], dtype=np.int64)).tolist() == []
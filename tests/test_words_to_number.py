@@ -1,4 +1,12 @@
-from vn_numberwords import words_to_number, currency_words_to_number
+from random import Random
+
+from vn_numberwords import (
+    SouthDictionary,
+    WordToNumberParser,
+    currency_words_to_number,
+    number_to_words,
+    words_to_number,
+)
 
 
 def test_words_to_number_basic():
@@ -81,7 +89,8 @@ def test_words_to_number_complex():
     )
     assert (
         words_to_number(
-            "mot tram nghin ty khong tram ba muoi tu ty nam tram bon muoi lam trieu bon tram ba muoi lam nghin"
+            "mot tram nghin ty khong tram ba muoi tu ty "
+            "nam tram bon muoi lam trieu bon tram ba muoi lam nghin"
         )
         == 100034545435000
     )
@@ -100,3 +109,172 @@ def test_words_to_number_edge_cases():
     assert words_to_number("không") == 0  # Zero
     assert words_to_number("một trăm lẻ một") == 101  # With "lẻ"
     assert words_to_number("một trăm linh một") == 101  # With "linh"
+
+
+def test_words_to_number_magnitude_stacking():
+    """Test stacked and absorbed magnitude words"""
+    assert words_to_number("một nghìn tỷ") == 1000000000000
+    assert words_to_number("hai nghìn tỷ không trăm ba mươi tỷ") == 2030000000000
+    assert words_to_number("một nghìn hai trăm tỷ") == 1200000000000
+    assert words_to_number("năm trăm triệu tỷ") == 500000000000000000
+    assert words_to_number("một triệu hai trăm nghìn tỷ") == 1200000000000000
+    assert words_to_number("một tỷ tỷ") == 10**18
+    assert words_to_number("nghìn") == 1000
+
+
+def test_words_to_number_round_trip():
+    """Test parsing the words produced by number_to_words"""
+    for number in [0, 7, 15, 105, 1001, 10010, 2000001, 123456789012, 999999999999999]:
+        assert words_to_number(number_to_words(number)) == number
+        assert words_to_number(number_to_words(number, SouthDictionary())) == number
+
+    for number in [10**18 + 1, 10**27, 2 * 10**36 + 3 * 10**27, int("1234567" * 20)]:
+        assert words_to_number(number_to_words(number)) == number
+
+
+def test_parse_cache_hits():
+    """Test the text and token caches of the parser"""
+    parser = WordToNumberParser(cache_size=4)
+    assert parser.parse_words("một trăm nghìn") == 100000
+    assert parser.parse_words("một trăm nghìn") == 100000
+    # Different text with the same tokens skips parsing.
+    assert parser.parse_words("Một trăm, nghìn!") == 100000
+    assert parser.parse_currency_words("năm trăm nghìn đồng") == 500000
+    assert parser.parse_words(["năm", "trăm", "nghìn"]) == 500000
+
+    info = parser.cache_info()
+    assert (info["text"].hits, info["text"].misses) == (1, 3)
+    assert (info["tokens"].hits, info["tokens"].misses) == (3, 2)
+
+    parser.cache_clear()
+    assert parser.cache_info()["tokens"].currsize == 0
+
+
+def test_parse_cache_shared_parsers():
+    """Test the shared parse cache size applies to registry parsers"""
+    from vn_numberwords import (
+        clear_parse_cache,
+        parse_cache_info,
+        set_parse_cache_size,
+    )
+
+    set_parse_cache_size(16)
+    try:
+        clear_parse_cache()
+        assert words_to_number("hai mươi mốt") == 21
+        assert words_to_number("hai mươi mốt") == 21
+        assert parse_cache_info()["text"].hits == 1
+    finally:
+        set_parse_cache_size(None)
+    assert parse_cache_info()["text"].maxsize == 0
+
+
+def test_incremental_parser_matches_parse_words():
+    """Test feeding words one by one matches parse_words"""
+    parser = WordToNumberParser()
+    incremental = parser.incremental()
+    for number in (0, 7, 15, 21, 105, 1005, 210000, 1000000001, 123456789012):
+        words = number_to_words(number).split()
+        values = [incremental.feed(word) for word in words]
+        assert all(can_continue for _, can_continue in values)
+        assert values[-1][0] == parser.parse_words(words) == number
+        assert incremental.finish() == number
+        assert incremental.value == 0
+
+
+def test_incremental_parser_negative_and_stop_words():
+    """Test a minus word and a non-number word fed incrementally"""
+    incremental = WordToNumberParser().incremental()
+    assert incremental.feed("Âm") == (0, True)
+    assert incremental.feed("hai ") == (-2, True)
+    assert incremental.feed("mươi") == (-20, True)
+    # A non-number word ends the phrase without changing the value.
+    assert incremental.feed("con") == (-20, False)
+    assert incremental.feed("âm") == (-20, False)
+    assert incremental.finish() == -20
+
+
+def test_unaccented_and_decomposed_input():
+    """Test unaccented, uppercase and NFD input"""
+    import unicodedata
+
+    from vn_numberwords.core.folding import fold
+
+    assert words_to_number("mot nghin ty") == 1000000000000
+    assert words_to_number("hai ti ba tram linh nam") == 2000000305
+    assert words_to_number("nam chuc ngan") == 50000
+    assert words_to_number("MỘT TRĂM, HAI MƯƠI MỐT!") == 121
+    decomposed = unicodedata.normalize("NFD", "chín trăm nghìn lẻ một")
+    assert words_to_number(decomposed) == 900001
+    assert (
+        fold(decomposed) == fold("chín trăm nghìn lẻ một") == "chin tram nghin le mot"
+    )
+    for number in (15, 21, 1000005, 123456789):
+        text = fold(number_to_words(number, SouthDictionary()))
+        assert words_to_number(text) == number
+
+
+def test_accented_words_are_not_folded_into_number_words():
+    """Test words that only fold to a number word are ignored"""
+    from vn_numberwords import words_to_number_fuzzy
+
+    for text in (
+        "từ hai trăm nghìn",
+        "tôi có hai trăm nghìn",
+        "giá cũ hai trăm nghìn",
+    ):
+        assert words_to_number(text) == 200000
+        assert words_to_number_fuzzy(text) == (200000, ())
+        assert currency_words_to_number(text + " đồng") == 200000
+    # Slang aliases are only recognized with their diacritics.
+    assert words_to_number("ba tỏi") == 3000000000
+    assert words_to_number("toi ba cu") == 3
+    assert words_to_number("tu hai") == 42
+
+
+def test_fuzzy_parse_corrections():
+    """Test misspelled number words are corrected"""
+    from vn_numberwords import words_to_number_fuzzy
+
+    result = words_to_number_fuzzy("hai trăn nghin9 lẻ năm")
+    assert result.value == 200005
+    assert result.corrections == (("trăn", "trăm"), ("nghin9", "nghìn"))
+    assert words_to_number_fuzzy("ba tirệu").value == 3000000
+    assert words_to_number_fuzzy(["bảy", "mưoi"]) == (70, (("mưoi", "mươi"),))
+    assert words_to_number_fuzzy("hai tram9") == (200, (("tram9", "trăm"),))
+    # Exact input needs no correction; unknown short words are dropped.
+    assert words_to_number_fuzzy("mười hai xe") == (12, ())
+
+
+def test_fuzzy_parse_keeps_short_words():
+    """Test that words of up to three characters are never corrected"""
+    from vn_numberwords import words_to_number_fuzzy
+
+    assert words_to_number_fuzzy("một trăm con gà") == (100, ())
+
+
+def test_symmetric_delete_index_matches_brute_force():
+    """Test the index finds the same words as a brute-force search"""
+    from vn_numberwords.core.folding import fold
+    from vn_numberwords.core.fuzzy import edit_distance, max_edit_distance
+
+    parser = WordToNumberParser()
+    index = parser.fuzzy_index()
+    rng = Random(7)
+    letters = "abcdeghiklmnorstuy9"
+    for _ in range(300):
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(1, 7)))
+        limit = max_edit_distance(len(word))
+        # The words are typed without diacritics, so folded words are compared.
+        distances = {
+            candidate: edit_distance(word, fold(candidate))
+            for candidate in index.words
+            if edit_distance(word, fold(candidate))
+            <= min(limit, max_edit_distance(len(candidate)))
+        }
+        expected = (
+            min(distances, key=lambda candidate: (distances[candidate], candidate))
+            if distances
+            else None
+        )
+        assert index.lookup(word) == expected
@@ -1,34 +1,131 @@
-"""vn_numberwords package public API"""
-
-from .core import (
-    DictionaryInterface,
-    NumberTransformer,
-    WordToNumberParser,
-    parse_vietnamese_number,
-    format_number_with_dots,
-)
-from .dictionaries import Dictionary, SouthDictionary
-from .api import (
-    number_to_words,
-    number_to_currency,
-    vietnamese_string_to_words,
-    vietnamese_string_to_currency,
-    words_to_number,
-    currency_words_to_number,
-)
-from .exceptions import (
-    VnNumberWordsError,
-    InvalidNumberError,
-    InvalidWordsError,
-    DictionaryError,
-)
+"""vn_numberwords package public API
+
+Public names are imported lazily on first access, so ``import
+vn_numberwords`` stays cheap for short-lived processes such as the CLI.
+"""
+
+import importlib
+
+# typing is not imported at runtime: it dominates the package import time.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .core.interfaces import DictionaryInterface
+    from .dictionaries import (
+        Dictionary,
+        SouthDictionary,
+        CompiledDictionary,
+        compile_dictionary,
+    )
+    from .core.transformer import NumberTransformer
+    from .core.word_parser import WordToNumberParser, IncrementalParser, ParseResult
+    from .core.utils import (
+        parse_vietnamese_number,
+        format_number_with_dots,
+    )
+    from .api.public import (
+        number_to_words,
+        number_to_currency,
+        vietnamese_string_to_words,
+        vietnamese_string_to_currency,
+        words_to_number,
+        words_to_number_fuzzy,
+        currency_words_to_number,
+        currency_words_to_amount,
+        number_to_words_many,
+        iter_number_to_words,
+        words_to_number_many,
+        iter_words_to_number,
+    )
+    from .core.registry import (
+        set_result_cache_size,
+        result_cache_info,
+        clear_result_cache,
+        set_parse_cache_size,
+        parse_cache_info,
+        clear_parse_cache,
+    )
+    from .core.cache import CacheInfo
+    from .core.currency import (
+        Amount,
+        Currency,
+        get_currency,
+        register_currency,
+    )
+    from .core.columnar import WordsColumn
+    from .core.instrumentation import (
+        Recorder,
+        instrument,
+    )
+    from .scanner import (
+        NumberSpan,
+        find_numbers,
+        iter_number_spans,
+    )
+    from .exceptions import (
+        VnNumberWordsError,
+        InvalidNumberError,
+        InvalidWordsError,
+        DictionaryError,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "DictionaryInterface": ".core.interfaces",
+    "Dictionary": ".dictionaries",
+    "SouthDictionary": ".dictionaries",
+    "CompiledDictionary": ".dictionaries",
+    "compile_dictionary": ".dictionaries",
+    "NumberTransformer": ".core.transformer",
+    "WordToNumberParser": ".core.word_parser",
+    "IncrementalParser": ".core.word_parser",
+    "ParseResult": ".core.word_parser",
+    "parse_vietnamese_number": ".core.utils",
+    "format_number_with_dots": ".core.utils",
+    "number_to_words": ".api.public",
+    "number_to_currency": ".api.public",
+    "vietnamese_string_to_words": ".api.public",
+    "vietnamese_string_to_currency": ".api.public",
+    "words_to_number": ".api.public",
+    "words_to_number_fuzzy": ".api.public",
+    "currency_words_to_number": ".api.public",
+    "currency_words_to_amount": ".api.public",
+    "number_to_words_many": ".api.public",
+    "iter_number_to_words": ".api.public",
+    "words_to_number_many": ".api.public",
+    "iter_words_to_number": ".api.public",
+    "set_result_cache_size": ".core.registry",
+    "result_cache_info": ".core.registry",
+    "clear_result_cache": ".core.registry",
+    "set_parse_cache_size": ".core.registry",
+    "parse_cache_info": ".core.registry",
+    "clear_parse_cache": ".core.registry",
+    "CacheInfo": ".core.cache",
+    "Amount": ".core.currency",
+    "Currency": ".core.currency",
+    "get_currency": ".core.currency",
+    "register_currency": ".core.currency",
+    "WordsColumn": ".core.columnar",
+    "Recorder": ".core.instrumentation",
+    "instrument": ".core.instrumentation",
+    "NumberSpan": ".scanner",
+    "find_numbers": ".scanner",
+    "iter_number_spans": ".scanner",
+    "VnNumberWordsError": ".exceptions",
+    "InvalidNumberError": ".exceptions",
+    "InvalidWordsError": ".exceptions",
+    "DictionaryError": ".exceptions",
+}
 
 __all__ = [
     "DictionaryInterface",
     "Dictionary",
     "SouthDictionary",
+    "CompiledDictionary",
+    "compile_dictionary",
     "NumberTransformer",
     "WordToNumberParser",
+    "IncrementalParser",
+    "ParseResult",
     "parse_vietnamese_number",
     "format_number_with_dots",
     "number_to_words",
@@ -36,7 +133,30 @@ __all__ = [
     "vietnamese_string_to_words",
     "vietnamese_string_to_currency",
     "words_to_number",
+    "words_to_number_fuzzy",
     "currency_words_to_number",
+    "currency_words_to_amount",
+    "number_to_words_many",
+    "iter_number_to_words",
+    "words_to_number_many",
+    "iter_words_to_number",
+    "set_result_cache_size",
+    "result_cache_info",
+    "clear_result_cache",
+    "set_parse_cache_size",
+    "parse_cache_info",
+    "clear_parse_cache",
+    "CacheInfo",
+    "Amount",
+    "Currency",
+    "get_currency",
+    "register_currency",
+    "WordsColumn",
+    "Recorder",
+    "instrument",
+    "NumberSpan",
+    "find_numbers",
+    "iter_number_spans",
     "VnNumberWordsError",
     "InvalidNumberError",
     "InvalidWordsError",
@@ -45,3 +165,16 @@ __all__ = [
 ]
 
 __version__ = "0.2.0"
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,192 @@
+"""asyncio helpers for converting batches inside an event loop.
+
+Work is split into chunks. Without an executor each chunk is converted on the
+loop thread and control is yielded to other tasks between chunks; with a
+``concurrent.futures`` executor (thread or process pool) chunks are converted
+off the loop. Inputs may be plain or asynchronous iterables, so streamed
+request bodies are converted as they arrive.
+"""
+
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .api.public import number_to_words_many as _number_to_words_many
+from .api.public import words_to_number_many as _words_to_number_many
+from .core.interfaces import DictionaryInterface
+from .core.transformer import Number
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+__all__ = [
+    "CHUNK_SIZE",
+    "iter_number_to_words",
+    "iter_words_to_number",
+    "number_to_words_many",
+    "words_to_number_many",
+]
+
+T = TypeVar("T")
+
+# Default number of items converted between two yields to the event loop.
+CHUNK_SIZE = 1024
+
+Words = Union[str, List[str]]
+
+
+async def _chunks(
+    items: Union[Iterable[T], AsyncIterable[T]], chunk_size: int
+) -> AsyncIterator[List[T]]:
+    """Group a plain or asynchronous iterable into lists of ``chunk_size``."""
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size ({chunk_size}) must be positive!")
+
+    chunk: List[T] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _iter_converted(
+    convert: Callable[[List[Any], Optional[DictionaryInterface]], List[Any]],
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    dictionary: Optional[DictionaryInterface],
+    chunk_size: int,
+    executor: Optional["Executor"],
+) -> AsyncIterator[Any]:
+    loop = asyncio.get_running_loop()
+
+    async for chunk in _chunks(items, chunk_size):
+        if executor is None:
+            results = convert(chunk, dictionary)
+            await asyncio.sleep(0)
+        else:
+            results = await loop.run_in_executor(executor, convert, chunk, dictionary)
+        for result in results:
+            yield result
+
+
+def iter_number_to_words(
+    numbers: Union[Iterable[Number], AsyncIterable[Number]],
+    dictionary: Optional[DictionaryInterface] = None,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional["Executor"] = None,
+) -> AsyncIterator[str]:
+    """Asynchronously convert many numbers to Vietnamese words.
+
+    Args:
+        numbers: A plain or asynchronous iterable of numbers.
+        dictionary: Optional custom dictionary for Vietnamese variants; it
+            must be picklable when a process pool is used.
+        chunk_size: Number of items converted between two yields.
+        executor: Optional thread or process pool converting the chunks off
+            the event loop.
+
+    Returns:
+        Async iterator over the Vietnamese words, in input order.
+
+    Raises:
+        InvalidNumberError: If an input is not a valid number.
+        ValueError: If chunk_size is not positive.
+
+    Examples:
+        >>> async def main():
+        ...     return [words async for words in iter_number_to_words([1, 21])]
+        >>> asyncio.run(main())
+        ['một', 'hai mươi mốt']
+    """
+    return _iter_converted(
+        _number_to_words_many, numbers, dictionary, chunk_size, executor
+    )
+
+
+async def number_to_words_many(
+    numbers: Union[Iterable[Number], AsyncIterable[Number]],
+    dictionary: Optional[DictionaryInterface] = None,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional["Executor"] = None,
+) -> List[str]:
+    """Asynchronously convert many numbers to a list of Vietnamese words.
+
+    See ``iter_number_to_words`` for the arguments.
+
+    Examples:
+        >>> asyncio.run(number_to_words_many([5, 1000]))
+        ['năm', 'một nghìn']
+    """
+    return [
+        words
+        async for words in iter_number_to_words(
+            numbers, dictionary, chunk_size, executor
+        )
+    ]
+
+
+def iter_words_to_number(
+    words: Union[Iterable[Words], AsyncIterable[Words]],
+    dictionary: Optional[DictionaryInterface] = None,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional["Executor"] = None,
+) -> AsyncIterator[Union[int, float]]:
+    """Asynchronously convert many Vietnamese phrases to numbers.
+
+    Args:
+        words: A plain or asynchronous iterable of phrases, each a string or
+            list of strings.
+        dictionary: Optional custom dictionary for Vietnamese variants; it
+            must be picklable when a process pool is used.
+        chunk_size: Number of items converted between two yields.
+        executor: Optional thread or process pool converting the chunks off
+            the event loop.
+
+    Returns:
+        Async iterator over the numeric values, in input order.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+    """
+    return _iter_converted(
+        _words_to_number_many, words, dictionary, chunk_size, executor
+    )
+
+
+async def words_to_number_many(
+    words: Union[Iterable[Words], AsyncIterable[Words]],
+    dictionary: Optional[DictionaryInterface] = None,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional["Executor"] = None,
+) -> List[Union[int, float]]:
+    """Asynchronously convert many Vietnamese phrases to a list of numbers.
+
+    See ``iter_words_to_number`` for the arguments.
+
+    Examples:
+        >>> asyncio.run(words_to_number_many(["mười một", "hai mươi"]))
+        [11, 20]
+    """
+    return [
+        value
+        async for value in iter_words_to_number(words, dictionary, chunk_size, executor)
+    ]
@@ -1,10 +1,24 @@
+from ..core.registry import (
+    set_result_cache_size,
+    result_cache_info,
+    clear_result_cache,
+    set_parse_cache_size,
+    parse_cache_info,
+    clear_parse_cache,
+)
 from .public import (
     number_to_words,
     number_to_currency,
     vietnamese_string_to_words,
     vietnamese_string_to_currency,
     words_to_number,
+    words_to_number_fuzzy,
     currency_words_to_number,
+    currency_words_to_amount,
+    number_to_words_many,
+    iter_number_to_words,
+    words_to_number_many,
+    iter_words_to_number,
 )
 
 __all__ = [
@@ -13,5 +27,17 @@ __all__ = [
     "vietnamese_string_to_words",
     "vietnamese_string_to_currency",
     "words_to_number",
+    "words_to_number_fuzzy",
     "currency_words_to_number",
+    "currency_words_to_amount",
+    "number_to_words_many",
+    "iter_number_to_words",
+    "words_to_number_many",
+    "iter_words_to_number",
+    "set_result_cache_size",
+    "result_cache_info",
+    "clear_result_cache",
+    "set_parse_cache_size",
+    "parse_cache_info",
+    "clear_parse_cache",
 ]
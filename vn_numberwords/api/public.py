@@ -1,13 +1,29 @@
-from typing import Union, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    Iterator,
+    Union,
+    List,
+    Optional,
+)
 
 from ..core.interfaces import DictionaryInterface
-from ..core.transformer import NumberTransformer
-from ..core.word_parser import WordToNumberParser
-from ..core.utils import parse_vietnamese_number
+from ..core.registry import (
+    get_parser,
+    get_transformer,
+)
+from ..core.transformer import Number
+from ..core.utils import convert_deduplicated, parse_vietnamese_number
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+    from ..core.currency import Amount, Currency
+    from ..core.word_parser import ParseResult
 
 
 def number_to_words(
-    number: Union[int, float, str], dictionary: Optional[DictionaryInterface] = None
+    number: Number, dictionary: Optional[DictionaryInterface] = None
 ) -> str:
     """Convert a number to Vietnamese words.
 
@@ -15,7 +31,7 @@ def number_to_words(
     trillions. Decimal parts are read digit by digit after "phẩy".
 
     Args:
-        number: The number to convert. Can be int, float, or string.
+        number: The number to convert. Can be int, float, string or Decimal.
         dictionary: Optional custom dictionary for Vietnamese variants
             (e.g., SouthDictionary for Southern Vietnamese).
 
@@ -35,13 +51,12 @@ def number_to_words(
         >>> number_to_words(1000000)
         'một triệu'
     """
-    transformer = NumberTransformer(dictionary)
-    return transformer.to_words(number)
+    return get_transformer(dictionary).to_words(number)
 
 
 def number_to_currency(
-    number: Union[int, float, str],
-    unit: Union[str, List[str]] = "đồng",
+    number: Number,
+    unit: Union[str, List[str], "Currency"] = "đồng",
     dictionary: Optional[DictionaryInterface] = None,
 ) -> str:
     """Convert a number to Vietnamese currency words.
@@ -51,8 +66,9 @@ def number_to_currency(
 
     Args:
         number: The currency amount to convert.
-        unit: Currency unit(s). Can be a single string (e.g., "đồng") or
-            a list of [main_unit, decimal_unit] (e.g., ["đô la", "xu"]).
+        unit: Currency unit(s). Can be a single string (e.g., "đồng"),
+            a list of [main_unit, decimal_unit] (e.g., ["đô la", "xu"]) or
+            a registered Currency (e.g., ``get_currency("USD")``).
         dictionary: Optional custom dictionary for Vietnamese variants.
 
     Returns:
@@ -69,8 +85,7 @@ def number_to_currency(
         >>> number_to_currency(100, "USD")
         'một trăm USD'
     """
-    transformer = NumberTransformer(dictionary)
-    return transformer.to_currency(number, unit)
+    return get_transformer(dictionary).to_currency(number, unit)
 
 
 def vietnamese_string_to_words(
@@ -157,15 +172,37 @@ def words_to_number(
         >>> words_to_number(["hai", "mươi", "mốt"])
         21
     """
-    parser = WordToNumberParser(dictionary)
-    return parser.parse_words(words)
+    return get_parser(dictionary).parse_words(words)
+
+
+def words_to_number_fuzzy(
+    words: Union[str, List[str]], dictionary: Optional[DictionaryInterface] = None
+) -> "ParseResult":
+    """Convert noisy Vietnamese words to number, correcting typos.
+
+    Misspelled number words, e.g. from OCR or speech recognition, are
+    replaced by the nearest number word; see
+    ``WordToNumberParser.parse_words_fuzzy``.
+
+    Args:
+        words: Vietnamese words as a string or list of strings.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        ParseResult with the value and the ``(word, correction)`` pairs.
+
+    Examples:
+        >>> words_to_number_fuzzy("một triêu hai trăn nghìn")
+        ParseResult(value=1200000, corrections=(('triêu', 'triệu'), ('trăn', 'trăm')))
+    """
+    return get_parser(dictionary).parse_words_fuzzy(words)
 
 
 def currency_words_to_number(
     words: Union[str, List[str]],
-    currency_unit: str = "đồng",
+    currency_unit: Union[str, "Currency"] = "đồng",
     dictionary: Optional[DictionaryInterface] = None,
-) -> Union[int, float]:
+) -> Union[int, float, "Decimal"]:
     """Convert Vietnamese currency words to number.
 
     Parses Vietnamese currency text and extracts the numeric value.
@@ -176,7 +213,8 @@ def currency_words_to_number(
         dictionary: Optional custom dictionary for Vietnamese variants.
 
     Returns:
-        The numeric value as int or float.
+        The numeric value as int or float, or as an exact ``Decimal`` when a
+        ``Currency`` is given and minor units are spelled out.
 
     Raises:
         InvalidWordsError: If the words cannot be parsed.
@@ -187,5 +225,135 @@ def currency_words_to_number(
         >>> currency_words_to_number("năm trăm triệu đồng")
         500000000
     """
-    parser = WordToNumberParser(dictionary)
-    return parser.parse_currency_words(words, currency_unit)
+    return get_parser(dictionary).parse_currency_words(words, currency_unit)
+
+
+def currency_words_to_amount(
+    words: Union[str, List[str]], dictionary: Optional[DictionaryInterface] = None
+) -> "Amount":
+    """Convert Vietnamese currency words in any registered currency to an amount.
+
+    Unit names of every registered currency, including multi-word names
+    and aliases, are recognized in a single pass.
+
+    Args:
+        words: Vietnamese currency words as string or list of strings.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        Amount with the value in major units and the currency found.
+
+    Raises:
+        InvalidWordsError: If the minor unit does not belong to the
+            currency of the major unit.
+
+    Examples:
+        >>> amount = currency_words_to_amount("hai bảng anh năm mươi xu")
+        >>> amount.value, amount.currency.code
+        (Decimal('2.50'), 'GBP')
+    """
+    return get_parser(dictionary).parse_amount(words)
+
+
+def iter_number_to_words(
+    numbers: Iterable[Number],
+    dictionary: Optional[DictionaryInterface] = None,
+) -> Iterator[str]:
+    """Lazily convert many numbers to Vietnamese words.
+
+    Uses one shared transformer for the whole batch and converts each
+    distinct value only once.
+
+    Args:
+        numbers: Any iterable of numbers (int, float, string or Decimal).
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        Iterator over the Vietnamese words, in input order.
+
+    Raises:
+        InvalidNumberError: If an input is not a valid number.
+
+    Examples:
+        >>> list(iter_number_to_words([1, 2, 1]))
+        ['một', 'hai', 'một']
+    """
+    return convert_deduplicated(get_transformer(dictionary).to_words, numbers)
+
+
+def number_to_words_many(
+    numbers: Iterable[Number],
+    dictionary: Optional[DictionaryInterface] = None,
+) -> List[str]:
+    """Convert many numbers to Vietnamese words.
+
+    Uses one shared transformer for the whole batch and converts each
+    distinct value only once. When every input is an ``int`` the per-item
+    type dispatch is skipped.
+
+    Args:
+        numbers: Any iterable of numbers (int, float, string or Decimal).
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        List of Vietnamese words, in input order.
+
+    Raises:
+        InvalidNumberError: If an input is not a valid number.
+
+    Examples:
+        >>> number_to_words_many([21, 1.5, 21])
+        ['hai mươi mốt', 'một phẩy năm', 'hai mươi mốt']
+    """
+    transformer = get_transformer(dictionary)
+    items = numbers if isinstance(numbers, list) else list(numbers)
+
+    if all(type(number) is int for number in items):
+        return list(convert_deduplicated(transformer.int_to_words, items, typed=False))
+    return list(convert_deduplicated(transformer.to_words, items))
+
+
+def iter_words_to_number(
+    words: Iterable[Union[str, List[str]]],
+    dictionary: Optional[DictionaryInterface] = None,
+) -> Iterator[Union[int, float]]:
+    """Lazily convert many Vietnamese phrases to numbers.
+
+    Uses one shared parser for the whole batch and parses each distinct
+    phrase only once.
+
+    Args:
+        words: Any iterable of phrases, each a string or list of strings.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        Iterator over the numeric values, in input order.
+
+    Examples:
+        >>> list(iter_words_to_number(["mười một", "hai mươi"]))
+        [11, 20]
+    """
+    return convert_deduplicated(get_parser(dictionary).parse_words, words, False)
+
+
+def words_to_number_many(
+    words: Iterable[Union[str, List[str]]],
+    dictionary: Optional[DictionaryInterface] = None,
+) -> List[Union[int, float]]:
+    """Convert many Vietnamese phrases to numbers.
+
+    Uses one shared parser for the whole batch and parses each distinct
+    phrase only once.
+
+    Args:
+        words: Any iterable of phrases, each a string or list of strings.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        List of numeric values, in input order.
+
+    Examples:
+        >>> words_to_number_many(["một trăm", "mot tram", "một trăm"])
+        [100, 100, 100]
+    """
+    return list(iter_words_to_number(words, dictionary))
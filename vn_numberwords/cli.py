@@ -1,24 +1,153 @@
 import argparse
+import sys
 from typing import Optional
-from . import number_to_words, number_to_currency, SouthDictionary
 from .core.interfaces import DictionaryInterface
+from .dictionaries import SouthDictionary
+from .exceptions import VnNumberWordsError
+
+
+def stream(
+    source: Optional[str],
+    reverse: bool,
+    currency: Optional[str],
+    dictionary: Optional[DictionaryInterface],
+) -> int:
+    """Convert ``source`` (a path, or stdin for None/"-") line by line to stdout.
+
+    Returns:
+        Process exit status.
+    """
+    # Imported here: converting a single argument does not need it.
+    from .stream import IO_BUFFER_SIZE, convert_lines
+
+    if source is None or source == "-":
+        infile = open(
+            sys.stdin.fileno(),
+            encoding="utf-8",
+            buffering=IO_BUFFER_SIZE,
+            closefd=False,
+        )
+    else:
+        infile = open(source, encoding="utf-8", buffering=IO_BUFFER_SIZE)
+    outfile = open(
+        sys.stdout.fileno(),
+        "w",
+        encoding="utf-8",
+        buffering=IO_BUFFER_SIZE,
+        closefd=False,
+    )
+    line_number = 0
+
+    with infile, outfile:
+        try:
+            for line_number, result in enumerate(
+                convert_lines(infile, reverse, currency, dictionary), 1
+            ):
+                outfile.write(result)
+                outfile.write("\n")
+        except (VnNumberWordsError, ValueError) as e:
+            outfile.flush()
+            print(f"line {line_number + 1}: {e}", file=sys.stderr)
+            return 1
+
+    return 0
+
+
+def stream_parallel(
+    source: str,
+    workers: int,
+    reverse: bool,
+    currency: Optional[str],
+    dictionary: Optional[DictionaryInterface],
+) -> int:
+    """Convert the file ``source`` to stdout using ``workers`` processes.
+
+    Returns:
+        Process exit status.
+    """
+    # Imported here: multiprocessing is slow to load and only needed with -w.
+    from .parallel import convert_file
+
+    sys.stdout.flush()
+    try:
+        convert_file(source, sys.stdout.buffer, workers, reverse, currency, dictionary)
+    except (VnNumberWordsError, ValueError) as e:
+        sys.stdout.buffer.flush()
+        print(e, file=sys.stderr)
+        return 1
+    sys.stdout.buffer.flush()
+    return 0
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Vietnamese number to words")
-    parser.add_argument("number", help="Number or VN formatted string (e.g. 1.234.56)")
+    parser.add_argument(
+        "number",
+        nargs="?",
+        help="Number or VN formatted string (e.g. 1.234.56); "
+        "omit to stream lines from stdin",
+    )
     parser.add_argument("--currency", "-c", help="Currency unit (e.g. đồng)")
     parser.add_argument("--south", action="store_true", help="Use Southern dictionary")
+    parser.add_argument(
+        "--reverse",
+        "-r",
+        action="store_true",
+        help="Convert Vietnamese words to numbers",
+    )
+    parser.add_argument(
+        "--input",
+        "-i",
+        metavar="FILE",
+        help="Stream values line by line from FILE ('-' for stdin)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Convert --input FILE with N worker processes",
+    )
     args = parser.parse_args()
 
     dictionary: Optional[DictionaryInterface] = (
         SouthDictionary() if args.south else None
     )
 
+    if args.number is None or args.input is not None:
+        if args.number is not None:
+            parser.error("cannot combine a positional number with --input")
+        if args.workers > 1:
+            if args.input is None or args.input == "-":
+                parser.error("--workers requires --input FILE")
+            sys.exit(
+                stream_parallel(
+                    args.input, args.workers, args.reverse, args.currency, dictionary
+                )
+            )
+        sys.exit(stream(args.input, args.reverse, args.currency, dictionary))
+
+    if args.reverse:
+        # Imported here: converting numbers to words does not need the parser.
+        from .core.word_parser import WordToNumberParser
+
+        words_parser = WordToNumberParser(dictionary)
+        if args.currency:
+            print(words_parser.parse_currency_words(args.number, args.currency))
+        else:
+            print(words_parser.parse_words(args.number))
+        return
+
+    # One value is converted once: a private transformer avoids loading the
+    # shared registry and the batch API.
+    from .core.transformer import NumberTransformer
+
+    transformer = NumberTransformer(dictionary)
     if args.currency:
-        print(number_to_currency(args.number, args.currency, dictionary))
+        print(transformer.to_currency(args.number, args.currency))
     else:
-        print(number_to_words(args.number, dictionary))
+        print(transformer.to_words(args.number))
 
 
 if __name__ == "__main__":
@@ -1,14 +1,109 @@
-"""Core primitives: interfaces, transformer, utils"""
+"""Core primitives: interfaces, transformer, utils
 
-from .interfaces import DictionaryInterface
-from .transformer import NumberTransformer
-from .word_parser import WordToNumberParser
-from .utils import parse_vietnamese_number, format_number_with_dots
+Public names are imported lazily on first access, so ``import
+vn_numberwords.core`` stays cheap for short-lived processes such as the CLI.
+"""
+
+import importlib
+
+# typing is not imported at runtime: it dominates the package import time.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .interfaces import DictionaryInterface
+    from .transformer import NumberTransformer
+    from .word_parser import WordToNumberParser, IncrementalParser, ParseResult
+    from .utils import (
+        parse_vietnamese_number,
+        format_number_with_dots,
+    )
+    from .cache import CacheInfo
+    from .currency import (
+        Amount,
+        Currency,
+        get_currency,
+        register_currency,
+    )
+    from .columnar import WordsColumn
+    from .instrumentation import (
+        Recorder,
+        instrument,
+    )
+    from .registry import (
+        get_transformer,
+        get_parser,
+        clear_registry,
+        set_result_cache_size,
+        result_cache_info,
+        clear_result_cache,
+        set_parse_cache_size,
+        parse_cache_info,
+        clear_parse_cache,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "DictionaryInterface": ".interfaces",
+    "NumberTransformer": ".transformer",
+    "WordToNumberParser": ".word_parser",
+    "IncrementalParser": ".word_parser",
+    "ParseResult": ".word_parser",
+    "parse_vietnamese_number": ".utils",
+    "format_number_with_dots": ".utils",
+    "CacheInfo": ".cache",
+    "Amount": ".currency",
+    "Currency": ".currency",
+    "get_currency": ".currency",
+    "register_currency": ".currency",
+    "WordsColumn": ".columnar",
+    "Recorder": ".instrumentation",
+    "instrument": ".instrumentation",
+    "get_transformer": ".registry",
+    "get_parser": ".registry",
+    "clear_registry": ".registry",
+    "set_result_cache_size": ".registry",
+    "result_cache_info": ".registry",
+    "clear_result_cache": ".registry",
+    "set_parse_cache_size": ".registry",
+    "parse_cache_info": ".registry",
+    "clear_parse_cache": ".registry",
+}
 
 __all__ = [
     "DictionaryInterface",
     "NumberTransformer",
     "WordToNumberParser",
+    "IncrementalParser",
+    "ParseResult",
     "parse_vietnamese_number",
     "format_number_with_dots",
+    "get_transformer",
+    "get_parser",
+    "clear_registry",
+    "CacheInfo",
+    "Amount",
+    "Currency",
+    "get_currency",
+    "register_currency",
+    "WordsColumn",
+    "Recorder",
+    "instrument",
+    "set_result_cache_size",
+    "result_cache_info",
+    "clear_result_cache",
+    "set_parse_cache_size",
+    "parse_cache_info",
+    "clear_parse_cache",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,81 @@
+"""Bounded, thread-safe LRU cache with hit/miss statistics."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, mirroring ``functools.lru_cache``'s ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Mapping of at most ``maxsize`` entries, evicting the least recently used."""
+
+    __slots__ = ("maxsize", "hits", "misses", "_data", "_lock")
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept; must be positive.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError(f"Cache size ({maxsize}) must be positive!")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value cached for ``key``, or None on a miss.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if the key is not cached.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry when full.
+
+        Args:
+            key: The cache key.
+            value: The value to cache; must not be None.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """Return the current cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
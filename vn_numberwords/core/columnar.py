@@ -0,0 +1,148 @@
+"""Columnar batch output: UTF-8 words in one buffer plus offsets."""
+
+from array import array
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Tuple, Union, overload
+
+from .transformer import GROUP_POWERS
+
+if TYPE_CHECKING:
+    from .transformer import NumberTransformer
+
+
+class WordsColumn:
+    """A batch of strings stored as one UTF-8 buffer and int64 offsets.
+
+    String ``i`` is ``data[offsets[i]:offsets[i + 1]]``, which is the layout
+    of an Arrow ``large_string`` column, so the buffers can be handed to
+    Arrow, Parquet writers or shared memory without creating one Python
+    ``str`` per row.
+
+    Attributes:
+        data: The concatenated UTF-8 bytes of every string.
+        offsets: ``len(self) + 1`` offsets into ``data``, starting at 0.
+
+    Examples:
+        >>> column = WordsColumn()
+        >>> column.append(b"hai")
+        >>> column.append("một".encode())
+        >>> len(column), column[1], column.offsets.tolist()
+        (2, 'một', [0, 3, 8])
+    """
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+
+    def append(self, encoded: bytes) -> None:
+        """Append one already encoded string."""
+        self.data += encoded
+        self.offsets.append(len(self.data))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("WordsColumn index out of range")
+        offsets = self.offsets
+        return self.data[offsets[index] : offsets[index + 1]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        data = self.data
+        offsets = self.offsets
+        for index in range(len(self)):
+            yield data[offsets[index] : offsets[index + 1]].decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, nbytes={self.nbytes})"
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the data and offsets buffers in bytes."""
+        return len(self.data) + len(self.offsets) * self.offsets.itemsize
+
+    def data_view(self) -> memoryview:
+        """Return a zero-copy view of the UTF-8 data buffer."""
+        return memoryview(self.data)
+
+    def offsets_view(self) -> memoryview:
+        """Return a zero-copy view of the int64 offsets buffer."""
+        return memoryview(self.offsets)
+
+    def buffers(self) -> Tuple[memoryview, memoryview]:
+        """Return ``(offsets, data)`` views, in Arrow buffer order."""
+        return self.offsets_view(), self.data_view()
+
+    def tolist(self) -> List[str]:
+        """Decode every row into a list of ``str``."""
+        return list(self)
+
+
+def render_column(
+    transformer: "NumberTransformer", numbers: Iterable[Any]
+) -> WordsColumn:
+    """Render a batch of numbers straight into a ``WordsColumn``.
+
+    Integers are assembled from the transformer's encoded triplet table;
+    other values go through ``to_words``. This is the implementation of
+    ``NumberTransformer.to_words_column``.
+    """
+    table = transformer.encoded_triplet_table()
+    compiled = transformer.compiled
+    separator = compiled.separator_word.encode("utf-8")
+    zero = compiled.zero_word.encode("utf-8")
+    minus = compiled.minus_word.encode("utf-8") + separator
+    # exponents[power]: separator and magnitude word, or b"" for none, for
+    # powers up to GROUP_POWERS.
+    exponents: List[bytes] = []
+
+    column = WordsColumn()
+    data = column.data
+    offsets = column.offsets
+
+    for number in numbers:
+        if type(number) is not int:
+            data += transformer.to_words(number).encode("utf-8")
+            offsets.append(len(data))
+            continue
+
+        if number < 0:
+            data += minus
+            number = -number
+
+        triplets = transformer.number_to_triplets(number)
+        while len(exponents) < min(len(triplets), GROUP_POWERS + 1):
+            exponent = transformer.get_exponent(len(exponents))
+            exponents.append(separator + exponent.encode("utf-8") if exponent else b"")
+
+        if not triplets:
+            data += zero
+        else:
+            last = len(triplets) - 1
+            written = False
+            for pos, triplet in enumerate(triplets):
+                power = last - pos
+                if triplet:
+                    if written:
+                        data += separator
+                    data += table[pos == 0][triplet]
+                    data += exponents[power % GROUP_POWERS]
+                    written = True
+                if power and not power % GROUP_POWERS:
+                    data += exponents[GROUP_POWERS]
+
+        offsets.append(len(data))
+
+    return column
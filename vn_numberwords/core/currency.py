@@ -0,0 +1,227 @@
+"""Registry of currencies and a trie matching their Vietnamese unit names.
+
+Every ``Currency`` has a major unit, an optional minor unit and aliases. The
+``UnitMatcher`` trie finds the longest unit name starting at any token in a
+single lookup walk, whatever the number of registered currencies. Names are
+matched as written ("Đô la", "đô-la"); their folded forms (see
+``folding.fold``) only match text written without diacritics ("do la"), as
+folding merges unrelated words such as "đô" and "do".
+"""
+
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .folding import fold, normalize
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+
+class Currency(NamedTuple):
+    """A currency and its Vietnamese unit names.
+
+    Attributes:
+        code: ISO 4217 code, e.g. ``"USD"``.
+        major: Name of the major unit, e.g. ``"đô la"``.
+        minor: Name of the minor unit, e.g. ``"xu"``, or None.
+        aliases: Other names of the major unit.
+        decimals: Number of minor-unit digits (2 for cents, 0 for none).
+    """
+
+    code: str
+    major: str
+    minor: Optional[str] = None
+    aliases: Tuple[str, ...] = ()
+    decimals: int = 2
+
+
+class Amount(NamedTuple):
+    """A parsed amount of money.
+
+    Attributes:
+        value: The amount in major units: an int for whole amounts, or an
+            exact ``Decimal`` when minor units were given, e.g.
+            ``Decimal("1.50")`` for "một đô la năm mươi xu".
+        currency: The recognized currency, or None when no unit was found.
+    """
+
+    value: Union[int, "Decimal"]
+    currency: Optional[Currency]
+
+
+class UnitMatch(NamedTuple):
+    """A unit name found in a token sequence.
+
+    Attributes:
+        end: Index just past the last token of the unit name.
+        currencies: Currencies having this name, in registration order.
+        is_minor: Whether the name is a minor unit.
+    """
+
+    end: int
+    currencies: Tuple[Currency, ...]
+    is_minor: bool
+
+
+# Key marking the end of a unit name in a trie node; tokens are never empty.
+_END = ""
+
+
+class UnitMatcher:
+    """Trie over the tokens of every unit name of some currencies.
+
+    Each name is added as written and in its folded form, to two separate
+    tries; ``match`` walks one or the other.
+
+    Args:
+        currencies: The currencies whose major units, aliases and minor
+            units are recognized.
+
+    Examples:
+        >>> matcher = UnitMatcher(CURRENCIES.values())
+        >>> match = matcher.match("một đô la úc".split(), 1)
+        >>> match.end, match.currencies[0].code, match.is_minor
+        (4, 'AUD', False)
+        >>> matcher.match("mot do la uc".split(), 1, unaccented=True).end
+        4
+    """
+
+    def __init__(self, currencies: Iterable[Currency]):
+        self._written: Dict[str, Any] = {}
+        self._folded: Dict[str, Any] = {}
+        for currency in currencies:
+            for name in (currency.major, *currency.aliases):
+                self._add(name, currency, False)
+            if currency.minor:
+                self._add(currency.minor, currency, True)
+
+    def _add(self, name: str, currency: Currency, is_minor: bool) -> None:
+        for root, tokens in (
+            (self._written, normalize(name).split()),
+            (self._folded, fold(name).split()),
+        ):
+            node = root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            entries = node.setdefault(_END, {})
+            entries.setdefault(is_minor, []).append(currency)
+
+    def match(
+        self, tokens: Sequence[str], start: int, unaccented: bool = False
+    ) -> Optional[UnitMatch]:
+        """Return the longest unit name starting at ``tokens[start]``.
+
+        Args:
+            tokens: Normalized tokens (see ``folding.normalize``).
+            start: Index of the first token to match.
+            unaccented: Whether the text is written without diacritics, in
+                which case the folded unit names are matched.
+
+        Returns:
+            The match, or None when no unit name starts there. A name that
+            is both a major and a minor unit matches as a major unit.
+        """
+        node = self._folded if unaccented else self._written
+        found: Optional[UnitMatch] = None
+
+        for pos in range(start, len(tokens)):
+            child = node.get(tokens[pos])
+            if child is None:
+                break
+            node = child
+            entries = node.get(_END)
+            if entries is not None:
+                is_minor = False not in entries
+                found = UnitMatch(pos + 1, tuple(entries[is_minor]), is_minor)
+
+        return found
+
+
+# Built-in currencies, in lookup priority order: when several share a unit
+# name ("xu"), the first registered one is preferred.
+CURRENCIES: Dict[str, Currency] = {
+    currency.code: currency
+    for currency in (
+        Currency("VND", "đồng", None, ("việt nam đồng", "vnd", "vnđ"), 0),
+        Currency("USD", "đô la", "xu", ("đô la mỹ", "đô", "usd")),
+        Currency("EUR", "euro", "xu", ("ơ rô", "eur")),
+        Currency("JPY", "yên", None, ("yên nhật", "jpy"), 0),
+        Currency("GBP", "bảng anh", "xu", ("bảng", "gbp")),
+        Currency("CNY", "nhân dân tệ", "xu", ("tệ", "cny")),
+        Currency("KRW", "won", None, ("won hàn quốc", "krw"), 0),
+        Currency("THB", "bạt", "xa tăng", ("baht", "thb")),
+        Currency("SGD", "đô la singapore", "xu", ("sgd",)),
+        Currency("AUD", "đô la úc", "xu", ("aud",)),
+        Currency("CAD", "đô la canada", "xu", ("cad",)),
+        Currency("HKD", "đô la hồng kông", "xu", ("hkd",)),
+        Currency("TWD", "đô la đài loan", "xu", ("tân đài tệ", "twd")),
+        Currency("CHF", "franc thụy sĩ", "xu", ("chf",)),
+        Currency("LAK", "kíp", "át", ("kip lào", "lak")),
+        Currency("KHR", "riel", "sen", ("khr",)),
+        Currency("MYR", "ringgit", "sen", ("myr",)),
+        Currency("IDR", "rupiah", "sen", ("idr",)),
+        Currency("PHP", "peso", "xu", ("peso philippines", "php")),
+        Currency("INR", "rupee", "paisa", ("rupi", "inr")),
+        Currency("RUB", "rúp", "kopek", ("rub",)),
+    )
+}
+
+_lock = threading.Lock()
+_matcher: Optional[UnitMatcher] = None
+
+
+def register_currency(currency: Currency) -> None:
+    """Add a currency, or replace the registered one with the same code.
+
+    Args:
+        currency: The currency to register, e.g.
+            ``Currency("XAU", "lượng vàng", None, ("cây vàng",), 0)``.
+    """
+    global _matcher
+    with _lock:
+        CURRENCIES[currency.code.upper()] = currency
+        _matcher = None
+
+
+def get_currency(code: str) -> Currency:
+    """Return the registered currency with the ISO 4217 ``code``.
+
+    Raises:
+        KeyError: If no currency has that code.
+
+    Examples:
+        >>> get_currency("usd")  # doctest: +NORMALIZE_WHITESPACE
+        Currency(code='USD', major='đô la', minor='xu',
+                 aliases=('đô la mỹ', 'đô', 'usd'), decimals=2)
+    """
+    return CURRENCIES[code.upper()]
+
+
+def unit_matcher() -> UnitMatcher:
+    """Return the trie of every registered currency, rebuilt after changes."""
+    global _matcher
+    matcher = _matcher
+    if matcher is None:
+        with _lock:
+            if _matcher is None:
+                _matcher = UnitMatcher(CURRENCIES.values())
+            matcher = _matcher
+    return matcher
+
+
+def currency_units(currency: Currency) -> List[str]:
+    """Return ``[major]`` or ``[major, minor]``, the units used to spell amounts."""
+    if currency.minor and currency.decimals:
+        return [currency.major, currency.minor]
+    return [currency.major]
@@ -0,0 +1,155 @@
+"""Typo correction for number words with a symmetric-delete index.
+
+Instead of comparing an unknown word against every vocabulary word, the
+index stores every string obtained by deleting up to two characters from
+each vocabulary word (the SymSpell approach). A lookup generates the deletes
+of the unknown word and looks them up in the index, so its cost depends on
+the length of the word, not on the size of the vocabulary. The few candidates
+found are then ranked by their true edit distance.
+
+The vocabulary holds accented words, and corrections are always accented.
+A word typed without diacritics is compared with the folded vocabulary
+words (see ``folding.fold``), so "tram9" is still corrected to "trăm".
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from .folding import fold
+
+# Lookups are memoized per index until this many distinct words were seen.
+LOOKUP_MEMO_LIMIT = 4096
+
+
+def max_edit_distance(length: int) -> int:
+    """Return how many edits are tolerated in a word of ``length`` characters.
+
+    Short words are too easily confused ("ba", "hai", "tư", and "con" with
+    "bốn" folded), so words of up to three characters must match exactly,
+    words of four may have one edit and longer words two.
+    """
+    if length <= 3:
+        return 0
+    if length <= 4:
+        return 1
+    return 2
+
+
+def _deletes(word: str, distance: int) -> Iterator[str]:
+    """Yield ``word`` and every string made by deleting up to ``distance`` chars."""
+    seen = {word}
+    frontier = [word]
+    yield word
+    for _ in range(distance):
+        following = []
+        for current in frontier:
+            for pos in range(len(current)):
+                deleted = current[:pos] + current[pos + 1 :]
+                if deleted not in seen:
+                    seen.add(deleted)
+                    following.append(deleted)
+                    yield deleted
+        frontier = following
+
+
+def edit_distance(first: str, second: str) -> int:
+    """Return the optimal string alignment distance between two words.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each count as one edit.
+
+    Examples:
+        >>> edit_distance("trăn", "trăm"), edit_distance("tirêu", "triêu")
+        (1, 1)
+    """
+    previous2: List[int] = []
+    previous = list(range(len(second) + 1))
+
+    for i, char in enumerate(first, 1):
+        current = [i]
+        for j, other in enumerate(second, 1):
+            cost = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char != other),
+            )
+            if i > 1 and j > 1 and char == second[j - 2] and first[i - 2] == other:
+                cost = min(cost, previous2[j - 2] + 1)
+            current.append(cost)
+        previous2, previous = previous, current
+
+    return previous[-1]
+
+
+class SymmetricDeleteIndex:
+    """Nearest-word lookup over a fixed vocabulary within a small edit distance.
+
+    Args:
+        vocabulary: The correctly spelled, accented words.
+
+    Examples:
+        >>> index = SymmetricDeleteIndex(["trăm", "triệu", "nghìn"])
+        >>> index.lookup("trăn"), index.lookup("nghin9"), index.lookup("xe")
+        ('trăm', 'nghìn', None)
+    """
+
+    def __init__(self, vocabulary: Iterable[str]):
+        self.words = frozenset(vocabulary)
+        self._deletes: Dict[str, Set[str]] = {}
+        for word in self.words:
+            for form in {word, fold(word)}:
+                for deleted in _deletes(form, max_edit_distance(len(form))):
+                    self._deletes.setdefault(deleted, set()).add(word)
+        self._memo: Dict[str, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._deletes)
+
+    def lookup(self, word: str) -> Optional[str]:
+        """Return the closest vocabulary word, or None when none is close enough.
+
+        A candidate is accepted when its distance to ``word`` is within
+        ``max_edit_distance`` of both words' lengths. Words without
+        diacritics are compared with the folded candidates. Ties go to the
+        candidate closest once both are folded, then alphabetically, so
+        results are deterministic.
+
+        Args:
+            word: The word to correct.
+
+        Returns:
+            ``word`` itself if it is in the vocabulary, the nearest word
+            otherwise, or None.
+        """
+        if word in self.words:
+            return word
+        try:
+            return self._memo[word]
+        except KeyError:
+            pass
+
+        folded = fold(word)
+        unaccented = folded == word
+        limit = max_edit_distance(len(word))
+        best: Optional[str] = None
+        best_rank = (limit + 1, 0)
+        index = self._deletes
+
+        candidates: Set[str] = set()
+        for deleted in _deletes(word, limit):
+            candidates.update(index.get(deleted, ()))
+
+        for candidate in candidates:
+            folded_distance = edit_distance(folded, fold(candidate))
+            distance = folded_distance if unaccented else edit_distance(word, candidate)
+            if distance > min(limit, max_edit_distance(len(candidate))):
+                continue
+            rank = (distance, folded_distance)
+            if rank < best_rank or (
+                rank == best_rank and best is not None and candidate < best
+            ):
+                best = candidate
+                best_rank = rank
+
+        if len(self._memo) < LOOKUP_MEMO_LIMIT:
+            self._memo[word] = best
+        return best
@@ -0,0 +1,97 @@
+"""Opt-in, per-stage call counts and timings for the transformer and parser.
+
+Instrumented code checks the module-level ``recorder`` once per stage and
+only times the stage when a recorder is installed, so the disabled cost is a
+single attribute lookup.
+
+Stages recorded:
+
+- ``transformer.resolve_number``: validating and splitting the input number.
+- ``transformer.render_triplets``: rendering the integer and fraction words.
+- ``transformer.collapse_words``: joining the words into the result.
+- ``parser.normalize_text``: lowercasing and stripping punctuation.
+- ``parser.split_words``: splitting and filtering the words.
+- ``parser.parse_segments``: folding the words into a value.
+"""
+
+import _thread
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Recorder:
+    """Thread-safe accumulator of call counts and cumulative seconds per stage."""
+
+    def __init__(self) -> None:
+        self._stages: Dict[str, List[Any]] = {}
+        # A low-level lock, so that importing this module stays cheap.
+        self._lock = _thread.allocate_lock()
+
+    def call(self, stage: str, function: Callable[[Any], T], arg: Any) -> T:
+        """Call ``function(arg)`` and record its duration under ``stage``."""
+        start = time.perf_counter()
+        try:
+            return function(arg)
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Add one call of ``seconds`` to ``stage``."""
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                self._stages[stage] = [1, seconds]
+            else:
+                stats[0] += 1
+                stats[1] += seconds
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return ``{stage: {"calls": int, "seconds": float}}``."""
+        with self._lock:
+            return {
+                stage: {"calls": calls, "seconds": seconds}
+                for stage, (calls, seconds) in self._stages.items()
+            }
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._stages.clear()
+
+
+# The installed recorder; None disables instrumentation.
+recorder: Optional[Recorder] = None
+
+
+class instrument:
+    """Record stage timings of every transformer and parser inside a block.
+
+    The recorder is process-wide, so calls from other threads are recorded
+    too. The previously installed recorder is restored on exit.
+
+    Args:
+        target: Recorder to add to; a new one is created if omitted.
+
+    Examples:
+        >>> from vn_numberwords import NumberTransformer
+        >>> with instrument() as stats:
+        ...     _ = NumberTransformer().to_words("1.5")
+        >>> stats.as_dict()["transformer.resolve_number"]["calls"]
+        1
+    """
+
+    def __init__(self, target: Optional[Recorder] = None):
+        self.recorder = target if target is not None else Recorder()
+        self._previous: Optional[Recorder] = None
+
+    def __enter__(self) -> Recorder:
+        global recorder
+        self._previous = recorder
+        recorder = self.recorder
+        return self.recorder
+
+    def __exit__(self, *exc_info: Any) -> None:
+        global recorder
+        recorder = self._previous
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 class DictionaryInterface(ABC):
     """Interface for Vietnamese number dictionary"""
 
+    __slots__ = ()
+
     @abstractmethod
     def zero(self) -> str:
         """Return the word for zero.
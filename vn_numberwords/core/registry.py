@@ -0,0 +1,215 @@
+"""Shared, thread-safe registry of warm transformer and parser instances."""
+
+import _thread
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .interfaces import DictionaryInterface
+from .transformer import NumberTransformer
+
+if TYPE_CHECKING:
+    from .cache import CacheInfo
+    from .word_parser import WordToNumberParser
+
+T = TypeVar("T")
+
+# A low-level lock, so that one-off conversions do not load ``threading``.
+_lock = _thread.allocate_lock()
+_by_type: Dict[Tuple[Hashable, type], Any] = {}
+_result_cache_size: Optional[int] = None
+_parse_cache_size: Optional[int] = None
+
+
+def _is_stateless(dictionary: DictionaryInterface) -> bool:
+    """Whether instances of the dictionary's type are interchangeable."""
+    if getattr(dictionary, "__dict__", None):
+        return False
+    return not any(getattr(cls, "__slots__", ()) for cls in type(dictionary).__mro__)
+
+
+def _get_instance(
+    kind: Hashable,
+    dictionary: Optional[DictionaryInterface],
+    factory: Callable[[Optional[DictionaryInterface]], T],
+) -> T:
+    """Return the shared instance of ``kind`` for ``dictionary``.
+
+    Dictionaries without instance state (such as the built-in ``Dictionary``
+    and ``SouthDictionary``) are interchangeable, so they share one instance
+    per dictionary type. Stateful dictionaries may change after first use,
+    so each call builds a fresh instance from their current state.
+    """
+    if dictionary is None or _is_stateless(dictionary):
+        key = (kind, type(dictionary))
+        instance = _by_type.get(key)
+        if instance is None:
+            with _lock:
+                instance = _by_type.get(key)
+                if instance is None:
+                    instance = _by_type[key] = factory(dictionary)
+        return instance
+
+    return factory(dictionary)
+
+
+def _new_transformer(dictionary: Optional[DictionaryInterface]) -> NumberTransformer:
+    return NumberTransformer(dictionary, cache_size=_result_cache_size)
+
+
+def _new_parser(dictionary: Optional[DictionaryInterface]) -> "WordToNumberParser":
+    # Imported on first use so that number-to-words users never load it.
+    from .word_parser import WordToNumberParser
+
+    return WordToNumberParser(dictionary, cache_size=_parse_cache_size)
+
+
+def get_transformer(
+    dictionary: Optional[DictionaryInterface] = None,
+) -> NumberTransformer:
+    """Return a shared NumberTransformer for the given dictionary.
+
+    The returned instance is shared between callers and threads and must
+    not be mutated. Its triplet table is built on first use. Dictionaries
+    with instance state get a fresh transformer on every call.
+
+    Args:
+        dictionary: Optional custom dictionary. Defaults to the standard
+            Vietnamese dictionary.
+
+    Returns:
+        A NumberTransformer for the dictionary.
+
+    Examples:
+        >>> get_transformer() is get_transformer()
+        True
+    """
+    return _get_instance("transformer", dictionary, _new_transformer)
+
+
+def get_parser(
+    dictionary: Optional[DictionaryInterface] = None,
+) -> "WordToNumberParser":
+    """Return a shared WordToNumberParser for the given dictionary.
+
+    The returned instance is shared between callers and threads and must
+    not be mutated. Dictionaries with instance state get a fresh parser on
+    every call.
+
+    Args:
+        dictionary: Optional custom dictionary. Defaults to the standard
+            Vietnamese dictionary.
+
+    Returns:
+        A WordToNumberParser with its word mappings already built.
+
+    Examples:
+        >>> get_parser() is get_parser()
+        True
+    """
+    return _get_instance("parser", dictionary, _new_parser)
+
+
+def clear_registry() -> None:
+    """Drop every shared instance so the next call builds fresh ones."""
+    with _lock:
+        _by_type.clear()
+
+
+def _shared_instances(kind: Hashable) -> List[Any]:
+    """Return every shared instance of ``kind`` currently in the registry."""
+    with _lock:
+        return [instance for key, instance in _by_type.items() if key[0] == kind]
+
+
+def set_result_cache_size(maxsize: Optional[int]) -> None:
+    """Configure the result cache of every shared NumberTransformer.
+
+    Applies to the transformers already in the registry and to those built
+    later. Each transformer has its own cache, so results for different
+    dictionaries never collide. Previously cached results are dropped.
+
+    Args:
+        maxsize: Maximum number of results cached per transformer; None or 0
+            disables caching.
+
+    Examples:
+        >>> set_result_cache_size(1024)
+        >>> get_transformer().cache_info().maxsize
+        1024
+        >>> set_result_cache_size(None)
+    """
+    global _result_cache_size
+    with _lock:
+        _result_cache_size = maxsize
+    for transformer in _shared_instances("transformer"):
+        transformer.configure_cache(maxsize)
+
+
+def result_cache_info() -> "CacheInfo":
+    """Return result cache statistics summed over the shared transformers.
+
+    Returns:
+        CacheInfo totals; all zero when caching is disabled.
+    """
+    from .cache import CacheInfo
+
+    totals = [0, 0, 0, 0]
+    for transformer in _shared_instances("transformer"):
+        for index, value in enumerate(transformer.cache_info()):
+            totals[index] += value
+    return CacheInfo(*totals)
+
+
+def clear_result_cache() -> None:
+    """Drop the cached results and statistics of every shared transformer."""
+    for transformer in _shared_instances("transformer"):
+        transformer.cache_clear()
+
+
+def set_parse_cache_size(maxsize: Optional[int]) -> None:
+    """Configure the parse caches of every shared WordToNumberParser.
+
+    Applies to the parsers already in the registry and to those built later.
+    Previously cached entries are dropped.
+
+    Args:
+        maxsize: Maximum number of entries per parse cache; None or 0
+            disables caching.
+    """
+    global _parse_cache_size
+    with _lock:
+        _parse_cache_size = maxsize
+    for parser in _shared_instances("parser"):
+        parser.configure_cache(maxsize)
+
+
+def parse_cache_info() -> Dict[str, "CacheInfo"]:
+    """Return parse cache statistics summed over the shared parsers.
+
+    Returns:
+        Dict with CacheInfo totals for the ``"text"`` and ``"tokens"``
+        caches, as in ``WordToNumberParser.cache_info``.
+    """
+    from .cache import CacheInfo
+
+    totals = {"text": [0, 0, 0, 0], "tokens": [0, 0, 0, 0]}
+    for parser in _shared_instances("parser"):
+        for name, info in parser.cache_info().items():
+            for index, value in enumerate(info):
+                totals[name][index] += value
+    return {name: CacheInfo(*values) for name, values in totals.items()}
+
+
+def clear_parse_cache() -> None:
+    """Drop the cached entries and statistics of every shared parser."""
+    for parser in _shared_instances("parser"):
+        parser.cache_clear()
@@ -0,0 +1,112 @@
+"""Word groups produced one at a time, for ``iter_words`` and ``to_words_into``.
+
+Kept out of ``transformer`` so that converting single values does not load
+it. The groups are either ``str`` values, from the transformer's triplet
+table, or UTF-8 ``bytes`` from its encoded table, so binary streams are
+written without encoding every group.
+"""
+
+import io
+from typing import IO, Any, Callable, Iterator, Tuple, Union
+
+from .transformer import GROUP_POWERS, NumberTransformer
+
+Resolved = Tuple[bool, Union[int, str], str]
+
+
+def iter_word_groups(
+    transformer: NumberTransformer, resolved: Resolved, encoded: bool
+) -> Iterator[Any]:
+    """Yield the non-empty word groups of a resolved number.
+
+    Args:
+        transformer: The transformer whose words are used.
+        resolved: The output of ``transformer.resolve_digits``.
+        encoded: Yield UTF-8 ``bytes`` instead of ``str``.
+
+    Returns:
+        Iterator over the word groups, in reading order.
+    """
+    compiled = transformer.compiled
+    table: Tuple[Tuple[Any, ...], Tuple[Any, ...]]
+    get_exponent: Callable[[int], Any]
+    zero: Any = compiled.zero_word
+    minus: Any = compiled.minus_word
+    fraction_word: Any = compiled.fraction_word
+    if encoded:
+        table = transformer.encoded_triplet_table()
+        get_exponent = transformer._encoded_exponent
+        zero = zero.encode("utf-8")
+        minus = minus.encode("utf-8")
+        fraction_word = fraction_word.encode("utf-8")
+    else:
+        table = transformer.triplet_table()
+        get_exponent = transformer.get_exponent
+
+    is_negative, integer_part, fraction = resolved
+
+    if is_negative:
+        yield minus
+    yield from _iter_integer_groups(
+        transformer, integer_part, table, get_exponent, zero
+    )
+
+    significant = fraction.lstrip("0")
+    if significant:
+        yield fraction_word
+        for _ in range(len(fraction) - len(significant)):
+            yield zero
+        yield from _iter_integer_groups(
+            transformer, significant, table, get_exponent, zero
+        )
+
+
+def write_words(
+    transformer: NumberTransformer,
+    resolved: Resolved,
+    stream: Union[IO[str], IO[bytes]],
+) -> None:
+    """Write the word groups of a resolved number into a text or binary stream.
+
+    Binary streams (``io.RawIOBase`` and ``io.BufferedIOBase``) receive
+    UTF-8 bytes; anything else receives ``str`` values.
+    """
+    encoded = isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+    separator: Any = transformer.compiled.separator_word
+    if encoded:
+        separator = separator.encode("utf-8")
+    write: Callable[[Any], Any] = stream.write
+    groups = iter_word_groups(transformer, resolved, encoded)
+
+    for group in groups:
+        write(group)
+        break
+    for group in groups:
+        write(separator)
+        write(group)
+
+
+def _iter_integer_groups(
+    transformer: NumberTransformer,
+    number: Union[int, str],
+    table: Tuple[Tuple[Any, ...], Tuple[Any, ...]],
+    get_exponent: Callable[[int], Any],
+    zero: Any,
+) -> Iterator[Any]:
+    """Yield the non-empty word groups of a non-negative integer."""
+    triplets = transformer.number_to_triplets(number)
+    if not triplets:
+        yield zero
+        return
+
+    last = len(triplets) - 1
+    group = get_exponent(GROUP_POWERS) if last >= GROUP_POWERS else None
+    for pos, triplet in enumerate(triplets):
+        power = last - pos
+        if triplet > 0:
+            yield table[pos == 0][triplet]
+            exponent = get_exponent(power % GROUP_POWERS)
+            if exponent:
+                yield exponent
+        if power and not power % GROUP_POWERS:
+            yield group
@@ -1,9 +1,46 @@
-from typing import Union, List, Tuple, Optional
-
+import sys
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    Union,
+    List,
+    Tuple,
+    Optional,
+)
+
+from . import instrumentation
 from .interfaces import DictionaryInterface
 from ..dictionaries.base import Dictionary
+from ..dictionaries.compiled import compile_dictionary
 from ..exceptions import InvalidNumberError
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+    from .cache import CacheInfo, LRUCache
+    from .columnar import WordsColumn
+    from .currency import Currency
+
+Number = Union[int, float, str, "Decimal"]
+
+# Magnitude words are memoized up to this power; larger ones are rebuilt.
+EXPONENT_MEMO_LIMIT = 64
+
+# Numbers with more triplets are read in groups of this many triplets, each
+# followed by the magnitude word of 1000 ** GROUP_POWERS ("tỷ tỷ"), instead
+# of repeating a growing chain of "tỷ" after every triplet. Output size then
+# grows linearly with the number of digits.
+GROUP_POWERS = 6
+
+# Integers below this bound are split into triplets with a plain loop.
+SMALL_TRIPLETS_BOUND = 1000**16
+
 
 class NumberTransformer:
     """Main class for converting numbers to Vietnamese words"""
@@ -12,14 +49,19 @@ class NumberTransformer:
         self,
         dictionary: Optional[DictionaryInterface] = None,
         decimal_part: Optional[int] = None,
+        cache_size: Optional[int] = None,
     ):
         """Initialize the NumberTransformer.
 
         Args:
             dictionary: Custom dictionary implementation for number words.
-                Defaults to the standard Vietnamese dictionary.
+                Defaults to the standard Vietnamese dictionary. It is compiled
+                into an immutable snapshot (``self.compiled``) when the
+                transformer is created.
             decimal_part: Number of decimal places to format. If None, uses
                 the natural decimal representation.
+            cache_size: Maximum number of ``to_words``/``to_currency`` results
+                kept in an LRU cache. If None or 0, results are not cached.
 
         Examples:
             >>> transformer = NumberTransformer()
@@ -27,7 +69,62 @@ class NumberTransformer:
             'một trăm hai mươi ba'
         """
         self.dictionary = dictionary or Dictionary()
+        self.compiled = compile_dictionary(self.dictionary)
         self.decimal_part = decimal_part
+        # Triplet renderings filled in on first use, indexed [is_first][triplet].
+        self._rendered: Tuple[List[Optional[str]], List[Optional[str]]] = (
+            [None] * 1000,
+            [None] * 1000,
+        )
+        self._triplet_table: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]] = None
+        self._encoded_table: Optional[Tuple[Tuple[bytes, ...], Tuple[bytes, ...]]] = (
+            None
+        )
+        self._exponents: Dict[int, str] = dict(enumerate(self.compiled.exponents))
+        self._encoded_exponents: Dict[int, bytes] = {}
+        self._cache: Optional["LRUCache"] = None
+        self.configure_cache(cache_size)
+
+    def configure_cache(self, cache_size: Optional[int]) -> None:
+        """Enable, resize or disable the result cache.
+
+        Any previously cached results and statistics are dropped.
+
+        Args:
+            cache_size: Maximum number of cached results; None or 0 disables
+                the cache.
+        """
+        if not cache_size:
+            self._cache = None
+            return
+        # Imported here so that uncached transformers never load it.
+        from .cache import LRUCache
+
+        self._cache = LRUCache(cache_size)
+
+    def cache_info(self) -> "CacheInfo":
+        """Return hit/miss statistics of the result cache.
+
+        Returns:
+            CacheInfo with hits, misses, maxsize and currsize; all zero when
+            the cache is disabled.
+
+        Examples:
+            >>> transformer = NumberTransformer(cache_size=128)
+            >>> _ = transformer.to_words(5), transformer.to_words(5)
+            >>> transformer.cache_info()
+            CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+        """
+        if self._cache is None:
+            from .cache import CacheInfo
+
+            return CacheInfo(0, 0, 0, 0)
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Drop every cached result and reset the statistics."""
+        if self._cache is not None:
+            self._cache.clear()
 
     def collapse_words(self, words: List[str]) -> str:
         """Collapse a list of words into a single string using separator.
@@ -43,55 +140,102 @@ class NumberTransformer:
             >>> transformer.collapse_words(['một', '', 'hai'])
             'một hai'
         """
-        separator = self.dictionary.separator()
+        separator = self.compiled.separator_word
         words = [word for word in words if word]
         return separator.join(words)
 
-    def resolve_number(self, number: Union[int, float, str]) -> Tuple[bool, int, int]:
-        """Parse and resolve a number into its components.
+    def resolve_digits(self, number: Number) -> Tuple[bool, Union[int, str], str]:
+        """Resolve a number exactly into its sign, integer part and fraction digits.
+
+        Integers are used as-is, strings are parsed digit by digit and
+        ``Decimal`` values are formatted exactly; only floats go through their
+        shortest ``repr``. The fraction keeps its leading zeros and, when
+        ``decimal_part`` is None, drops its trailing zeros. Integer inputs keep
+        an ``int`` integer part; every other input keeps its integer digits as
+        a string, so arbitrarily long values never go through ``int()``.
 
         Args:
-            number: The number to resolve (can be int, float, or string).
+            number: The number to resolve (int, float, string or Decimal).
 
         Returns:
             Tuple containing:
                 - is_negative: Whether the number is negative.
-                - integer_part: The integer portion of the number.
-                - decimal_part: The decimal portion as an integer.
+                - integer_part: The integer portion, as an int or digit string.
+                - fraction: The fraction digits as a string (may be empty).
 
         Raises:
             InvalidNumberError: If the input is not a valid numeric value.
 
         Examples:
             >>> transformer = NumberTransformer()
-            >>> transformer.resolve_number(123.45)
-            (False, 123, 45)
-            >>> transformer.resolve_number(-5)
-            (True, 5, 0)
+            >>> transformer.resolve_digits(-1.05)
+            (True, '1', '05')
+            >>> transformer.resolve_digits("12345678901234567890.10")
+            (False, '12345678901234567890', '1')
         """
+        if isinstance(number, int) and not isinstance(number, bool):
+            return number < 0, abs(number), ""
+
+        if isinstance(number, float):
+            if number != number or number in (float("inf"), float("-inf")):
+                raise InvalidNumberError(f"Number arg ({number}) must be numeric!")
+            if self.decimal_part is None:
+                text = repr(number)
+                if "e" in text:
+                    text = format(_decimal().Decimal(text), "f")
+            else:
+                text = f"{number:.{self.decimal_part}f}"
+        elif isinstance(number, str):
+            text = number
+        elif _is_decimal(number):
+            text = _decimal_text(number)
+        else:
+            raise InvalidNumberError(f"Number arg ({number}) must be numeric!")
+
+        is_negative = text.startswith("-")
+        unsigned = text[1:] if is_negative else text
+        integer_digits, _, fraction = unsigned.partition(".")
+
         if (
-            not isinstance(number, (int, float, str))
-            or not str(number).replace("-", "").replace(".", "").isdigit()
+            not (integer_digits or fraction)
+            or not text.isascii()
+            or not (integer_digits.isdigit() or not integer_digits)
+            or not (fraction.isdigit() or not fraction)
         ):
             raise InvalidNumberError(f"Number arg ({number}) must be numeric!")
 
-        if self.decimal_part is None:
-            number = float(number)
-            number = str(number)
-        else:
-            number = f"{float(number):.{self.decimal_part}f}"
+        if self.decimal_part is not None and not isinstance(number, float):
+            text = format(_decimal().Decimal(text), f".{self.decimal_part}f")
+            integer_digits, _, fraction = text.lstrip("-").partition(".")
+        elif self.decimal_part is None:
+            fraction = fraction.rstrip("0")
 
-        is_negative = number.startswith("-")
+        return is_negative, integer_digits or "0", fraction
 
-        if "." in number:
-            parts = number.split(".", 1)
-            integer_part = int(parts[0].lstrip("-"))
-            decimal_part = int(parts[1])
-        else:
-            integer_part = int(number.lstrip("-"))
-            decimal_part = 0
+    def resolve_number(self, number: Number) -> Tuple[bool, int, int]:
+        """Parse and resolve a number into its components.
 
-        return is_negative, integer_part, decimal_part
+        Args:
+            number: The number to resolve (int, float, string or Decimal).
+
+        Returns:
+            Tuple containing:
+                - is_negative: Whether the number is negative.
+                - integer_part: The integer portion of the number.
+                - decimal_part: The decimal portion as an integer.
+
+        Raises:
+            InvalidNumberError: If the input is not a valid numeric value.
+
+        Examples:
+            >>> transformer = NumberTransformer()
+            >>> transformer.resolve_number(123.45)
+            (False, 123, 45)
+            >>> transformer.resolve_number(-5)
+            (True, 5, 0)
+        """
+        is_negative, integer_part, fraction = self.resolve_digits(number)
+        return is_negative, int(integer_part), int(fraction or "0")
 
     def split_triplet(self, triplet: int) -> tuple:
         """Split a three-digit number into hundreds, tens, and units.
@@ -134,84 +278,348 @@ class NumberTransformer:
             >>> transformer.get_triplet_unit(1, 3)
             'mốt'
         """
+        compiled = self.compiled
         if 1 <= ten <= 5 and unit == 5:
-            return self.dictionary.special_triplet_unit_five()
+            return compiled.unit_five_word
 
         if ten >= 2:
             if unit == 1:
-                return self.dictionary.special_triplet_unit_one()
+                return compiled.unit_one_word
             if unit == 4:
-                return self.dictionary.special_triplet_unit_four()
+                return compiled.unit_four_word
 
-        return self.dictionary.get_triplet_unit(unit)
+        return compiled.units[unit]
 
-    def triplet_to_words(self, triplet: int, is_first: bool, exponent: int) -> str:
-        """Convert a three-digit triplet to Vietnamese words.
+    def render_triplet(self, triplet: int, is_first: bool) -> str:
+        """Render a three-digit triplet without its magnitude word.
+
+        This is the uncached rendering used to compile the triplet table;
+        prefer ``triplet_to_words`` which reads from that table.
 
         Args:
             triplet: A three-digit number (0-999).
             is_first: Whether this is the first (leftmost) triplet.
-            exponent: The power of 1000 for this triplet (0=ones, 1=thousands, etc.).
 
         Returns:
-            Vietnamese words representing the triplet with magnitude.
+            Vietnamese words representing the triplet.
 
         Examples:
             >>> transformer = NumberTransformer()
-            >>> transformer.triplet_to_words(234, True, 0)
-            'hai trăm ba mươi bốn'
-            >>> transformer.triplet_to_words(5, False, 1)
-            'năm nghìn'
+            >>> transformer.render_triplet(5, False)
+            'không trăm linh năm'
         """
+        compiled = self.compiled
         hundred, ten, unit = self.split_triplet(triplet)
         words = []
 
         if hundred > 0 or not is_first:
-            words.append(self.dictionary.get_triplet_hundred(hundred))
+            words.append(compiled.hundreds[hundred])
 
             if ten == 0 and unit > 0:
-                words.append(self.dictionary.triplet_ten_separator())
+                words.append(compiled.ten_separator_word)
 
         if ten > 0:
-            words.append(self.dictionary.get_triplet_ten(ten))
+            words.append(compiled.tens[ten])
 
         if unit > 0:
             words.append(self.get_triplet_unit(unit, ten))
 
-        words.append(self.dictionary.get_exponent(exponent))
+        return self.collapse_words(words)
+
+    def triplet_words(self, triplet: int, is_first: bool) -> str:
+        """Return the rendering of one triplet, memoized per transformer.
+
+        Converting a few numbers only renders the triplets they contain;
+        ``triplet_table`` renders all of them for bulk conversions.
+
+        Examples:
+            >>> NumberTransformer().triplet_words(21, False)
+            'không trăm hai mươi mốt'
+        """
+        words = self._rendered[is_first][triplet]
+        if words is None:
+            words = self._rendered[is_first][triplet] = self.render_triplet(
+                triplet, is_first
+            )
+        return words
+
+    def triplet_table(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Return the compiled renderings of every triplet 0-999.
+
+        The table is built once per transformer from its dictionary, on
+        first use, and indexed as ``table[is_first][triplet]``.
+
+        Returns:
+            Tuple of (non-leading renderings, leading renderings), each
+            holding 1000 strings.
+
+        Examples:
+            >>> transformer = NumberTransformer()
+            >>> table = transformer.triplet_table()
+            >>> table[True][21], table[False][21]
+            ('hai mươi mốt', 'không trăm hai mươi mốt')
+        """
+        if self._triplet_table is None:
+            self._triplet_table = (
+                tuple(self.triplet_words(triplet, False) for triplet in range(1000)),
+                tuple(self.triplet_words(triplet, True) for triplet in range(1000)),
+            )
+        return self._triplet_table
+
+    def encoded_triplet_table(self) -> Tuple[Tuple[bytes, ...], Tuple[bytes, ...]]:
+        """Return ``triplet_table()`` with every entry encoded as UTF-8.
+
+        Returns:
+            Tuple of (non-leading, leading) renderings as bytes.
+        """
+        if self._encoded_table is None:
+            non_leading, leading = self.triplet_table()
+            self._encoded_table = (
+                tuple(words.encode("utf-8") for words in non_leading),
+                tuple(words.encode("utf-8") for words in leading),
+            )
+        return self._encoded_table
+
+    def get_exponent(self, power: int) -> str:
+        """Get the magnitude word for a power of 1000, memoized per transformer.
+
+        Args:
+            power: The exponent (0=ones, 1=thousands, etc.).
 
+        Returns:
+            Vietnamese word for the magnitude.
+
+        Raises:
+            DictionaryError: If the dictionary does not support the power.
+        """
+        exponent = self._exponents.get(power)
+        if exponent is None:
+            exponent = self.compiled.get_exponent(power)
+            if power < EXPONENT_MEMO_LIMIT:
+                self._exponents[power] = exponent
+        return exponent
+
+    def triplet_to_words(self, triplet: int, is_first: bool, exponent: int) -> str:
+        """Convert a three-digit triplet to Vietnamese words.
+
+        Args:
+            triplet: A three-digit number (0-999).
+            is_first: Whether this is the first (leftmost) triplet.
+            exponent: The power of 1000 for this triplet (0=ones, 1=thousands, etc.).
+
+        Returns:
+            Vietnamese words representing the triplet with magnitude.
+
+        Examples:
+            >>> transformer = NumberTransformer()
+            >>> transformer.triplet_to_words(234, True, 0)
+            'hai trăm ba mươi bốn'
+            >>> transformer.triplet_to_words(5, False, 1)
+            'không trăm linh năm nghìn'
+        """
+        words = [
+            self.triplet_words(triplet % 1000, is_first),
+            self.get_exponent(exponent),
+        ]
         return self.collapse_words(words)
 
-    def number_to_triplets(self, number: int) -> List[int]:
+    def integer_word_groups(self, number: Union[int, str]) -> List[str]:
+        """Render a non-negative integer as a list of word groups.
+
+        Each non-zero triplet contributes its rendering (see
+        ``triplet_words``) followed by its magnitude word; empty entries are
+        dropped by ``collapse_words``.
+
+        Args:
+            number: A non-negative integer, or its decimal digits as a string.
+
+        Returns:
+            List of word groups, ready to be passed to ``collapse_words``.
+
+        Examples:
+            >>> transformer = NumberTransformer()
+            >>> transformer.integer_word_groups(1005)
+            ['một', 'nghìn', 'không trăm linh năm', '']
+        """
+        triplets = self.number_to_triplets(number)
+        if not triplets:
+            return [self.compiled.zero_word]
+
+        rendered = self._rendered
+        render = self.triplet_words
+        last = len(triplets) - 1
+        words = []
+
+        if last < GROUP_POWERS:
+            for pos, triplet in enumerate(triplets):
+                if triplet > 0:
+                    words.append(
+                        rendered[pos == 0][triplet] or render(triplet, pos == 0)
+                    )
+                    words.append(self.get_exponent(last - pos))
+            return words
+
+        group = self.get_exponent(GROUP_POWERS)
+        for pos, triplet in enumerate(triplets):
+            power = last - pos
+            if triplet > 0:
+                words.append(rendered[pos == 0][triplet] or render(triplet, pos == 0))
+                words.append(self.get_exponent(power % GROUP_POWERS))
+            if power and not power % GROUP_POWERS:
+                words.append(group)
+
+        return words
+
+    def fraction_word_groups(self, digits: str) -> List[str]:
+        """Render the digits after the decimal point as a list of word groups.
+
+        Leading zeros are read one by one, the remaining digits as an integer.
+
+        Args:
+            digits: The fraction digits, e.g. ``"05"`` for ``1.05``.
+
+        Returns:
+            List of word groups; empty when every digit is zero.
+
+        Examples:
+            >>> transformer = NumberTransformer()
+            >>> transformer.fraction_word_groups("05")
+            ['không', 'năm', '']
+        """
+        significant = digits.lstrip("0")
+        if not significant:
+            return []
+
+        words = [self.compiled.zero_word] * (len(digits) - len(significant))
+        words.extend(self.integer_word_groups(significant))
+        return words
+
+    def number_to_triplets(self, number: Union[int, str]) -> List[int]:
         """Convert a number into a list of three-digit triplets.
 
+        Digit strings are sliced directly. Large integers are split by divide
+        and conquer on powers ``1000 ** (2 ** k)``, which keeps numbers with
+        thousands of digits well below the quadratic cost of peeling off one
+        triplet at a time.
+
         Args:
-            number: A non-negative integer.
+            number: A non-negative integer, or its decimal digits as a string.
 
         Returns:
-            List of three-digit numbers representing triplets from right to left.
+            List of three-digit numbers representing triplets from left to right,
+            without leading zero triplets.
 
         Examples:
             >>> transformer = NumberTransformer()
             >>> transformer.number_to_triplets(1234567)
             [1, 234, 567]
+            >>> transformer.number_to_triplets("0001234")
+            [1, 234]
         """
-        triplets: List[int] = []
+        if isinstance(number, str):
+            digits = number.lstrip("0")
+            head = len(digits) % 3 or 3
+            triplets = [int(digits[:head])] if digits else []
+            triplets.extend(
+                int(digits[pos : pos + 3]) for pos in range(head, len(digits), 3)
+            )
+            return triplets
+
+        if number < SMALL_TRIPLETS_BOUND:
+            return _small_triplets(number, 0)
+
+        # powers[k] == 1000 ** (2 ** k), up to the first one whose square
+        # exceeds the number.
+        powers = [1000]
+        while powers[-1] * powers[-1] <= number:
+            powers.append(powers[-1] * powers[-1])
+
+        triplets = []
+
+        def split(value: int, level: int, width: int) -> None:
+            # Emit the triplets of value < powers[level] ** 2, zero-padded to
+            # ``width`` triplets (0 means no padding).
+            if level < 4:
+                triplets.extend(_small_triplets(value, width))
+                return
+            high, low = divmod(value, powers[level])
+            if high or width:
+                split(high, level - 1, width and width // 2)
+                split(low, level - 1, 1 << level)
+            else:
+                split(low, level - 1, 0)
+
+        split(number, len(powers) - 1, 0)
+        return triplets
 
-        while number > 0:
-            triplets.insert(0, number % 1000)
-            number = number // 1000
+    def int_to_words(self, number: int) -> str:
+        """Convert an integer to Vietnamese words without type dispatch.
 
-        return triplets
+        Fast path for callers that already know their input is an ``int``;
+        no validation or float/string round-trip is performed.
 
-    def to_words(self, number: Union[int, float, str]) -> str:
+        Args:
+            number: The integer to convert.
+
+        Returns:
+            Vietnamese words representation of the number.
+
+        Examples:
+            >>> transformer = NumberTransformer()
+            >>> transformer.int_to_words(-21)
+            'âm hai mươi mốt'
+        """
+        recorder = instrumentation.recorder
+        if recorder is not None:
+            words = recorder.call(
+                "transformer.render_triplets", self._int_word_groups, number
+            )
+            return recorder.call(
+                "transformer.collapse_words", self.collapse_words, words
+            )
+
+        if number < 0:
+            words = [self.compiled.minus_word]
+            words.extend(self.integer_word_groups(-number))
+            return self.collapse_words(words)
+        return self.collapse_words(self.integer_word_groups(number))
+
+    def to_words_column(self, numbers: Iterable[Number]) -> "WordsColumn":
+        """Render a batch into one UTF-8 buffer plus offsets.
+
+        Integers are written straight from pre-encoded byte tables without
+        creating a ``str`` per row; other inputs go through ``to_words``.
+        This keeps peak memory close to the size of the encoded output.
+
+        Args:
+            numbers: Any iterable of numbers (int, float, string or Decimal).
+
+        Returns:
+            A WordsColumn holding the words of every number, in input order.
+
+        Raises:
+            InvalidNumberError: If an input is not a valid number.
+
+        Examples:
+            >>> transformer = NumberTransformer()
+            >>> column = transformer.to_words_column([21, -1005, 1.5])
+            >>> column.tolist()
+            ['hai mươi mốt', 'âm một nghìn không trăm linh năm', 'một phẩy năm']
+        """
+        # Imported here so that plain conversions never load it.
+        from .columnar import render_column
+
+        return render_column(self, numbers)
+
+    def to_words(self, number: Number) -> str:
         """Convert a number to Vietnamese words.
 
-        Handles integers, floats, and negative numbers. Decimal parts are
-        read digit by digit after "phẩy" (point).
+        Handles integers, floats, strings, ``Decimal`` values and negative
+        numbers. Decimal parts are read after "phẩy" (point); leading zeros
+        of the fraction are read one by one.
 
         Args:
-            number: The number to convert (int, float, or string).
+            number: The number to convert (int, float, string or Decimal).
 
         Returns:
             Vietnamese words representation of the number.
@@ -228,38 +636,161 @@ class NumberTransformer:
             >>> transformer.to_words(1.5)
             'một phẩy năm'
         """
-        is_negative, integer_part, decimal_part = self.resolve_number(number)
-        words = []
+        cache = self._cache
+
+        if type(number) is int:
+            if cache is None:
+                return self.int_to_words(number)
+            return _cached(
+                cache, (number, self.decimal_part, None), self.int_to_words, number
+            )
+
+        recorder = instrumentation.recorder
+        if recorder is None:
+            resolved = self.resolve_digits(number)
+        else:
+            resolved = recorder.call(
+                "transformer.resolve_number", self.resolve_digits, number
+            )
 
-        if is_negative:
-            words.append(self.dictionary.minus())
+        if cache is None:
+            return self.words_from_digits(resolved)
+        return _cached(
+            cache, (resolved, self.decimal_part, None), self.words_from_digits, resolved
+        )
 
-        if integer_part == 0:
-            words.append(self.dictionary.zero())
+    def words_from_digits(self, resolved: Tuple[bool, Union[int, str], str]) -> str:
+        """Render the output of ``resolve_digits`` as Vietnamese words.
 
-        triplets = self.number_to_triplets(integer_part)
+        Args:
+            resolved: Tuple of (is_negative, integer_part, fraction).
 
-        for pos, triplet in enumerate(triplets):
-            if triplet > 0:
-                words.append(
-                    self.triplet_to_words(triplet, pos == 0, len(triplets) - pos - 1)
-                )
+        Returns:
+            Vietnamese words representation of the number.
 
-        if decimal_part > 0:
-            words.append(self.dictionary.fraction())
-            words.append(self.to_words(decimal_part))
+        Examples:
+            >>> transformer = NumberTransformer()
+            >>> transformer.words_from_digits((True, 1, "05"))
+            'âm một phẩy không năm'
+        """
+        recorder = instrumentation.recorder
+        if recorder is not None:
+            words = recorder.call(
+                "transformer.render_triplets", self._digit_word_groups, resolved
+            )
+            return recorder.call(
+                "transformer.collapse_words", self.collapse_words, words
+            )
 
-        return self.collapse_words(words)
+        return self.collapse_words(self._digit_word_groups(resolved))
+
+    def iter_words(self, number: Number) -> Iterator[str]:
+        """Lazily yield the word groups of a number.
+
+        Joining the groups with the dictionary separator gives ``to_words``;
+        no intermediate list of groups or result string is built, which
+        suits numbers with a huge number of digits.
+
+        Args:
+            number: The number to convert (int, float, string or Decimal).
+
+        Returns:
+            Iterator over non-empty word groups, in reading order.
+
+        Raises:
+            InvalidNumberError: If the input is not a valid number.
+
+        Examples:
+            >>> transformer = NumberTransformer()
+            >>> list(transformer.iter_words(-1005.5))
+            ['âm', 'một', 'nghìn', 'không trăm linh năm', 'phẩy', 'năm']
+        """
+        # Imported here so that plain conversions never load it.
+        from .streaming import iter_word_groups
+
+        return iter_word_groups(self, self.resolve_digits(number), False)
+
+    def to_words_into(self, number: Number, stream: Union[IO[str], IO[bytes]]) -> None:
+        """Write the words of a number straight into a text or binary stream.
+
+        Word groups are written one by one, so the full result is never
+        built as one string. Binary streams (``io.RawIOBase`` and
+        ``io.BufferedIOBase``, e.g. files opened with ``"wb"``, ``BytesIO``
+        or ``socket.makefile("wb")``) receive UTF-8 bytes from pre-encoded
+        tables; anything else is written ``str`` values. Invalid inputs are
+        rejected before anything is written.
+
+        Args:
+            number: The number to convert (int, float, string or Decimal).
+            stream: Writable text or binary stream.
+
+        Raises:
+            InvalidNumberError: If the input is not a valid number.
+
+        Examples:
+            >>> import io
+            >>> transformer = NumberTransformer()
+            >>> out = io.BytesIO()
+            >>> transformer.to_words_into(21, out)
+            >>> out.getvalue().decode("utf-8")
+            'hai mươi mốt'
+        """
+        resolved = self.resolve_digits(number)
+
+        # Imported here so that plain conversions never load it.
+        from .streaming import write_words
+
+        write_words(self, resolved, stream)
+
+    def _encoded_exponent(self, power: int) -> bytes:
+        """Return ``get_exponent(power)`` encoded as UTF-8, memoized."""
+        exponent = self._encoded_exponents.get(power)
+        if exponent is None:
+            exponent = self.get_exponent(power).encode("utf-8")
+            if power < EXPONENT_MEMO_LIMIT:
+                self._encoded_exponents[power] = exponent
+        return exponent
+
+    def _int_word_groups(self, number: int) -> List[str]:
+        """Return the word groups of an integer, including the minus word."""
+        if number < 0:
+            words = [self.compiled.minus_word]
+            words.extend(self.integer_word_groups(-number))
+            return words
+        return self.integer_word_groups(number)
+
+    def _digit_word_groups(
+        self, resolved: Tuple[bool, Union[int, str], str]
+    ) -> List[str]:
+        """Return the word groups of the output of ``resolve_digits``."""
+        is_negative, integer_part, fraction = resolved
+        words = []
+
+        if is_negative:
+            words.append(self.compiled.minus_word)
+
+        words.extend(self.integer_word_groups(integer_part))
+
+        fraction_words = self.fraction_word_groups(fraction)
+        if fraction_words:
+            words.append(self.compiled.fraction_word)
+            words.extend(fraction_words)
+
+        return words
 
     def to_currency(
-        self, number: Union[int, float, str], unit: Union[str, List[str]] = "đồng"
+        self, number: Number, unit: Union[str, List[str], "Currency"] = "đồng"
     ) -> str:
         """Convert a number to Vietnamese currency words.
 
+        With a minor unit, the fraction is read as minor units, rounded half
+        up to the currency's number of decimals (two for a list of units).
+
         Args:
-            number: The amount to convert (int, float, or string).
-            unit: Currency unit(s). Can be a single string or list of
-                [main_unit, decimal_unit] for decimal amounts.
+            number: The amount to convert (int, float, string or Decimal).
+            unit: Currency unit(s). Can be a single string, a list of
+                [main_unit, decimal_unit] for decimal amounts, or a
+                registered ``Currency``.
 
         Returns:
             Vietnamese words representation of the currency amount.
@@ -273,22 +804,115 @@ class NumberTransformer:
             'một nghìn hai trăm ba mươi bốn đồng'
             >>> transformer.to_currency(1.50, ["đô la", "xu"])
             'một đô la năm mươi xu'
+            >>> from vn_numberwords.core.currency import get_currency
+            >>> transformer.to_currency("12.05", get_currency("EUR"))
+            'mười hai euro năm xu'
         """
+        cache = self._cache
+        if cache is None:
+            return self._currency_words((number, unit))
+
+        key = (
+            number if type(number) is int else self.resolve_digits(number),
+            self.decimal_part,
+            unit if isinstance(unit, (str, tuple)) else tuple(unit),
+        )
+        return _cached(cache, key, self._currency_words, (number, unit))
+
+    def _currency_words(
+        self, args: Tuple[Number, Union[str, List[str], "Currency"]]
+    ) -> str:
+        number, unit = args
+        decimals = 2
         if isinstance(unit, str):
             unit = [unit]
+        elif isinstance(unit, tuple):
+            # Currency is a tuple; the registry is only loaded when one is used.
+            from .currency import Currency, currency_units
 
-        is_negative, integer_part, decimal_part = self.resolve_number(number)
+            if isinstance(unit, Currency):
+                decimals = unit.decimals
+                unit = currency_units(unit)
 
-        if decimal_part == 0 or len(unit) < 2:
-            words = [self.to_words(number), unit[0]]
+        recorder = instrumentation.recorder
+        if recorder is None:
+            is_negative, integer_part, fraction = self.resolve_digits(number)
+        else:
+            is_negative, integer_part, fraction = recorder.call(
+                "transformer.resolve_number", self.resolve_digits, number
+            )
+
+        if not fraction.strip("0") or len(unit) < 2:
+            if type(number) is int:
+                words = [self.int_to_words(number), unit[0]]
+            else:
+                words = [
+                    self.words_from_digits((is_negative, integer_part, fraction)),
+                    unit[0],
+                ]
         else:
             main_unit, decimal_unit = unit[0], unit[1]
+            major, minor = _minor_units(int(integer_part), fraction, decimals)
             words = []
             if is_negative:
-                words.append(self.dictionary.minus())
-            words.append(self.to_words(integer_part))
+                words.append(self.compiled.minus_word)
+            words.append(self.int_to_words(major))
             words.append(main_unit)
-            words.append(self.to_words(decimal_part))
-            words.append(decimal_unit)
+            if minor:
+                words.append(self.int_to_words(minor))
+                words.append(decimal_unit)
 
         return self.collapse_words(words)
+
+
+def _decimal() -> Any:
+    """Return the ``decimal`` module, imported on first use (it is slow to load)."""
+    import decimal
+
+    return decimal
+
+
+def _is_decimal(value: Any) -> bool:
+    # A Decimal instance can only exist once ``decimal`` has been imported.
+    decimal = sys.modules.get("decimal")
+    return decimal is not None and isinstance(value, decimal.Decimal)
+
+
+def _decimal_text(value: Any) -> str:
+    """Format a Decimal in plain notation, rejecting NaN and infinities."""
+    if not value.is_finite():
+        raise InvalidNumberError(f"Number arg ({value}) must be numeric!")
+    return format(value, "f")
+
+
+def _cached(
+    cache: "LRUCache", key: Hashable, convert: Callable[[Any], str], arg: Any
+) -> str:
+    """Return ``convert(arg)``, memoized in ``cache`` under ``key``."""
+    words = cache.get(key)
+    if words is None:
+        words = convert(arg)
+        cache.put(key, words)
+    return words
+
+
+def _minor_units(integer: int, fraction: str, decimals: int) -> Tuple[int, int]:
+    """Split an amount into major and minor units, rounding half up."""
+    minor = int(fraction[:decimals].ljust(decimals, "0") or "0")
+    if fraction[decimals : decimals + 1] >= "5":
+        minor += 1
+        if minor == 10**decimals:
+            integer, minor = integer + 1, 0
+    return integer, minor
+
+
+def _small_triplets(number: int, width: int) -> List[int]:
+    """Split a small non-negative integer into triplets, left-padded to ``width``."""
+    triplets = []
+    while number > 0:
+        number, triplet = divmod(number, 1000)
+        triplets.append(triplet)
+    if len(triplets) < width:
+        triplets.extend([0] * (width - len(triplets)))
+    triplets.reverse()
+    return triplets
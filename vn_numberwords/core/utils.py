@@ -1,29 +1,61 @@
-from typing import Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Union
 
+if TYPE_CHECKING:
+    from decimal import Decimal
 
-def parse_vietnamese_number(number_str: str) -> Union[int, float]:
+# Upper bound on distinct values remembered while deduplicating one batch.
+BATCH_MEMO_SIZE = 65536
+
+
+def vietnamese_number_digits(number_str: str) -> str:
+    """Rewrite a Vietnamese-formatted number as a plain ``"-1234.5"`` digit string.
+
+    Dots group thousands, and a comma starts the fraction ("1.234,5"). Without
+    a comma, a last dot group that is not three digits long starts the
+    fraction ("1.5"). Only the comma form is validated here; callers parse
+    the result with ``int``, ``float`` or ``Decimal``, which reject the rest.
+
+    Raises:
+        ValueError: If the integer part before a comma is not digits grouped
+            by three.
+
+    Examples:
+        >>> vietnamese_number_digits("1.234,5"), vietnamese_number_digits("1.5")
+        ('1234.5', '1.5')
+    """
+    if "," in number_str:
+        integer_str, _, fraction = number_str.partition(",")
+        unsigned = integer_str[1:] if integer_str[:1] in ("+", "-") else integer_str
+        groups = unsigned.split(".")
+        if (
+            not all(group.isascii() and group.isdigit() for group in groups)
+            or (len(groups) > 1 and len(groups[0]) > 3)
+            or any(len(group) != 3 for group in groups[1:])
+            or not (fraction.isascii() and fraction.isdigit())
+        ):
+            raise ValueError(number_str)
+        return f"{integer_str.replace('.', '')}.{fraction}"
+
+    parts = number_str.split(".")
+    if len(parts) == 1 or (len(parts[-1]) == 3 and parts[-1].isdigit()):
+        return number_str.replace(".", "")
+    return f"{''.join(parts[:-1])}.{parts[-1]}"
+
+
+def parse_vietnamese_number(number_str: str) -> Union[int, float, "Decimal"]:
     if not isinstance(number_str, str):
         raise ValueError("Input must be a string")
 
     try:
-        dot_count = number_str.count(".")
-
-        if dot_count == 0:
-            return int(number_str)
-        elif dot_count == 1:
-            parts = number_str.split(".")
-            if len(parts[1]) == 3 and parts[1].isdigit():
-                return int(number_str.replace(".", ""))
-            else:
-                return float(number_str)
-        else:
-            parts = number_str.split(".")
-            if len(parts[-1]) != 3 or not parts[-1].isdigit():
-                integer_part = ".".join(parts[:-1]).replace(".", "")
-                decimal_part = parts[-1]
-                return float(f"{integer_part}.{decimal_part}")
-            else:
-                return int(number_str.replace(".", ""))
+        digits = vietnamese_number_digits(number_str)
+        if "," in number_str:
+            # A Decimal keeps every digit of amounts too long for a float.
+            from decimal import Decimal
+
+            return Decimal(digits)
+        if "." in digits:
+            return float(digits)
+        return int(digits)
     except ValueError:
         raise ValueError(f"Invalid number format: {number_str}")
 
@@ -44,3 +76,27 @@ def format_number_with_dots(number: Union[int, float, str]) -> str:
             return f"{integer_part:,}".replace(",", ".")
     else:
         return f"{number:,}".replace(",", ".")
+
+
+def convert_deduplicated(
+    convert: Callable[[Any], Any], items: Iterable[Any], typed: bool = True
+) -> Iterator[Any]:
+    """Yield ``convert(item)`` for each item, reusing results of repeated items.
+
+    When ``typed`` is true, values of different types are kept apart so that
+    ``1``, ``1.0`` and ``True`` never share a result.
+    """
+    memo: Dict[Any, Any] = {}
+
+    for item in items:
+        key = (type(item), item) if typed else item
+        try:
+            result = memo[key]
+        except KeyError:
+            result = convert(item)
+            if len(memo) < BATCH_MEMO_SIZE:
+                memo[key] = result
+        except TypeError:
+            # Unhashable input such as a list of words.
+            result = convert(item)
+        yield result
@@ -1,58 +1,282 @@
-from typing import Union, List, Optional
-import re
-
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    NamedTuple,
+    Union,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from . import instrumentation
+from .cache import CacheInfo, LRUCache
+from .currency import Amount, Currency, unit_matcher
+from .folding import fold, is_unaccented, normalize
+from .fuzzy import SymmetricDeleteIndex
 from .interfaces import DictionaryInterface
 from ..dictionaries.base import Dictionary
+from ..exceptions import InvalidWordsError
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+
+# Token kinds used by the single-pass accumulator.
+UNIT = 0
+TEN = 1
+HUNDRED = 2
+MAGNITUDE = 3
+SEPARATOR = 4
+
+# Value of "tỷ"; a pair of them ("tỷ tỷ") ends a group of 18 digits.
+BILLION = 10**9
+
+# Words negating the phrase they start.
+MINUS_WORDS = frozenset(("âm", "am"))
+
+
+# Slang aliases, matched only as written: their folded forms and the words a
+# typo away from them are common words ("tôi" and "tỏi", "cũ" and "củ").
+SLANG_WORDS = frozenset(("tỏi", "củ", "chai", "cành", "lít", "lốp", "xị"))
+
+
+def _with_folded(words: Iterable[str]) -> FrozenSet[str]:
+    """Return ``words`` together with the folded forms of those not in SLANG_WORDS."""
+    words = frozenset(words)
+    return words.union(fold(word) for word in words if word not in SLANG_WORDS)
+
+
+def _with_folded_keys(mapping: Dict[str, int]) -> Dict[str, int]:
+    """Return ``mapping`` with every key's folded form added."""
+    folded = dict(mapping)
+    for word, value in mapping.items():
+        folded.setdefault(fold(word), value)
+    return folded
+
+
+class ParseResult(NamedTuple):
+    """The value of a fuzzy parse and the corrections it needed.
+
+    Attributes:
+        value: The parsed value.
+        corrections: ``(word, correction)`` pairs of lowercased words, in text
+            order; empty when every word was spelled correctly.
+    """
+
+    value: Union[int, float]
+    corrections: Tuple[Tuple[str, str], ...]
+
+
+class NumberAccumulator:
+    """Left-to-right accumulator turning classified tokens into a value.
+
+    Each token is consumed in O(1) amortized time: unit digits are buffered,
+    "mười"/"mươi" and "trăm" fold them into the current segment, and magnitude
+    words close the segment into a group. A magnitude absorbs the smaller
+    groups before it ("một nghìn hai trăm tỷ" is 1200 tỷ), and a magnitude
+    directly following another one stacks on it ("nghìn tỷ", "tỷ tỷ").
+
+    Numbers of more than 18 digits are read in groups of 18 digits, each
+    followed by "tỷ tỷ": every second "tỷ" of a run scales everything read
+    before the run by 10**18 ("hai tỷ tỷ ba tỷ tỷ" is (2 * 10**18 + 3) tỷ tỷ).
+    """
+
+    __slots__ = ("groups", "total", "segment", "digits", "has_count", "billions")
+
+    def __init__(self) -> None:
+        # Stack of [value, place] groups; place is the value of the group's
+        # lowest digit and does not increase towards the top of the stack.
+        self.groups: List[List[int]] = []
+        self.total = 0
+        self.segment = 0
+        self.digits: Optional[int] = None
+        self.has_count = False
+        # Length of the run of "tỷ" ending at the last token.
+        self.billions = 0
+
+    def feed(self, kind: int, value: int) -> None:
+        """Consume one classified token."""
+        if kind == UNIT:
+            digits = self.digits
+            self.digits = value if digits is None else digits * 10 + value
+            self.has_count = True
+        elif kind == TEN or kind == HUNDRED:
+            digits = self.digits
+            self.segment += (1 if digits is None else digits) * value
+            self.digits = None
+            self.has_count = True
+        elif kind == MAGNITUDE:
+            self._close_group(value)
+        elif kind == SEPARATOR:
+            if self.digits is not None:
+                self.segment += self.digits
+                self.digits = None
+
+    def _close_group(self, magnitude: int) -> None:
+        groups = self.groups
+        stacked = not self.has_count and bool(groups)
+        if magnitude == BILLION:
+            self.billions = self.billions + 1 if stacked else 1
+        else:
+            self.billions = 0
+
+        if self.has_count:
+            count = self.segment + (self.digits or 0)
+        else:
+            # A bare leading magnitude ("nghìn") counts as one.
+            count = 0 if stacked else 1
+
+        place = magnitude
+        lowest_place = 0
+        while groups and groups[-1][1] < magnitude:
+            value, group_place = groups.pop()
+            self.total -= value
+            count += value
+            if not lowest_place:
+                lowest_place = group_place
+
+        if stacked:
+            if lowest_place:
+                # "nghìn tỷ": the absorbed groups are scaled as a whole.
+                place = lowest_place * magnitude
+            else:
+                # "tỷ tỷ": scale the previous group in place.
+                top = groups.pop()
+                self.total += top[0] * (magnitude - 1)
+                top[0] *= magnitude
+                top[1] *= magnitude
+                if groups and not self.billions % 2:
+                    # End of an 18-digit group: the groups before it are the
+                    # high part of the number, merged into one.
+                    high = (self.total - top[0]) * magnitude * magnitude
+                    groups[:] = [[high, top[1]]]
+                    self.total = high + top[0]
+                groups.append(top)
+                count = 0
+
+        if count or not stacked:
+            groups.append([count * magnitude, place])
+            self.total += count * magnitude
+
+        self.segment = 0
+        self.digits = None
+        self.has_count = False
+
+    def value(self) -> int:
+        """Return the value of everything consumed so far."""
+        return self.total + self.segment + (self.digits or 0)
 
 
 class WordToNumberParser:
-    """Parser for converting Vietnamese words to numbers - Based on word2number approach"""
-
-    def __init__(self, dictionary: Optional[DictionaryInterface] = None):
+    """Parser for converting Vietnamese words to numbers.
+
+    Based on the word2number approach.
+    """
+
+    def __init__(
+        self,
+        dictionary: Optional[DictionaryInterface] = None,
+        cache_size: Optional[int] = None,
+    ):
+        """Initialize the parser.
+
+        Args:
+            dictionary: Optional custom dictionary for Vietnamese variants.
+            cache_size: Maximum number of entries in each parse cache: one
+                maps raw text to its token tuple, the other maps token tuples
+                to values. If None or 0, nothing is cached.
+        """
         self.dictionary = dictionary or Dictionary()
         self._build_mappings()
-
-    def _build_mappings(self):
-        """Build mappings from words to numbers and keywords"""
+        self._text_cache: Optional[LRUCache] = None
+        self._token_cache: Optional[LRUCache] = None
+        self._fuzzy_index: Optional[SymmetricDeleteIndex] = None
+        self.configure_cache(cache_size)
+
+    def configure_cache(self, cache_size: Optional[int]) -> None:
+        """Enable, resize or disable the parse caches.
+
+        Any previously cached entries and statistics are dropped.
+
+        Args:
+            cache_size: Maximum number of entries per cache; None or 0
+                disables caching.
+        """
+        if cache_size:
+            self._text_cache = LRUCache(cache_size)
+            self._token_cache = LRUCache(cache_size)
+        else:
+            self._text_cache = self._token_cache = None
+
+    def cache_info(self) -> Dict[str, CacheInfo]:
+        """Return hit/miss statistics of the parse caches.
+
+        Returns:
+            Dict with a CacheInfo for the ``"text"`` cache (raw text to
+            tokens, skipping normalization) and the ``"tokens"`` cache
+            (tokens to value, skipping parsing); all zero when disabled.
+
+        Examples:
+            >>> parser = WordToNumberParser(cache_size=128)
+            >>> parser.parse_words("một trăm"), parser.parse_words("một trăm")
+            (100, 100)
+            >>> parser.cache_info()["text"]
+            CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+        """
+        if self._text_cache is None or self._token_cache is None:
+            disabled = CacheInfo(0, 0, 0, 0)
+            return {"text": disabled, "tokens": disabled}
+        return {"text": self._text_cache.info(), "tokens": self._token_cache.info()}
+
+    def cache_clear(self) -> None:
+        """Drop every cached entry and reset the statistics."""
+        if self._text_cache is not None and self._token_cache is not None:
+            self._text_cache.clear()
+            self._token_cache.clear()
+
+    def _build_mappings(self) -> None:
+        """Build mappings from words to numbers and keywords.
+
+        Every table holds the accented words and their folded forms (see
+        ``folding.fold``), so unaccented input such as "mot tram linh nam"
+        or "nghin ty" is recognized without hand-written aliases. Words are
+        looked up as written, so a folded form only matches words without
+        diacritics: "từ" is not read as "tư". Slang aliases (``SLANG_WORDS``)
+        have no folded form.
+        """
         # Units mapping (0-9)
-        self.units_map = {
-            "không": 0,
-            "một": 1,
-            "mốt": 1,
-            "hai": 2,
-            "ba": 3,
-            "bốn": 4,
-            "tư": 4,
-            "năm": 5,
-            "lăm": 5,
-            "nhăm": 5,
-            "sáu": 6,
-            "bảy": 7,
-            "tám": 8,
-            "chín": 9,
-            # Non-accented versions
-            "khong": 0,
-            "mot": 1,
-            "bon": 4,
-            "nam": 5,
-            "lam": 5,
-            "tu": 4,
-            "sau": 6,
-            "bay": 7,
-            "tam": 8,
-            "chin": 9,
-        }
+        self.units_map = _with_folded_keys(
+            {
+                "không": 0,
+                "một": 1,
+                "mốt": 1,
+                "hai": 2,
+                "ba": 3,
+                "bốn": 4,
+                "tư": 4,
+                "năm": 5,
+                "lăm": 5,
+                "nhăm": 5,
+                "sáu": 6,
+                "bảy": 7,
+                "tám": 8,
+                "chín": 9,
+            }
+        )
 
         # Special tens mapping
-        self.tens_special_map = {"mười": 10, "muoi": 10, "mươi": 10}
+        self.tens_special_map = _with_folded_keys({"mười": 10, "mươi": 10})
 
-        # Keyword mappings (including accented versions)
-        self.billion_words = frozenset(("tỷ", "tỏi", "tỉ", "ty"))
-        self.million_words = frozenset(("triệu", "củ", "chai", "trieu"))
-        self.thousand_words = frozenset(("nghìn", "nghàn", "ngàn", "cành", "nghin"))
-        self.hundreds_words = frozenset(("trăm", "lít", "lốp", "xị", "tram"))
-        self.tens_words = frozenset(("mươi", "chục", "muoi"))
-        self.special_words = frozenset(("lẽ", "linh", "lẻ", "le"))
+        # Keyword mappings
+        self.billion_words = _with_folded(("tỷ", "tỏi", "tỉ"))
+        self.million_words = _with_folded(("triệu", "củ", "chai"))
+        self.thousand_words = _with_folded(("nghìn", "nghàn", "ngàn", "cành"))
+        self.hundreds_words = _with_folded(("trăm", "lít", "lốp", "xị"))
+        self.tens_words = _with_folded(("mươi", "chục"))
+        self.special_words = _with_folded(("lẽ", "linh", "lẻ"))
 
         # All multiplier words
         self.multiplier_words = self.billion_words.union(
@@ -63,71 +287,147 @@ class WordToNumberParser:
             self.special_words,
         )
 
-        # All allowed words (including accented versions)
+        # All allowed words
         self.allowed_words = self.multiplier_words.union(
-            set(self.units_map.keys())
-        ).union(set(self.tens_special_map.keys()))
-
-        # Add accented versions to allowed words
-        accented_units = {
-            "không",
-            "một",
-            "mốt",
-            "hai",
-            "ba",
-            "bốn",
-            "tư",
-            "năm",
-            "lăm",
-            "nhăm",
-            "sáu",
-            "bảy",
-            "tám",
-            "chín",
-        }
-        accented_tens = {"mười", "mươi"}
-        accented_hundreds = {"trăm"}
-        accented_thousands = {"nghìn", "nghàn", "ngàn"}
-        accented_millions = {"triệu"}
-        accented_billions = {"tỷ", "tỏi", "tỉ"}
-        accented_special = {"lẽ", "linh", "lẻ"}
-
-        self.allowed_words = self.allowed_words.union(
-            accented_units,
-            accented_tens,
-            accented_hundreds,
-            accented_thousands,
-            accented_millions,
-            accented_billions,
-            accented_special,
+            self.units_map, self.tens_special_map
         )
 
+        # Token classification used by the single-pass parser
+        self.token_kinds: Dict[str, Tuple[int, int]] = {}
+        for word, value in self.units_map.items():
+            self.token_kinds[word] = (UNIT, value)
+        for word in self.tens_words.union(self.tens_special_map):
+            self.token_kinds[word] = (TEN, 10)
+        for word in self.hundreds_words:
+            self.token_kinds[word] = (HUNDRED, 100)
+        for words, magnitude in (
+            (self.thousand_words, 1000),
+            (self.million_words, 1000000),
+            (self.billion_words, 1000000000),
+        ):
+            for word in words:
+                self.token_kinds[word] = (MAGNITUDE, magnitude)
+        for word in self.special_words:
+            self.token_kinds[word] = (SEPARATOR, 0)
+
+        # Token classification of the words as written, without the folded
+        # forms, for accented prose where "nam" or "sau" are other words.
+        folded_forms = {fold(word) for word in self.token_kinds if fold(word) != word}
+        self.written_token_kinds = {
+            word: kind
+            for word, kind in self.token_kinds.items()
+            if word not in folded_forms
+        }
+
     def _normalize_text(self, text: str) -> str:
-        """Normalize Vietnamese text for parsing"""
-        # Remove punctuation but keep Vietnamese diacritics
-        text = re.sub(r"[^\w\s\u00C0-\u1EF9]", " ", text.strip().lower())
-        text = re.sub(r"\s+", " ", text)
-        return text
+        """Lowercase and strip punctuation in one translate pass, keeping diacritics"""
+        return normalize(text)
 
     def _split_words(self, text: str) -> List[str]:
         """Split text into words"""
         words = text.split()
         return [word for word in words if word in self.allowed_words]
 
+    def _tokens(self, text: Union[str, List[str]]) -> Sequence[str]:
+        """Return the normalized allowed words of ``text``, through the text cache."""
+        if isinstance(text, list):
+            return [normalize(word).strip() for word in text]
+
+        cache = self._text_cache
+        if cache is None:
+            return self._normalized_words(text)
+
+        words = cache.get(text)
+        if words is None:
+            words = tuple(self._normalized_words(text))
+            cache.put(text, words)
+        return words
+
+    def _normalized_words(self, text: str) -> List[str]:
+        recorder = instrumentation.recorder
+        if recorder is None:
+            return self._split_words(self._normalize_text(text))
+        normalized = recorder.call("parser.normalize_text", self._normalize_text, text)
+        return recorder.call("parser.split_words", self._split_words, normalized)
+
     def parse_words(self, text: Union[str, List[str]]) -> Union[int, float]:
         """Parse Vietnamese words to number"""
+        return self._value(self._tokens(text))
+
+    def fuzzy_index(self) -> SymmetricDeleteIndex:
+        """Return the typo index over the accented number words but slang.
+
+        The index is built on first use.
+        """
+        if self._fuzzy_index is None:
+            self._fuzzy_index = SymmetricDeleteIndex(
+                self.written_token_kinds.keys() - SLANG_WORDS
+            )
+        return self._fuzzy_index
+
+    def parse_words_fuzzy(self, text: Union[str, List[str]]) -> ParseResult:
+        """Parse Vietnamese words to number, correcting misspelled number words.
+
+        Words that are not number words are replaced by the nearest
+        accented number word within a small edit distance (none for words
+        of up to three characters, one for four, two for longer words) and
+        dropped when there is none. Lookups go through ``fuzzy_index()``,
+        so each costs the same whatever the vocabulary size. Short words
+        are never corrected, so "từ", "cũ" and "con" stay ordinary words.
+
+        Args:
+            text: Vietnamese words as a string or list of strings, e.g.
+                noisy OCR or ASR output.
+
+        Returns:
+            ParseResult with the value and the corrections applied.
+
+        Examples:
+            >>> parser = WordToNumberParser()
+            >>> result = parser.parse_words_fuzzy("hai trăn nghin9")
+            >>> result.value, result.corrections
+            (200000, (('trăn', 'trăm'), ('nghin9', 'nghìn')))
+        """
         if isinstance(text, list):
-            words = text
+            words = [normalize(word).strip() for word in text]
         else:
-            normalized_text = self._normalize_text(text)
-            words = self._split_words(normalized_text)
+            words = self._normalize_text(text).split()
 
+        allowed_words = self.allowed_words
+        tokens: List[str] = []
+        corrections: List[Tuple[str, str]] = []
+
+        for word in words:
+            if word in allowed_words:
+                tokens.append(word)
+                continue
+            correction = self.fuzzy_index().lookup(word)
+            if correction is not None:
+                tokens.append(correction)
+                corrections.append((word, correction))
+
+        return ParseResult(self._value(tokens), tuple(corrections))
+
+    def _value(self, words: Sequence[str]) -> int:
+        """Return the value of ``words``, through the token cache."""
+        cache = self._token_cache
+        if cache is None:
+            return self._parse_words(words)
+
+        key = tuple(words)
+        value = cache.get(key)
+        if value is None:
+            value = self._parse_words(key)
+            cache.put(key, value)
+        return value
+
+    def _parse_words(self, words: Sequence[str]) -> int:
         if not words:
             return 0
 
         # Check for negative
         is_negative = False
-        if words[0] in ["am", "âm"]:
+        if words[0] in MINUS_WORDS:
             is_negative = True
             words = words[1:]
 
@@ -136,380 +436,255 @@ class WordToNumberParser:
             return 0
 
         # Parse the number
-        result = self._parse_large_number_final(words)
-
-        return -result if is_negative else result
-
-    def _parse_large_number(self, words: List[str]) -> int:
-        """Parse large numbers by finding keywords and processing segments"""
-        # Find all keyword positions with their types
-        keyword_positions = []
-
-        for i, word in enumerate(words):
-            if word in self.billion_words:
-                keyword_positions.append((i, "billion"))
-            elif word in self.million_words:
-                keyword_positions.append((i, "million"))
-            elif word in self.thousand_words:
-                keyword_positions.append((i, "thousand"))
-
-        # If no keywords, parse as simple number
-        if not keyword_positions:
-            return self._parse_hundreds(words)
-
-        # Sort by position
-        keyword_positions.sort(key=lambda x: x[0])
-
-        # Process segments based on keyword positions
-        segments = []
-        start = 0
-
-        for pos, keyword_type in keyword_positions:
-            segment = words[start:pos]
-            segments.append((segment, keyword_type))
-            start = pos + 1
-
-        # Add remaining words (only if there are any and no keywords)
-        if start < len(words):
-            remaining_words = words[start:]
-            # Check if remaining words contain any keywords
-            has_keywords = any(
-                word
-                in self.billion_words.union(self.million_words, self.thousand_words)
-                for word in remaining_words
-            )
-            if not has_keywords:
-                segments.append((remaining_words, "units"))
-
-        # Calculate total
-        total = 0
-        for segment_words, segment_type in segments:
-            if segment_words:
-                segment_value = self._parse_hundreds(segment_words)
-                if segment_type == "billion":
-                    total += segment_value * 1000000000
-                elif segment_type == "million":
-                    total += segment_value * 1000000
-                elif segment_type == "thousand":
-                    total += segment_value * 1000
-                else:
-                    total += segment_value
-            # Skip empty segments
-
-        return total
-
-    def _parse_large_number_v2(self, words: List[str]) -> int:
-        """Parse large numbers with correct handling of compound units"""
-        # Find all keyword positions with their types
-        keyword_positions = []
-
-        for i, word in enumerate(words):
-            if word in self.billion_words:
-                keyword_positions.append((i, "billion"))
-            elif word in self.million_words:
-                keyword_positions.append((i, "million"))
-            elif word in self.thousand_words:
-                keyword_positions.append((i, "thousand"))
-
-        # If no keywords, parse as simple number
-        if not keyword_positions:
-            return self._parse_hundreds(words)
-
-        # Sort by position
-        keyword_positions.sort(key=lambda x: x[0])
-
-        # Process segments based on keyword positions
-        segments = []
-        start = 0
-
-        for pos, keyword_type in keyword_positions:
-            segment = words[start:pos]
-            segments.append((segment, keyword_type))
-            start = pos + 1
-
-        # Add remaining words (only if there are any and no keywords)
-        if start < len(words):
-            remaining_words = words[start:]
-            # Check if remaining words contain any keywords
-            has_keywords = any(
-                word
-                in self.billion_words.union(self.million_words, self.thousand_words)
-                for word in remaining_words
-            )
-            if not has_keywords:
-                segments.append((remaining_words, "units"))
-
-        # Calculate total
-        total = 0
-        for segment_words, segment_type in segments:
-            if segment_words:
-                segment_value = self._parse_hundreds(segment_words)
-                if segment_type == "billion":
-                    total += segment_value * 1000000000
-                elif segment_type == "million":
-                    total += segment_value * 1000000
-                elif segment_type == "thousand":
-                    total += segment_value * 1000
-                else:
-                    total += segment_value
-            # Skip empty segments
-
-        return total
-
-    def _parse_large_number_correct(self, words: List[str]) -> int:
-        """Parse large numbers with correct Vietnamese understanding"""
-        # Find all keyword positions with their types
-        keyword_positions = []
-
-        for i, word in enumerate(words):
-            if word in self.billion_words:
-                keyword_positions.append((i, "billion"))
-            elif word in self.million_words:
-                keyword_positions.append((i, "million"))
-            elif word in self.thousand_words:
-                keyword_positions.append((i, "thousand"))
-
-        # If no keywords, parse as simple number
-        if not keyword_positions:
-            return self._parse_hundreds(words)
-
-        # Sort by position
-        keyword_positions.sort(key=lambda x: x[0])
-
-        # Process segments based on keyword positions
-        segments = []
-        start = 0
-
-        for pos, keyword_type in keyword_positions:
-            segment = words[start:pos]
-            segments.append((segment, keyword_type))
-            start = pos + 1
-
-        # Add remaining words (only if there are any and no keywords)
-        if start < len(words):
-            remaining_words = words[start:]
-            # Check if remaining words contain any keywords
-            has_keywords = any(
-                word
-                in self.billion_words.union(self.million_words, self.thousand_words)
-                for word in remaining_words
-            )
-            if not has_keywords:
-                segments.append((remaining_words, "units"))
-
-        # Calculate total
-        total = 0
-        for segment_words, segment_type in segments:
-            if segment_words:
-                segment_value = self._parse_hundreds(segment_words)
-                if segment_type == "billion":
-                    total += segment_value * 1000000000
-                elif segment_type == "million":
-                    total += segment_value * 1000000
-                elif segment_type == "thousand":
-                    total += segment_value * 1000
-                else:
-                    total += segment_value
-            # Skip empty segments
-
-        return total
-
-    def _parse_large_number_final(self, words: List[str]) -> int:
-        """Parse large numbers with correct Vietnamese understanding - Final version"""
-        # Find all keyword positions with their types and multipliers
-        keyword_positions = []
-
-        for i, word in enumerate(words):
-            if word in self.billion_words:
-                keyword_positions.append((i, "billion", 1000000000))
-            elif word in self.million_words:
-                keyword_positions.append((i, "million", 1000000))
-            elif word in self.thousand_words:
-                keyword_positions.append((i, "thousand", 1000))
-
-        # If no keywords, parse as simple number
-        if not keyword_positions:
-            return self._parse_hundreds(words)
-
-        # Sort by position
-        keyword_positions.sort(key=lambda x: x[0])
-
-        # Group consecutive keywords together
-        # For example: "mot tram nghin ty" should group "nghin ty" together
-        grouped_segments = []
-        i = 0
-
-        while i < len(keyword_positions):
-            pos, ktype, multiplier = keyword_positions[i]
-
-            # Check if next keyword is consecutive (empty segment between them)
-            consecutive_multiplier = multiplier
-            j = i + 1
-
-            while j < len(keyword_positions):
-                next_pos, next_ktype, next_mult = keyword_positions[j]
-                # If next keyword is right after current one (no words between)
-                if next_pos == pos + 1:
-                    consecutive_multiplier *= next_mult
-                    pos = next_pos
-                    j += 1
-                else:
-                    break
-
-            # Add the grouped segment
-            if i == 0:
-                segment_start = 0
-            else:
-                segment_start = keyword_positions[i - 1][0] + 1
-
-            segment = words[segment_start : keyword_positions[i][0]]
-            grouped_segments.append((segment, consecutive_multiplier))
-
-            i = j
-
-        # Add remaining words after last keyword
-        if keyword_positions:
-            last_pos = keyword_positions[-1][0]
-            if last_pos + 1 < len(words):
-                remaining = words[last_pos + 1 :]
-                has_keywords = any(
-                    word
-                    in self.billion_words.union(self.million_words, self.thousand_words)
-                    for word in remaining
-                )
-                if not has_keywords:
-                    grouped_segments.append((remaining, 1))
-
-        # Calculate total
-        total = 0
-        for segment_words, multiplier in grouped_segments:
-            if segment_words:
-                segment_value = self._parse_hundreds(segment_words)
-                total += segment_value * multiplier
-
-        return total
-
-    def _parse_hundreds(self, words: List[str]) -> int:
-        """Parse hundreds, tens, and units"""
-        if not words:
-            return 0
-
-        # Check if this segment contains large number keywords
-        if any(
-            word in self.billion_words.union(self.million_words, self.thousand_words)
-            for word in words
-        ):
-            return self._parse_large_number(words)
-
-        # Find keyword positions within hundreds
-        keyword_positions = {}
-
-        for i, word in enumerate(words):
-            if word in self.hundreds_words:
-                keyword_positions["hundreds"] = i
-            elif word in self.tens_words:
-                keyword_positions["tens"] = i
-            elif word in self.tens_special_map:
-                keyword_positions["tens"] = i
-
-        # Handle special case with "lẻ/linh"
-        if any(word in self.special_words for word in words):
-            return self._parse_with_special_words(words)
-
-        # Parse based on keyword positions
-        if "hundreds" in keyword_positions:
-            hundreds_pos = keyword_positions["hundreds"]
-            hundreds_value = (
-                self.units_map.get(words[hundreds_pos - 1], 0)
-                if hundreds_pos > 0
-                else 1
-            )
-            remaining_words = words[hundreds_pos + 1 :]
-            tens_value = self._parse_tens(remaining_words)
-            return hundreds_value * 100 + tens_value
-
-        elif "tens" in keyword_positions:
-            return self._parse_tens(words)
-
+        recorder = instrumentation.recorder
+        if recorder is None:
+            result = self._parse_tokens(words)
         else:
-            # Simple units
-            if len(words) == 1:
-                return self.units_map.get(words[0], 0)
-            else:
-                # Multiple units - treat as individual digits
-                result = 0
-                for word in words:
-                    result = result * 10 + self.units_map.get(word, 0)
-                return result
-
-    def _parse_tens(self, words: List[str]) -> int:
-        """Parse tens and units"""
-        if not words:
-            return 0
-
-        if len(words) == 1:
-            # Check special tens first
-            if words[0] in self.tens_special_map:
-                return self.tens_special_map[words[0]]
-            return self.units_map.get(words[0], 0)
-
-        # Check for "mười" + unit pattern
-        if len(words) == 2 and words[0] in self.tens_special_map:
-            return self.tens_special_map[words[0]] + self.units_map.get(words[1], 0)
-
-        # Find tens keyword
-        tens_pos = None
-        for i, word in enumerate(words):
-            if word in self.tens_words:
-                tens_pos = i
-                break
-
-        if tens_pos is not None:
-            tens_value = (
-                self.units_map.get(words[tens_pos - 1], 1) if tens_pos > 0 else 1
-            )
-            remaining_words = words[tens_pos + 1 :]
-            units_value = (
-                self.units_map.get(remaining_words[0], 0) if remaining_words else 0
-            )
-            return tens_value * 10 + units_value
+            result = recorder.call("parser.parse_segments", self._parse_tokens, words)
 
-        # No tens keyword - treat as individual units
-        result = 0
-        for word in words:
-            result = result * 10 + self.units_map.get(word, 0)
-        return result
+        return -result if is_negative else result
 
-    def _parse_with_special_words(self, words: List[str]) -> int:
-        """Parse numbers with special words like 'lẻ/linh'"""
-        total = 0
-        current_segment: List[str] = []
+    def _parse_tokens(self, words: Sequence[str]) -> int:
+        """Parse number words in a single left-to-right pass"""
+        token_kinds = self.token_kinds
+        accumulator = NumberAccumulator()
+        feed = accumulator.feed
 
         for word in words:
-            if word in self.special_words:
-                if current_segment:
-                    total += self._parse_hundreds(current_segment)
-                    current_segment = []
-            else:
-                current_segment.append(word)
+            token = token_kinds.get(word)
+            if token is not None:
+                feed(token[0], token[1])
 
-        if current_segment:
-            total += self._parse_hundreds(current_segment)
+        return accumulator.value()
 
-        return total
+    def incremental(self) -> "IncrementalParser":
+        """Return a push parser sharing this parser's word tables."""
+        return IncrementalParser(self)
 
     def parse_currency_words(
-        self, text: Union[str, List[str]], currency_unit: str = "đồng"
-    ) -> Union[int, float]:
-        """Parse Vietnamese currency words to number"""
+        self, text: Union[str, List[str]], currency_unit: Union[str, Currency] = "đồng"
+    ) -> Union[int, float, "Decimal"]:
+        """Parse Vietnamese currency words to number.
+
+        A trailing ``currency_unit`` is removed before the words are
+        filtered, so units that are also number words are not read as part
+        of the amount. It is matched as written, or folded in text written
+        without diacritics. Given a ``Currency``, the amount is parsed with
+        ``parse_amount`` and the units of other currencies are rejected.
+
+        Raises:
+            InvalidWordsError: If ``currency_unit`` is a ``Currency`` and the
+                text names a unit of another currency.
+        """
+        if isinstance(currency_unit, Currency):
+            return self.parse_amount(text, currency_unit).value
+
+        unit = tuple(normalize(currency_unit).split())
         if isinstance(text, list):
-            words = text
-        else:
-            normalized_text = self._normalize_text(text)
-            words = self._split_words(normalized_text)
-
-        # Remove currency unit from the end
-        if words and words[-1] == currency_unit:
-            words = words[:-1]
+            normalized = [normalize(word).strip() for word in text]
+            return self._value(self._strip_unit((normalized, unit)))
+
+        cache = self._text_cache
+        if cache is None:
+            return self._value(self._currency_tokens(text, unit))
+
+        key = (text, unit)
+        words = cache.get(key)
+        if words is None:
+            words = tuple(self._currency_tokens(text, unit))
+            cache.put(key, words)
+        return self._value(words)
+
+    def _currency_tokens(self, text: str, unit: Tuple[str, ...]) -> List[str]:
+        recorder = instrumentation.recorder
+        if recorder is None:
+            return self._split_currency_words(
+                (self._normalize_text(text).split(), unit)
+            )
+        normalized = recorder.call("parser.normalize_text", self._normalize_text, text)
+        return recorder.call(
+            "parser.split_words", self._split_currency_words, (normalized.split(), unit)
+        )
 
-        return self.parse_words(words)
+    def _split_currency_words(
+        self, args: Tuple[List[str], Tuple[str, ...]]
+    ) -> List[str]:
+        """Drop the unit words from the end, then keep the allowed words."""
+        return self._allowed(self._strip_unit(args))
+
+    @staticmethod
+    def _strip_unit(args: Tuple[List[str], Tuple[str, ...]]) -> List[str]:
+        """Drop the ``unit`` words from the end of ``words``, if they are there.
+
+        The unit is compared as written, or folded when ``words`` are written
+        without diacritics, so "đông" is not taken for "đồng".
+        """
+        words, unit = args
+        if unit and is_unaccented(words):
+            unit = tuple(fold(token) for token in unit)
+        if unit and tuple(words[-len(unit) :]) == unit:
+            return words[: -len(unit)]
+        return words
+
+    def parse_amount(
+        self, text: Union[str, List[str]], currency: Optional[Currency] = None
+    ) -> Amount:
+        """Parse an amount of money in any registered currency.
+
+        The words are scanned once; at each word the unit trie of
+        ``core.currency`` finds the longest major or minor unit name
+        starting there, so multi-word units ("đô la úc", "nhân dân tệ")
+        are recognized without a pass per currency. Unit names are matched
+        as written, or folded in text written without diacritics ("hai do
+        la"). Words before the major unit give the major amount, words
+        between it and the minor unit the minor amount; anything after the
+        last unit is ignored.
+
+        Args:
+            text: Vietnamese words as a string or list of strings.
+            currency: Only accept the unit names of this currency.
+
+        Returns:
+            Amount with the value in major units and the currency (None if
+            no unit was found, in which case every word counts). The value
+            is an int, or an exact ``Decimal`` when minor units were given.
+
+        Raises:
+            InvalidWordsError: If the minor unit does not belong to the
+                currency of the major unit, as in "hai đồng năm xu", or a
+                unit does not belong to ``currency``.
+
+        Examples:
+            >>> parser = WordToNumberParser()
+            >>> amount = parser.parse_amount("một đô la năm mươi xu")
+            >>> amount.value, amount.currency.code
+            (Decimal('1.50'), 'USD')
+            >>> parser.parse_amount("Hai trăm nghìn VNĐ").value
+            200000
+        """
+        if isinstance(text, list):
+            words = [normalize(word).strip() for word in text]
+        else:
+            words = self._normalize_text(text).split()
+        unaccented = is_unaccented(words)
+
+        match = unit_matcher().match
+        found: Optional[Currency] = None
+        major: Optional[List[str]] = None
+        minor: Optional[List[str]] = None
+        pending: List[str] = []
+        pos = 0
+
+        while pos < len(words):
+            unit = match(words, pos, unaccented)
+            if unit is None:
+                pending.append(words[pos])
+                pos += 1
+                continue
+
+            if currency is not None and currency not in unit.currencies:
+                raise InvalidWordsError(
+                    f"{' '.join(words[pos : unit.end])!r} is not a unit of "
+                    f"{currency.code}"
+                )
+            if not unit.is_minor:
+                if major is None and minor is None:
+                    major, pending = pending, []
+                    found = currency or unit.currencies[0]
+            elif minor is None:
+                minor, pending = pending, []
+                if found is None:
+                    found = currency or unit.currencies[0]
+                elif found not in unit.currencies:
+                    raise InvalidWordsError(
+                        f"{' '.join(words[pos : unit.end])!r} is not a minor "
+                        f"unit of {found.code}"
+                    )
+            pos = unit.end
+
+        if found is None:
+            return Amount(self._value(self._allowed(pending)), None)
+
+        value = self._value(self._allowed(major or []))
+        if not minor:
+            return Amount(value, found)
+
+        from decimal import Decimal
+
+        cents = Decimal(self._value(self._allowed(minor))).scaleb(-found.decimals)
+        return Amount(value + cents, found)
+
+    def _allowed(self, words: List[str]) -> List[str]:
+        allowed_words = self.allowed_words
+        return [word for word in words if word in allowed_words]
+
+
+class IncrementalParser:
+    """Push parser consuming one word at a time, e.g. from live ASR output.
+
+    Each ``feed`` updates the value in O(1) amortized time instead of
+    re-parsing the whole phrase, using the word tables of a
+    ``WordToNumberParser``. Feeding the number words of a phrase one by one
+    gives the same value as ``parse_words`` on the list of those words.
+
+    Args:
+        parser: Parser whose word tables are used; a default one is created
+            if omitted.
+
+    Examples:
+        >>> incremental = IncrementalParser()
+        >>> [incremental.feed(word) for word in "hai trăm nghìn đồng".split()]
+        [(2, True), (200, True), (200000, True), (200000, False)]
+        >>> incremental.finish()
+        200000
+    """
+
+    __slots__ = ("token_kinds", "_accumulator", "_negative", "_started")
+
+    def __init__(self, parser: Optional[WordToNumberParser] = None):
+        self.token_kinds = (parser or WordToNumberParser()).token_kinds
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every word fed so far and start a new phrase."""
+        self._accumulator = NumberAccumulator()
+        self._negative = False
+        self._started = False
+
+    @property
+    def value(self) -> int:
+        """The value of the words fed so far."""
+        value = self._accumulator.value()
+        return -value if self._negative else value
+
+    def feed(self, token: str) -> Tuple[int, bool]:
+        """Consume one word.
+
+        Args:
+            token: A single word; case, punctuation and surrounding
+                whitespace are ignored, and diacritics may be left out.
+
+        Returns:
+            Tuple of (current value, can_continue). ``can_continue`` is False
+            when the token is not a number word: the phrase ended before it,
+            the token is not consumed and the state is left unchanged.
+        """
+        word = normalize(token).strip()
+        kind = self.token_kinds.get(word)
+
+        if kind is not None:
+            self._accumulator.feed(kind[0], kind[1])
+            self._started = True
+            return self.value, True
+
+        if not self._started and not self._negative and word in MINUS_WORDS:
+            self._negative = True
+            return 0, True
+
+        return self.value, False
+
+    def finish(self) -> int:
+        """Return the final value and reset the parser for the next phrase."""
+        value = self.value
+        self.reset()
+        return value
@@ -1,4 +1,5 @@
 from .base import Dictionary
 from .south import SouthDictionary
+from .compiled import CompiledDictionary, compile_dictionary
 
-__all__ = ["Dictionary", "SouthDictionary"]
+__all__ = ["Dictionary", "SouthDictionary", "CompiledDictionary", "compile_dictionary"]
@@ -155,6 +155,9 @@ class Dictionary(DictionaryInterface):
     def get_exponent(self, power: int) -> str:
         """Get the word for a power of 1000 (magnitude).
 
+        Powers beyond ``EXPONENTS`` are generated by stacking "tỷ": every
+        three powers add one "tỷ" (10**18 is "tỷ tỷ", 10**21 "nghìn tỷ tỷ").
+
         Args:
             power: The exponent (0=ones, 1=thousands, 2=millions, etc.).
 
@@ -162,10 +165,18 @@ class Dictionary(DictionaryInterface):
             Vietnamese word for the magnitude.
 
         Raises:
-            DictionaryError: If power is not supported in Vietnamese dictionary.
+            DictionaryError: If power is negative, or the dictionary has no
+                "tỷ" entry to stack.
         """
-        if not (0 <= power < len(self.EXPONENTS)):
+        if 0 <= power < len(self.EXPONENTS):
+            return self.EXPONENTS[power]
+        if power < 0 or len(self.EXPONENTS) <= 3:
             raise DictionaryError(
                 f"Power arg ({power}) not exist in vietnamese dictionary!"
             )
-        return self.EXPONENTS[power]
+
+        billions, rest = divmod(power, 3)
+        words = [self.EXPONENTS[3]] * billions
+        if self.EXPONENTS[rest]:
+            words.insert(0, self.EXPONENTS[rest])
+        return self.separator().join(words)
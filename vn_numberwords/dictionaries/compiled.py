@@ -0,0 +1,169 @@
+from typing import Any, List, Tuple
+
+from ..core.interfaces import DictionaryInterface
+from ..exceptions import DictionaryError
+
+# Number of powers of 1000 resolved when a dictionary is compiled; larger
+# powers are delegated to the source dictionary.
+COMPILED_EXPONENTS = 16
+
+
+class CompiledDictionary(DictionaryInterface):
+    """Immutable snapshot of a dictionary's words in slots and tuples.
+
+    Every word of the source dictionary is resolved once, so readers such as
+    ``NumberTransformer`` can index plain tuples instead of calling a method
+    (and running its range checks) per word. The snapshot is itself a
+    ``DictionaryInterface`` and can be used wherever a dictionary is accepted.
+
+    Attributes:
+        units: Words for the unit digits 0-9.
+        tens: Words for the tens digits 0-9 ("" for 0).
+        hundreds: Words for the hundreds digits 0-9, including "trăm".
+        exponents: Words for the first powers of 1000.
+        source: The dictionary the snapshot was compiled from.
+    """
+
+    __slots__ = (
+        "zero_word",
+        "minus_word",
+        "separator_word",
+        "fraction_word",
+        "ten_separator_word",
+        "unit_one_word",
+        "unit_four_word",
+        "unit_five_word",
+        "units",
+        "tens",
+        "hundreds",
+        "exponents",
+        "source",
+        "__weakref__",
+    )
+
+    zero_word: str
+    minus_word: str
+    separator_word: str
+    fraction_word: str
+    ten_separator_word: str
+    unit_one_word: str
+    unit_four_word: str
+    unit_five_word: str
+    units: Tuple[str, ...]
+    tens: Tuple[str, ...]
+    hundreds: Tuple[str, ...]
+    exponents: Tuple[str, ...]
+    source: DictionaryInterface
+
+    def __init__(self, source: DictionaryInterface):
+        """Compile ``source`` into a snapshot.
+
+        Args:
+            source: Any dictionary implementation, including subclasses of
+                ``Dictionary`` that override its methods.
+
+        Raises:
+            DictionaryError: If the source rejects a digit in 0-9.
+        """
+        exponents: List[str] = []
+        try:
+            while len(exponents) < COMPILED_EXPONENTS:
+                exponents.append(source.get_exponent(len(exponents)))
+        except DictionaryError:
+            pass
+
+        values = {
+            "zero_word": source.zero(),
+            "minus_word": source.minus(),
+            "separator_word": source.separator(),
+            "fraction_word": source.fraction(),
+            "ten_separator_word": source.triplet_ten_separator(),
+            "unit_one_word": source.special_triplet_unit_one(),
+            "unit_four_word": source.special_triplet_unit_four(),
+            "unit_five_word": source.special_triplet_unit_five(),
+            "units": tuple(source.get_triplet_unit(digit) for digit in range(10)),
+            "tens": tuple(source.get_triplet_ten(digit) for digit in range(10)),
+            "hundreds": tuple(source.get_triplet_hundred(digit) for digit in range(10)),
+            "exponents": tuple(exponents),
+            "source": source,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.source!r})"
+
+    def zero(self) -> str:
+        return self.zero_word
+
+    def minus(self) -> str:
+        return self.minus_word
+
+    def separator(self) -> str:
+        return self.separator_word
+
+    def fraction(self) -> str:
+        return self.fraction_word
+
+    def special_triplet_unit_one(self) -> str:
+        return self.unit_one_word
+
+    def special_triplet_unit_four(self) -> str:
+        return self.unit_four_word
+
+    def special_triplet_unit_five(self) -> str:
+        return self.unit_five_word
+
+    def triplet_ten_separator(self) -> str:
+        return self.ten_separator_word
+
+    def get_triplet_unit(self, unit: int) -> str:
+        if not (0 <= unit <= 9):
+            raise DictionaryError(f"Unit arg ({unit}) must be in 0-9 range!")
+        return self.units[unit]
+
+    def get_triplet_ten(self, ten: int) -> str:
+        if not (0 <= ten <= 9):
+            raise DictionaryError(f"Ten arg ({ten}) must be in 0-9 range!")
+        return self.tens[ten]
+
+    def get_triplet_hundred(self, hundred: int) -> str:
+        if not (0 <= hundred <= 9):
+            raise DictionaryError(f"Hundred arg ({hundred}) must be in 0-9 range!")
+        return self.hundreds[hundred]
+
+    def get_exponent(self, power: int) -> str:
+        if 0 <= power < len(self.exponents):
+            return self.exponents[power]
+        return self.source.get_exponent(power)
+
+
+def compile_dictionary(dictionary: DictionaryInterface) -> CompiledDictionary:
+    """Return an immutable, tuple-backed snapshot of ``dictionary``.
+
+    Later changes to the source dictionary are not reflected in the snapshot.
+
+    Args:
+        dictionary: The dictionary to compile; compiled dictionaries are
+            returned unchanged.
+
+    Returns:
+        The compiled snapshot.
+
+    Examples:
+        >>> from vn_numberwords import SouthDictionary
+        >>> compiled = compile_dictionary(SouthDictionary())
+        >>> compiled.exponents[:3]
+        ('', 'ngàn', 'triệu')
+        >>> compiled.get_triplet_hundred(4)
+        'bốn trăm'
+    """
+    if isinstance(dictionary, CompiledDictionary):
+        return dictionary
+    return CompiledDictionary(dictionary)
@@ -0,0 +1,129 @@
+"""Spell out the numbers of Vietnamese text, e.g. as a text-to-speech frontend.
+
+Numbers written in Vietnamese format ("1.234.567", "1.234,56", "-5") are
+replaced by their words, and a currency unit written right after a number
+("50.000đ", "1.000 VND") is spelled out with it. Anything that does not look
+like a complete number ("1.2345", "v2", "3.14.15") is left untouched.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from .core.interfaces import DictionaryInterface
+from .core.registry import get_transformer
+from .core.transformer import NumberTransformer
+from .core.utils import parse_vietnamese_number
+
+# Currency units recognized after a number, mapped to their spoken form.
+CURRENCY_UNITS: Dict[str, str] = {
+    "₫": "đồng",
+    "đ": "đồng",
+    "đồng": "đồng",
+    "vnd": "đồng",
+    "vnđ": "đồng",
+}
+
+_NUMBER = re.compile(
+    r"(?<![\w.,])"
+    r"(?P<number>-?(?:\d{1,3}(?:\.\d{3})+|\d+)(?:,\d+)?)"
+    r"(?:\s*(?P<unit>(?i:"
+    + "|".join(sorted(map(re.escape, CURRENCY_UNITS), key=len, reverse=True))
+    + r")))?"
+    r"(?![\w]|[.,]\d)"
+)
+
+
+def _replacer(transformer: NumberTransformer) -> Callable[["re.Match[str]"], str]:
+    def replace(match: "re.Match[str]") -> str:
+        number = parse_vietnamese_number(match.group("number"))
+        unit = match.group("unit")
+        if unit is None:
+            return transformer.to_words(number)
+        return transformer.to_currency(number, CURRENCY_UNITS[unit.lower()])
+
+    return replace
+
+
+def spell_out_numbers(
+    text: str, dictionary: Optional[DictionaryInterface] = None
+) -> str:
+    """Replace every Vietnamese-formatted number in ``text`` with words.
+
+    Args:
+        text: The text to normalize.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        The text with numbers (and the currency units following them)
+        spelled out.
+
+    Examples:
+        >>> spell_out_numbers("Giá 1.250.000đ, giảm 12,5%.")
+        'Giá một triệu hai trăm năm mươi nghìn đồng, giảm mười hai phẩy năm%.'
+    """
+    return _NUMBER.sub(_replacer(get_transformer(dictionary)), text)
+
+
+def _safe_cut(text: str) -> int:
+    """Return the offset before which no number or unit can still grow.
+
+    A number and its unit span at most two whitespace-separated runs. The
+    last run may be incomplete unless the text ends with whitespace, and
+    the run before it may be a number waiting for that unit.
+    """
+    pos = len(text)
+    runs = 1 if text[-1:].isspace() else 2
+    for _ in range(runs):
+        while pos and text[pos - 1].isspace():
+            pos -= 1
+        while pos and not text[pos - 1].isspace():
+            pos -= 1
+    return pos
+
+
+def iter_spell_out_numbers(
+    chunks: Iterable[str], dictionary: Optional[DictionaryInterface] = None
+) -> Iterator[str]:
+    """Lazily spell out the numbers of a stream of text chunks.
+
+    Chunks may split numbers and units anywhere: the unfinished tail of each
+    chunk is held back until the next one arrives. Joining the output gives
+    the same text as ``spell_out_numbers`` on the joined input.
+
+    Args:
+        chunks: Pieces of text in order, e.g. an open text file or
+            ``iter(lambda: f.read(65536), "")``.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        Iterator over normalized pieces of text.
+
+    Examples:
+        >>> "".join(iter_spell_out_numbers(["trả 1.0", "00 VN", "D nhé"]))
+        'trả một nghìn đồng nhé'
+    """
+    replace = _replacer(get_transformer(dictionary))
+    buffer = ""
+
+    for chunk in chunks:
+        buffer += chunk
+        cut = _safe_cut(buffer)
+        pieces = []
+        pos = 0
+
+        for match in _NUMBER.finditer(buffer):
+            if match.end() > cut:
+                cut = min(cut, match.start())
+                break
+            pieces.append(buffer[pos : match.start()])
+            pieces.append(replace(match))
+            pos = match.end()
+
+        if cut > pos:
+            pieces.append(buffer[pos:cut])
+        if pieces:
+            yield "".join(pieces)
+        buffer = buffer[cut:]
+
+    if buffer:
+        yield spell_out_numbers(buffer, dictionary)
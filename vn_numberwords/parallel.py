@@ -0,0 +1,160 @@
+"""Multi-process conversion of large line-oriented files."""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Deque, List, Optional, Tuple, Union
+
+from .core.interfaces import DictionaryInterface
+from .stream import IO_BUFFER_SIZE, convert_lines
+
+# Default number of input bytes handed to a worker at a time.
+CHUNK_SIZE = 1 << 22
+
+PathType = Union[str, "os.PathLike[str]"]
+
+
+def split_file(path: PathType, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Split a file into byte ranges of roughly ``chunk_size`` on line boundaries.
+
+    Args:
+        path: Path of the input file.
+        chunk_size: Target number of bytes per range.
+
+    Returns:
+        List of ``(start, end)`` byte offsets covering the whole file; every
+        range except possibly the last ends right after a newline.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+
+    with open(path, "rb") as f:
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def convert_chunk(
+    path: PathType,
+    start: int,
+    end: int,
+    reverse: bool = False,
+    currency: Optional[str] = None,
+    dictionary: Optional[DictionaryInterface] = None,
+) -> bytes:
+    """Convert the lines in ``path[start:end]`` and return the UTF-8 output.
+
+    This runs inside worker processes; the transformer or parser comes from
+    the per-process registry, so it stays warm across chunks.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+
+    lines = text.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    if not lines:
+        return b""
+
+    results = convert_lines(lines, reverse, currency, dictionary)
+    return ("\n".join(results) + "\n").encode("utf-8")
+
+
+def convert_file(
+    input_path: PathType,
+    output: Union[PathType, IO[bytes]],
+    workers: Optional[int] = None,
+    reverse: bool = False,
+    currency: Optional[str] = None,
+    dictionary: Optional[DictionaryInterface] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """Convert a file with one value per line using a pool of processes.
+
+    The input is split into byte ranges on line boundaries; each range is
+    converted by a ``ProcessPoolExecutor`` worker and the results are written
+    in the original order. At most ``2 * workers`` chunks are in flight, so
+    memory stays bounded regardless of the file size.
+
+    Args:
+        input_path: Path of the input file (UTF-8, one value per line).
+        output: Output path, or a binary stream to write UTF-8 lines to.
+        workers: Number of worker processes. Defaults to ``os.cpu_count()``;
+            ``1`` converts in the current process.
+        reverse: Convert Vietnamese words to numbers instead.
+        currency: Optional currency unit applied to every line.
+        dictionary: Optional custom dictionary; it must be picklable.
+        chunk_size: Target number of input bytes per worker task.
+
+    Raises:
+        InvalidNumberError: If a line is not a valid number.
+
+    Examples:
+        >>> convert_file("amounts.txt", "words.txt", workers=8)  # doctest: +SKIP
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = split_file(input_path, chunk_size)
+
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "wb", buffering=IO_BUFFER_SIZE) as f:
+            _convert_ranges(
+                input_path, ranges, f, workers, reverse, currency, dictionary
+            )
+    else:
+        _convert_ranges(
+            input_path, ranges, output, workers, reverse, currency, dictionary
+        )
+
+
+def _convert_ranges(
+    input_path: PathType,
+    ranges: List[Tuple[int, int]],
+    output: IO[bytes],
+    workers: int,
+    reverse: bool,
+    currency: Optional[str],
+    dictionary: Optional[DictionaryInterface],
+) -> None:
+    if workers <= 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            output.write(
+                convert_chunk(input_path, start, end, reverse, currency, dictionary)
+            )
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque["Future[bytes]"] = deque()
+
+        try:
+            for start, end in ranges:
+                if len(pending) >= 2 * workers:
+                    output.write(pending.popleft().result())
+                pending.append(
+                    executor.submit(
+                        convert_chunk,
+                        input_path,
+                        start,
+                        end,
+                        reverse,
+                        currency,
+                        dictionary,
+                    )
+                )
+
+            while pending:
+                output.write(pending.popleft().result())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
@@ -0,0 +1,195 @@
+"""Find spelled-out Vietnamese numbers in free text.
+
+The scanner walks the text once, word by word, and reports every maximal run
+of number words separated only by whitespace as a ``NumberSpan`` carrying its
+character offsets and value. Punctuation and any other word end a span, so
+"hai trăm nghìn và ba con mèo" yields two spans, 200000 and 3.
+
+Vietnamese number words double as ordinary words ("năm" is also "year",
+"ba" also "father"), so spans are found by vocabulary alone. A span must
+start with a digit or tens word (optionally after "âm"), which keeps lone
+magnitude words such as "trăm" or "triệu" from being read as numbers.
+
+Words are NFC-normalized and lowercased, then matched as written: in prose
+with diacritics, unaccented words are other words ("Việt Nam", "sau ba
+ngày"). Pass ``unaccented=True`` for text written without diacritics, where
+words without any diacritic also match the folded number words.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .core.folding import normalize
+from .core.interfaces import DictionaryInterface
+from .core.registry import get_parser
+from .core.word_parser import MINUS_WORDS, TEN, UNIT, WordToNumberParser
+
+# Letters, with the combining marks of NFD-normalized text.
+_WORD = re.compile(r"(?:[^\W\d_]|[\u0300-\u036f])+")
+
+
+class NumberSpan(NamedTuple):
+    """A spelled-out number found in text.
+
+    Attributes:
+        start: Offset of the first character of the span.
+        end: Offset just past the last character of the span.
+        text: The span as it appears in the text.
+        value: The parsed value.
+    """
+
+    start: int
+    end: int
+    text: str
+    value: int
+
+
+def _scan(
+    parser: WordToNumberParser,
+    token_kinds: Dict[str, Tuple[int, int]],
+    text: str,
+    base: int,
+    final: bool,
+) -> Tuple[List[NumberSpan], int]:
+    """Scan ``text`` and return its complete spans and how much was consumed.
+
+    Unless ``final``, a word touching the end of the text may continue in the
+    next chunk, and so may a span still open there; scanning stops before
+    them and the returned offset tells the caller where to resume.
+    """
+    spans: List[NumberSpan] = []
+    words: List[str] = []
+    span_start = span_end = -1
+    minus: Optional["re.Match[str]"] = None
+    consumed = len(text)
+
+    for match in _WORD.finditer(text):
+        start, end = match.span()
+        if not final and end == len(text):
+            consumed = start
+            break
+
+        word = normalize(match.group())
+        token = token_kinds.get(word)
+
+        if span_start >= 0:
+            if token is not None and text[span_end:start].isspace():
+                words.append(word)
+                span_end = end
+                continue
+            spans.append(_make_span(parser, text, base, span_start, span_end, words))
+            span_start = -1
+
+        if token is not None and token[0] in (UNIT, TEN):
+            if minus is not None and text[minus.end() : start].isspace():
+                span_start = minus.start()
+                words = [normalize(minus.group()), word]
+            else:
+                span_start = start
+                words = [word]
+            span_end = end
+            minus = None
+        elif word in MINUS_WORDS:
+            minus = match
+        else:
+            minus = None
+
+    if span_start >= 0:
+        if final:
+            spans.append(_make_span(parser, text, base, span_start, span_end, words))
+        else:
+            consumed = span_start
+    elif not final and minus is not None:
+        gap = text[minus.end() : consumed]
+        if not gap or gap.isspace():
+            consumed = minus.start()
+
+    return spans, consumed
+
+
+def _make_span(
+    parser: WordToNumberParser,
+    text: str,
+    base: int,
+    start: int,
+    end: int,
+    words: List[str],
+) -> NumberSpan:
+    return NumberSpan(
+        base + start, base + end, text[start:end], int(parser.parse_words(words))
+    )
+
+
+def _token_kinds(
+    parser: WordToNumberParser, unaccented: bool
+) -> Dict[str, Tuple[int, int]]:
+    return parser.token_kinds if unaccented else parser.written_token_kinds
+
+
+def iter_number_spans(
+    chunks: Iterable[str],
+    dictionary: Optional[DictionaryInterface] = None,
+    unaccented: bool = False,
+) -> Iterator[NumberSpan]:
+    """Lazily find the spelled-out numbers in a stream of text chunks.
+
+    Chunks may split words and spans anywhere; offsets are relative to the
+    start of the whole stream. Only the unfinished tail of the text is kept
+    between chunks, so arbitrarily long documents can be scanned.
+
+    Args:
+        chunks: Pieces of text in order, e.g. an open text file (read line
+            by line) or ``iter(lambda: f.read(65536), "")``.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+        unaccented: Also match words without diacritics against the
+            folded number words ("mot tram"), for unaccented text.
+
+    Returns:
+        Iterator over the spans, in text order.
+
+    Examples:
+        >>> spans = iter_number_spans(["tôi có hai tr", "ăm nghìn đồng"])
+        >>> [(span.start, span.end, span.value) for span in spans]
+        [(7, 21, 200000)]
+    """
+    parser = get_parser(dictionary)
+    token_kinds = _token_kinds(parser, unaccented)
+    buffer = ""
+    base = 0
+
+    for chunk in chunks:
+        buffer += chunk
+        spans, consumed = _scan(parser, token_kinds, buffer, base, final=False)
+        yield from spans
+        buffer = buffer[consumed:]
+        base += consumed
+
+    spans, _ = _scan(parser, token_kinds, buffer, base, final=True)
+    yield from spans
+
+
+def find_numbers(
+    text: str,
+    dictionary: Optional[DictionaryInterface] = None,
+    unaccented: bool = False,
+) -> List[NumberSpan]:
+    """Find every spelled-out number in ``text``.
+
+    Args:
+        text: Free text, e.g. an ASR transcript.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+        unaccented: Also match words without diacritics against the
+            folded number words ("mot tram"), for unaccented text.
+
+    Returns:
+        List of spans, in text order.
+
+    Examples:
+        >>> for span in find_numbers("tôi có hai trăm nghìn và ba con mèo"):
+        ...     print(span.start, span.end, repr(span.text), span.value)
+        7 21 'hai trăm nghìn' 200000
+        25 27 'ba' 3
+    """
+    parser = get_parser(dictionary)
+    spans, _ = _scan(parser, _token_kinds(parser, unaccented), text, 0, final=True)
+    return spans
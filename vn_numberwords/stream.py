@@ -0,0 +1,245 @@
+"""Line-oriented streaming conversion shared by the CLI and batch helpers."""
+
+import mmap
+import os
+from typing import IO, Callable, Iterable, Iterator, Optional, Tuple, Union
+
+from .core.interfaces import DictionaryInterface
+from .core.registry import get_parser, get_transformer
+from .core.utils import convert_deduplicated, vietnamese_number_digits
+from .exceptions import InvalidNumberError
+
+# Buffer size used for file and pipe I/O by the streaming helpers.
+IO_BUFFER_SIZE = 1 << 16
+
+# Write buffer used by convert_mapped_file; results are small, so batching
+# them into large writes matters more than for line-by-line piping.
+WRITE_BUFFER_SIZE = 1 << 20
+
+PathType = Union[str, "os.PathLike[str]"]
+
+
+def line_converter(
+    reverse: bool = False,
+    currency: Optional[str] = None,
+    dictionary: Optional[DictionaryInterface] = None,
+) -> Callable[[str], str]:
+    """Build a function converting one stripped input line to one output line.
+
+    Args:
+        reverse: Convert Vietnamese words to numbers instead of numbers to
+            words.
+        currency: Optional currency unit appended to (or expected at the end
+            of) every value.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        A callable mapping an input line to its converted text. Empty lines
+        map to empty lines.
+
+    Examples:
+        >>> convert = line_converter(currency="đồng")
+        >>> convert("1000")
+        'một nghìn đồng'
+    """
+    if reverse:
+        parser = get_parser(dictionary)
+        if currency:
+            unit = currency
+
+            def convert(line: str) -> str:
+                return str(parser.parse_currency_words(line, unit)) if line else ""
+
+        else:
+
+            def convert(line: str) -> str:
+                return str(parser.parse_words(line)) if line else ""
+
+    else:
+        transformer = get_transformer(dictionary)
+        if currency:
+            unit = currency
+
+            def convert(line: str) -> str:
+                return transformer.to_currency(line, unit) if line else ""
+
+        else:
+
+            def convert(line: str) -> str:
+                return transformer.to_words(line) if line else ""
+
+    return convert
+
+
+def convert_lines(
+    lines: Iterable[str],
+    reverse: bool = False,
+    currency: Optional[str] = None,
+    dictionary: Optional[DictionaryInterface] = None,
+) -> Iterator[str]:
+    """Lazily convert an iterable of lines, one result per input line.
+
+    Lines are stripped of surrounding whitespace; results carry no trailing
+    newline. Only the current line and a bounded memo of repeated values are
+    held in memory, so arbitrarily large inputs can be streamed.
+
+    Args:
+        lines: Input lines, e.g. an open text file or ``sys.stdin``.
+        reverse: Convert Vietnamese words to numbers instead.
+        currency: Optional currency unit applied to the whole stream.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        Iterator over converted lines, in input order.
+
+    Raises:
+        InvalidNumberError: If a line is not a valid number.
+
+    Examples:
+        >>> list(convert_lines(["21\\n", "\\n", "5"]))
+        ['hai mươi mốt', '', 'năm']
+        >>> list(convert_lines(["mười một"], reverse=True))
+        ['11']
+    """
+    convert = line_converter(reverse, currency, dictionary)
+    return convert_deduplicated(convert, (line.strip() for line in lines), False)
+
+
+def iter_mapped_fields(
+    data: Union[bytes, mmap.mmap],
+    column: Optional[int] = None,
+    delimiter: bytes = b",",
+) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(line_number, field)`` for every line of a bytes-like buffer.
+
+    Lines are found with ``find`` on the buffer itself, so only the current
+    line is ever copied into a Python object. A final line without a
+    trailing newline is included; ``\\r`` and surrounding spaces are kept
+    for the caller to strip.
+
+    Args:
+        data: The buffer, typically a read-only ``mmap`` of a file.
+        column: Zero-based index of the field to extract from each line, or
+            None for the whole line.
+        delimiter: Field delimiter used when ``column`` is given.
+
+    Returns:
+        Iterator over 1-based line numbers and raw fields.
+
+    Raises:
+        InvalidNumberError: If a line has fewer than ``column + 1`` fields.
+
+    Examples:
+        >>> list(iter_mapped_fields(b"a;1\\nb;2", column=1, delimiter=b";"))
+        [(1, b'1'), (2, b'2')]
+    """
+    size = len(data)
+    find = data.find
+    pos = 0
+    line_number = 0
+
+    while pos < size:
+        end = find(b"\n", pos)
+        if end < 0:
+            end = size
+        line = data[pos:end]
+        pos = end + 1
+        line_number += 1
+
+        if column is None:
+            yield line_number, line
+            continue
+        fields = line.split(delimiter, column + 1)
+        if len(fields) <= column:
+            if not line.strip():
+                yield line_number, b""
+                continue
+            raise InvalidNumberError(
+                f"line {line_number}: no field {column} in {line!r}"
+            )
+        yield line_number, fields[column]
+
+
+def convert_mapped_file(
+    input_path: PathType,
+    output: Union[PathType, IO[bytes]],
+    column: Optional[int] = None,
+    delimiter: str = ",",
+    currency: Optional[str] = None,
+    dictionary: Optional[DictionaryInterface] = None,
+) -> int:
+    """Convert a memory-mapped file of Vietnamese-formatted numbers to words.
+
+    The input is mapped read-only and scanned line by line, so neither the
+    file nor a list of its lines is ever held as Python strings; together
+    with the bounded memo of repeated values this keeps memory flat for
+    files far larger than RAM. Each field ("1.234.567", "1.234,5") is
+    rewritten by ``vietnamese_number_digits`` into an exact digit string,
+    rendered by the shared ``NumberTransformer`` and written as one UTF-8
+    line through a ``WRITE_BUFFER_SIZE`` buffer. Empty fields produce empty
+    lines.
+
+    Args:
+        input_path: Path of the input file (UTF-8).
+        output: Output path, or a binary stream to write UTF-8 lines to.
+        column: Zero-based column to convert in a delimited file, or None
+            when every line holds one number.
+        delimiter: Column delimiter, used when ``column`` is given.
+        currency: Optional currency unit appended to every value.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        The number of lines written.
+
+    Raises:
+        InvalidNumberError: If a field is not a valid number; the message
+            carries its line number.
+
+    Examples:
+        >>> convert_mapped_file("ledger.csv", "words.txt", column=2)  # doctest: +SKIP
+        20000000
+    """
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            return convert_mapped_file(
+                input_path, f, column, delimiter, currency, dictionary
+            )
+
+    transformer = get_transformer(dictionary)
+    render: Callable[[str], str]
+    if currency:
+        unit = currency
+
+        def render(number: str) -> str:
+            return transformer.to_currency(number, unit)
+
+    else:
+        render = transformer.to_words
+
+    def convert(field: bytes) -> bytes:
+        text = field.strip().decode("utf-8")
+        if not text:
+            return b"\n"
+        return (render(vietnamese_number_digits(text)) + "\n").encode("utf-8")
+
+    line_number = 0
+
+    def fields(mapped: mmap.mmap) -> Iterator[bytes]:
+        nonlocal line_number
+        for line_number, field in iter_mapped_fields(
+            mapped, column, delimiter.encode("utf-8")
+        ):
+            yield field
+
+    with open(input_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            write = output.write
+            try:
+                for result in convert_deduplicated(convert, fields(mapped), False):
+                    write(result)
+            except (InvalidNumberError, ValueError) as e:
+                raise InvalidNumberError(f"line {line_number}: {e}") from e
+
+    return line_number
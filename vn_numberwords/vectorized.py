@@ -0,0 +1,132 @@
+"""NumPy-backed conversion of integer arrays to Vietnamese words.
+
+This module is optional and requires NumPy (``pip install vn-numberwords[numpy]``).
+Integer arrays are decomposed into triplets with vectorized ``//`` and ``%`` and
+rendered by gathering from the transformer's precompiled triplet table.
+"""
+
+import threading
+import weakref
+from typing import Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "vn_numberwords.vectorized requires NumPy; "
+        "install it with `pip install vn-numberwords[numpy]`"
+    ) from exc
+
+from .core.interfaces import DictionaryInterface
+from .core.registry import get_transformer
+from .core.transformer import NumberTransformer
+
+__all__ = ["to_words_array"]
+
+_TablePair = Tuple[Any, Any]
+
+_lock = threading.Lock()
+_tables: "weakref.WeakKeyDictionary[NumberTransformer, List[_TablePair]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _exponent_tables(transformer: NumberTransformer, count: int) -> List[_TablePair]:
+    """Return (leading, non-leading) object arrays for the first ``count`` powers.
+
+    Entry ``t`` of the arrays for power ``k`` holds the words for triplet ``t``
+    followed by the magnitude word of ``1000 ** k``; non-leading entries carry
+    the leading separator, so a number is the plain concatenation of its
+    pieces. Entry 0 is empty in both arrays.
+    """
+    with _lock:
+        tables = _tables.setdefault(transformer, [])
+        table = transformer.triplet_table()
+        separator = transformer.compiled.separator_word
+
+        while len(tables) < count:
+            exponent = transformer.get_exponent(len(tables))
+            leading = np.empty(1000, dtype=object)
+            rest = np.empty(1000, dtype=object)
+            leading[0] = rest[0] = ""
+            for triplet in range(1, 1000):
+                leading[triplet] = transformer.collapse_words(
+                    [table[True][triplet], exponent]
+                )
+                rest[triplet] = separator + transformer.collapse_words(
+                    [table[False][triplet], exponent]
+                )
+            tables.append((leading, rest))
+
+        return tables[:count]
+
+
+def _int_array_to_words(transformer: NumberTransformer, array: Any) -> Any:
+    """Render a 1-D integer array; returns an object array of strings."""
+    if array.dtype.kind == "u":
+        negative = np.zeros(array.shape, dtype=bool)
+        magnitude = array.astype(np.uint64)
+    else:
+        signed = array.astype(np.int64)
+        negative = signed < 0
+        # ~x + 1 == -x, computed in uint64 so that the int64 minimum survives.
+        magnitude = np.where(
+            negative,
+            (~signed).astype(np.uint64) + np.uint64(1),
+            signed.astype(np.uint64),
+        )
+
+    compiled = transformer.compiled
+    separator = compiled.separator_word
+    result = np.full(array.shape, "", dtype=object)
+
+    if array.size:
+        largest = int(magnitude.max())
+        count = max(1, (len(str(largest)) + 2) // 3)
+
+        for power, (leading, rest) in reversed(
+            list(enumerate(_exponent_tables(transformer, count)))
+        ):
+            scale = np.uint64(1000**power)
+            triplets = ((magnitude // scale) % np.uint64(1000)).astype(np.intp)
+            is_first = magnitude // scale < np.uint64(1000)
+            result += np.where(is_first, leading[triplets], rest[triplets])
+
+    result = np.where(magnitude == 0, compiled.zero_word, result)
+    return np.where(negative, compiled.minus_word + separator + result, result)
+
+
+def to_words_array(
+    values: Any, dictionary: Optional[DictionaryInterface] = None
+) -> Any:
+    """Convert every element of an array to Vietnamese words.
+
+    Integer arrays are rendered with vectorized triplet decomposition; any
+    other dtype (object, float, string) falls back to ``to_words`` per element.
+
+    Args:
+        values: An ndarray or anything ``numpy.asarray`` accepts.
+        dictionary: Optional custom dictionary for Vietnamese variants.
+
+    Returns:
+        An object ndarray of the same shape holding the Vietnamese words.
+
+    Raises:
+        InvalidNumberError: If an element is not a valid number.
+        DictionaryError: If a magnitude is not supported by the dictionary.
+
+    Examples:
+        >>> to_words_array(np.array([21, -5, 1000])).tolist()
+        ['hai mươi mốt', 'âm năm', 'một nghìn']
+    """
+    transformer = get_transformer(dictionary)
+    array = np.asarray(values)
+
+    if array.dtype.kind in "iu":
+        flat = _int_array_to_words(transformer, array.reshape(-1))
+    else:
+        flat = np.empty(array.size, dtype=object)
+        for index, value in enumerate(array.reshape(-1).tolist()):
+            flat[index] = transformer.to_words(value)
+
+    return flat.reshape(array.shape)